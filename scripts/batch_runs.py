@@ -0,0 +1,102 @@
+"""Shared plumbing for the batch generation scripts.
+
+Each script streams its per-topic records to a JSONL sidecar next to its
+report as topics complete, so progress survives a crash, and skips topics a
+previous run already produced when it is started again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Callable, TextIO
+
+from src.graph.build_graph import CheckpointManager
+
+MAX_CONCURRENT_RUNS = 4
+
+
+def load_completed(progress_path: Path) -> dict[str, dict]:
+    """Return the latest record per topic whose deck still exists on disk."""
+    completed: dict[str, dict] = {}
+    if not progress_path.exists():
+        return completed
+    for line in progress_path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # partial line from an interrupted run
+        pptx_path = record.get("pptx_path")
+        if pptx_path and Path(pptx_path).exists():
+            completed[record["topic"]] = record
+    return completed
+
+
+def split_completed(
+    topics: list[str], progress_path: Path
+) -> tuple[dict[str, dict], list[str]]:
+    """Split unique ``topics`` into already-generated records and pending ones."""
+    # Skip duplicate topics and ones a previous run already produced.
+    topics = list(dict.fromkeys(topics))
+    prior = load_completed(progress_path)
+    completed = {topic: prior[topic] for topic in topics if topic in prior}
+    pending = [topic for topic in topics if topic not in completed]
+    if completed:
+        print(
+            f"Skipping {len(completed)} topic(s) already generated; "
+            f"delete {progress_path} to regenerate them."
+        )
+    return completed, pending
+
+
+async def _run_topics(
+    jobs: list[tuple], run_topic: Callable, progress_fp: TextIO
+) -> list:
+    # Pipeline runs are dominated by model latency; the semaphore keeps the
+    # number of in-flight runs within provider rate limits.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+    done = 0
+
+    async def _run(job: tuple):
+        nonlocal done
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(run_topic, *job)
+            except Exception as exc:
+                # One failing topic must not abort the batch while the other
+                # runs carry on unobserved in their worker threads
+                result = {
+                    "topic": job[0],
+                    "run_id": None,
+                    "pptx_path": None,
+                    "errors": [str(exc)],
+                    "status": "exception",
+                }
+        done += 1
+        records = result if isinstance(result, list) else [result]
+        # Completions resume on the event loop thread, so writes never race.
+        for record in records:
+            progress_fp.write(json.dumps(record) + "\n")
+        progress_fp.flush()
+        last = records[-1]
+        print(
+            f"[{done}/{len(jobs)}] {last.get('status', 'done')} -> {last['pptx_path']}"
+        )
+        return result
+
+    return await asyncio.gather(*(_run(job) for job in jobs))
+
+
+def run_pending(jobs: list[tuple], run_topic: Callable, progress_path: Path) -> list:
+    """Run ``run_topic(*job)`` for every job, appending records to the sidecar.
+
+    ``run_topic`` returns one record or a list of records (one per attempt);
+    the topic is the first item of each job. A job that raises is recorded
+    with ``"status": "exception"``. Results are returned in job order.
+    """
+    # Create the checkpoint schema before any run starts; concurrent runs on
+    # a fresh database would otherwise race to create the same tables.
+    CheckpointManager()
+    with progress_path.open("a", encoding="utf-8") as progress_fp:
+        return asyncio.run(_run_topics(jobs, run_topic, progress_fp))
@@ -4,9 +4,43 @@ import json
 import os
 from pathlib import Path
 
+from scripts.batch_runs import run_pending, split_completed
 from src.graph.build_graph import run_pipeline
 
 
+def _run_topic(topic: str) -> dict:
+    last_errors: list[str] = []
+    status = "failed"
+
+    for attempt in range(1, 3):
+        try:
+            state = run_pipeline(topic, educational_mode=False)
+        except Exception as exc:
+            last_errors = [str(exc)]
+            status = "exception"
+            continue
+        status = "failed"
+        path = state.pptx_path
+        exists = bool(path and Path(path).exists())
+        last_errors = state.errors or []
+
+        if exists:
+            return {
+                "topic": topic,
+                "run_id": state.run_id,
+                "pptx_path": path,
+                "status": "ok",
+            }
+
+    return {
+        "topic": topic,
+        "run_id": None,
+        "pptx_path": None,
+        "status": status,
+        "errors": last_errors,
+    }
+
+
 def main() -> None:
     topics = [
         "Modern Supply Chain Resilience Strategies for Global Operations",
@@ -21,40 +55,16 @@ def main() -> None:
     artifacts_dir = Path("artifacts")
     artifacts_dir.mkdir(exist_ok=True)
 
-    final_results: list[dict] = []
+    report_path = artifacts_dir / "fresh_topic_set_report.json"
+    progress_path = report_path.with_suffix(".jsonl")
 
-    for idx, topic in enumerate(topics, start=1):
-        success_record: dict | None = None
-        last_errors: list[str] = []
+    completed, pending = split_completed(topics, progress_path)
+    new_results = run_pending(
+        [(topic,) for topic in pending], _run_topic, progress_path
+    )
 
-        for attempt in range(1, 3):
-            state = run_pipeline(topic, educational_mode=False)
-            path = state.pptx_path
-            exists = bool(path and Path(path).exists())
-            last_errors = state.errors or []
-
-            if exists:
-                success_record = {
-                    "topic": topic,
-                    "run_id": state.run_id,
-                    "pptx_path": path,
-                    "status": "ok",
-                }
-                break
-
-        if success_record is None:
-            success_record = {
-                "topic": topic,
-                "run_id": None,
-                "pptx_path": None,
-                "status": "failed",
-                "errors": last_errors,
-            }
-
-        final_results.append(success_record)
-        print(
-            f"[{idx}/{len(topics)}] {success_record['status']} -> {success_record['pptx_path']}"
-        )
+    by_topic = {**completed, **{record["topic"]: record for record in new_results}}
+    final_results = [by_topic[topic] for topic in dict.fromkeys(topics)]
 
     report = {
         "provider": "configured in ai_config.properties",
@@ -62,7 +72,6 @@ def main() -> None:
         "results": final_results,
     }
 
-    report_path = artifacts_dir / "fresh_topic_set_report.json"
     report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
     print("REPORT:", report_path)
 
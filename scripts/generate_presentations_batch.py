@@ -2,6 +2,35 @@ from src.graph.build_graph import run_pipeline
 from pathlib import Path
 import json
 
+from scripts.batch_runs import run_pending, split_completed
+
+
+def _run_topic(topic: str, educational_mode: bool) -> dict:
+    try:
+        state = run_pipeline(topic, educational_mode=educational_mode)
+        qa = state.qa_report
+        return {
+            "topic": topic,
+            "run_id": state.run_id,
+            "pptx_path": state.pptx_path,
+            "content_score": qa.content_score if qa else None,
+            "design_score": qa.design_score if qa else None,
+            "coherence_score": qa.coherence_score if qa else None,
+            "errors": state.errors,
+            "status": "ok" if state.pptx_path else "no_artifact",
+        }
+    except Exception as exc:
+        return {
+            "topic": topic,
+            "run_id": None,
+            "pptx_path": None,
+            "content_score": None,
+            "design_score": None,
+            "coherence_score": None,
+            "errors": [str(exc)],
+            "status": "exception",
+        }
+
 
 def main() -> None:
     topics = [
@@ -12,39 +41,25 @@ def main() -> None:
         "AI in Healthcare: Opportunities and Risks",
     ]
 
-    results = []
     artifacts = Path("artifacts")
     artifacts.mkdir(exist_ok=True)
     report_path = artifacts / "generation_batch_report.json"
     print("Using configured model from ai_config.properties...")
 
-    for index, topic in enumerate(topics, start=1):
-        try:
-            state = run_pipeline(topic, educational_mode=(index % 2 == 1))
-            qa = state.qa_report
-            item = {
-                "topic": topic,
-                "run_id": state.run_id,
-                "pptx_path": state.pptx_path,
-                "content_score": qa.content_score if qa else None,
-                "design_score": qa.design_score if qa else None,
-                "coherence_score": qa.coherence_score if qa else None,
-                "errors": state.errors,
-                "status": "ok" if state.pptx_path else "no_artifact",
-            }
-        except Exception as exc:
-            item = {
-                "topic": topic,
-                "run_id": None,
-                "pptx_path": None,
-                "content_score": None,
-                "design_score": None,
-                "coherence_score": None,
-                "errors": [str(exc)],
-                "status": "exception",
-            }
-        results.append(item)
-        print(f"[{index}/{len(topics)}] {item['status']} -> {item['pptx_path']}")
+    progress_path = report_path.with_suffix(".jsonl")
+
+    completed, pending = split_completed(topics, progress_path)
+    # Odd-numbered topics run in educational mode
+    educational = {
+        topic: index % 2 == 1
+        for index, topic in enumerate(dict.fromkeys(topics), start=1)
+    }
+    jobs = [(topic, educational[topic]) for topic in pending]
+
+    new_items = run_pending(jobs, _run_topic, progress_path)
+
+    by_topic = {**completed, **{item["topic"]: item for item in new_items}}
+    results = [by_topic[topic] for topic in dict.fromkeys(topics)]
 
     report_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
 
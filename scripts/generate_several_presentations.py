@@ -2,9 +2,47 @@ from pathlib import Path
 import json
 import os
 
+from scripts.batch_runs import run_pending, split_completed
 from src.graph.build_graph import run_pipeline
 
 
+def _run_topic(topic: str) -> list[dict]:
+    records: list[dict] = []
+    for attempt in range(1, 3):
+        try:
+            state = run_pipeline(topic, educational_mode=False)
+        except Exception as exc:
+            records.append(
+                {
+                    "topic": topic,
+                    "attempt": attempt,
+                    "run_id": None,
+                    "pptx_path": None,
+                    "pptx_exists": False,
+                    "errors": [str(exc)],
+                    "status": "exception",
+                }
+            )
+            continue
+        pptx_path = state.pptx_path
+        pptx_exists = bool(pptx_path and Path(pptx_path).exists())
+
+        records.append(
+            {
+                "topic": topic,
+                "attempt": attempt,
+                "run_id": state.run_id,
+                "pptx_path": pptx_path,
+                "pptx_exists": pptx_exists,
+                "errors": state.errors,
+            }
+        )
+
+        if pptx_exists:
+            break
+    return records
+
+
 def main() -> None:
     topics = [
         "Digital Transformation Roadmap for Mid-Sized Companies",
@@ -18,39 +56,30 @@ def main() -> None:
     artifacts_dir = Path("artifacts")
     artifacts_dir.mkdir(exist_ok=True)
 
-    results: list[dict] = []
-
-    for topic in topics:
-        success = None
-        for attempt in range(1, 3):
-            state = run_pipeline(topic, educational_mode=False)
-            pptx_path = state.pptx_path
-            pptx_exists = bool(pptx_path and Path(pptx_path).exists())
-
-            record = {
-                "topic": topic,
-                "attempt": attempt,
-                "run_id": state.run_id,
-                "pptx_path": pptx_path,
-                "pptx_exists": pptx_exists,
-                "errors": state.errors,
-            }
-            results.append(record)
+    report_path = artifacts_dir / "several_presentations_report.json"
+    progress_path = report_path.with_suffix(".jsonl")
 
-            if pptx_exists:
-                success = record
-                break
+    completed, pending = split_completed(topics, progress_path)
+    new_records = run_pending(
+        [(topic,) for topic in pending], _run_topic, progress_path
+    )
 
-        if success is None:
-            continue
+    # Keep the report in topic order: every attempt for a topic run now, or
+    # the record kept from a previous run
+    by_topic = {
+        **{topic: [record] for topic, record in completed.items()},
+        **dict(zip(pending, new_records)),
+    }
+    results: list[dict] = [
+        record for topic in dict.fromkeys(topics) for record in by_topic[topic]
+    ]
 
     report = {
         "configured_provider": "from ai_config.properties",
-        "success_count": sum(1 for item in results if item["pptx_exists"]),
+        "success_count": sum(1 for item in results if item.get("pptx_exists")),
         "results": results,
     }
 
-    report_path = artifacts_dir / "several_presentations_report.json"
     report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
     print(str(report_path))
 
@@ -75,20 +75,12 @@ except Exception as e:
 # Test 5: Verify syntax
 print("[5/5] Verifying syntax...")
 try:
-    import py_compile
-    import tempfile
-    import os
-
-    # Compile app.py to check syntax
-    temp_file = os.path.join(tempfile.gettempdir(), "app_compiled.pyc")
-    py_compile.compile(str(REPO_ROOT / "src/app.py"), temp_file, doraise=True)
+    # Compile app.py in memory to check syntax
+    source = (REPO_ROOT / "src/app.py").read_bytes()
+    compile(source, "src/app.py", "exec")
     print("      [OK] app.py syntax is valid")
 
-    # Clean up
-    if os.path.exists(temp_file):
-        os.remove(temp_file)
-
-except py_compile.PyCompileError as e:
+except SyntaxError as e:
     print(f"      [FAIL] Syntax error in app.py: {e}")
     sys.exit(1)
 
@@ -6,7 +6,11 @@ Usage:
     python scripts/verify_template_installation.py
 """
 
+import io
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -54,12 +58,27 @@ def verify_files():
         ],
     }
 
+    # Scan each parent directory once instead of stat()-ing every file.
+    parents = {
+        str(Path(file_path.rstrip("/")).parent)
+        for files in required_files.values()
+        for file_path in files
+    }
+    existing = set()
+    for parent in parents:
+        try:
+            with os.scandir(REPO_ROOT / parent) as entries:
+                for entry in entries:
+                    rel = entry.name if parent == "." else f"{parent}/{entry.name}"
+                    existing.add(rel + "/" if entry.is_dir() else rel)
+        except OSError:
+            continue
+
     all_good = True
     for category, files in required_files.items():
         print(f"\n  Checking {category}:")
         for file_path in files:
-            path = REPO_ROOT / file_path
-            if path.exists():
+            if file_path in existing:
                 print(f"    [OK] {file_path}")
             else:
                 print(f"    [MISSING] {file_path}")
@@ -194,6 +213,68 @@ def verify_pipeline_parameter():
         return False
 
 
+CHECKS = [
+    ("File Structure", verify_files),
+    ("Python Imports", verify_imports),
+    ("Templates Available", verify_templates),
+    ("Template Validation", verify_template_validation),
+    ("State Field", verify_state_field),
+    ("Pipeline Parameter", verify_pipeline_parameter),
+]
+
+
+class _ThreadBufferedStdout(io.TextIOBase):
+    """Route writes to a per-thread buffer when one is active.
+
+    ``contextlib.redirect_stdout`` swaps ``sys.stdout`` for every thread, so
+    concurrent checks capture their output through this proxy instead.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def start_capture(self) -> None:
+        self._local.buffer = io.StringIO()
+
+    def stop_capture(self) -> str:
+        buffer = self._local.buffer
+        self._local.buffer = None
+        return buffer.getvalue()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._target).write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+
+def _run_checks() -> dict:
+    """Run the independent checks concurrently, printing output in order."""
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    captured = {}
+
+    def run(check):
+        stdout.start_capture()
+        try:
+            return check()
+        finally:
+            captured[check] = stdout.stop_capture()
+
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+            futures = {name: executor.submit(run, check) for name, check in CHECKS}
+            results = {name: future.result() for name, future in futures.items()}
+    finally:
+        sys.stdout = stdout._target
+
+    for _, check in CHECKS:
+        sys.stdout.write(captured[check])
+    return results
+
+
 def main():
     """Run all verification checks."""
     print("=" * 60)
@@ -201,14 +282,7 @@ def main():
     print("=" * 60)
     print()
 
-    results = {
-        "File Structure": verify_files(),
-        "Python Imports": verify_imports(),
-        "Templates Available": verify_templates(),
-        "Template Validation": verify_template_validation(),
-        "State Field": verify_state_field(),
-        "Pipeline Parameter": verify_pipeline_parameter(),
-    }
+    results = _run_checks()
 
     print()
     print("=" * 60)
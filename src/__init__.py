@@ -2,24 +2,15 @@
 
 import warnings
 
-warnings.filterwarnings(
-    "ignore",
-    message="Core Pydantic V1 functionality isn't compatible with Python 3.14 or greater.",
-    category=UserWarning,
-)
+_IGNORED_WARNINGS = [
+    (
+        "Core Pydantic V1 functionality isn't compatible with Python 3.14 or greater.",
+        UserWarning,
+    ),
+    ("builtin type SwigPyPacked has no __module__ attribute", DeprecationWarning),
+    ("builtin type SwigPyObject has no __module__ attribute", DeprecationWarning),
+    ("builtin type swigvarlink has no __module__ attribute", DeprecationWarning),
+]
 
-warnings.filterwarnings(
-    "ignore",
-    message="builtin type SwigPyPacked has no __module__ attribute",
-    category=DeprecationWarning,
-)
-warnings.filterwarnings(
-    "ignore",
-    message="builtin type SwigPyObject has no __module__ attribute",
-    category=DeprecationWarning,
-)
-warnings.filterwarnings(
-    "ignore",
-    message="builtin type swigvarlink has no __module__ attribute",
-    category=DeprecationWarning,
-)
+for _message, _category in _IGNORED_WARNINGS:
+    warnings.filterwarnings("ignore", message=_message, category=_category)
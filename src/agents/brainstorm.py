@@ -6,90 +6,25 @@ prerequisite knowledge, and Bloom's taxonomy alignment for educational presentat
 
 from __future__ import annotations
 
+import functools
 
 from ..schemas import PresentationOutline, LearningObjective
 from ..state import PipelineState
 from ..models.ai_interface import get_ai_interface
+from ..tools.outline_cache import (
+    ExactOutlineCache,
+    get_exact_outline_cache,
+    get_outline_cache,
+)
 from ..utils import parse_json_with_repair
 
+DEFAULT_PREREQUISITES = (
+    "Basic familiarity with the topic context",
+    "Willingness to engage in guided practice",
+)
 
-def run_brainstorm(state: PipelineState) -> PipelineState:
-    """Generate presentation outline from user input.
-
-    This agent analyzes the user's brief and creates a structured outline.
-    When educational_mode is enabled, it also generates learning objectives
-    and identifies prerequisite knowledge.
-    """
-    if not state.user_input:
-        state.errors.append("No user input provided")
-        return state
-
-    # Use centralized AI interface
-    ai = get_ai_interface()
-
-    if state.educational_mode:
-        # Educational mode: Include learning objectives and pedagogical planning
-        prompt = _get_educational_prompt(state)
-    else:
-        # Standard mode: Business/professional presentations
-        prompt = _get_standard_prompt(state)
-
-    try:
-        response = ai.generate(prompt, agent="brainstorm")
-    except Exception:
-        response = None
-
-    # Parse JSON from response with repair logic
-    result = parse_json_with_repair(response.content) if response else {}
-
-    try:
-        # Parse learning objectives if present
-        if "learning_objectives" in result and result["learning_objectives"]:
-            objectives = [
-                LearningObjective(**obj) for obj in result["learning_objectives"]
-            ]
-            result["learning_objectives"] = objectives
-
-        outline = PresentationOutline(**result)
-    except Exception:
-        # Fall back to simple outline
-        outline = PresentationOutline(
-            topic=state.user_input.strip(),
-            audience="General audience",
-            sections=["Introduction", "Main Points", "Conclusion"],
-        )
-
-    if state.educational_mode:
-        if not outline.prerequisite_knowledge:
-            outline.prerequisite_knowledge = [
-                "Basic familiarity with the topic context",
-                "Willingness to engage in guided practice",
-            ]
-
-        if not outline.learning_objectives:
-            outline.learning_objectives = [
-                LearningObjective(
-                    objective=f"Students will be able to explain the core ideas of {outline.topic}",
-                    bloom_level="understand",
-                    assessment="Short written explanation or verbal check",
-                ),
-                LearningObjective(
-                    objective=f"Students will be able to apply concepts from {outline.topic} to a practical example",
-                    bloom_level="apply",
-                    assessment="Scenario-based practice activity",
-                ),
-            ]
-
-    state.outline = outline
-    return state
 
-
-def _get_standard_prompt(state: PipelineState) -> str:
-    """Get standard prompt for business/professional presentations."""
-    return f"""You are a professional presentation outline generator. Your task is to analyze the user's brief and create a well-structured presentation outline.
-
-**User Brief:**
-{state.user_input}
+_STANDARD_PROMPT_PREFIX = """You are a professional presentation outline generator. Your task is to analyze the user's brief and create a well-structured presentation outline.
 
 **Instructions:**
 1. Extract or infer the main topic from the brief
@@ -98,16 +33,16 @@ def _get_standard_prompt(state: PipelineState) -> str:
 4. Each section should build on the previous one to tell a cohesive story
 
 **Output Format (JSON):**
-{{
+{
   "topic": "Clear, concise presentation title",
   "audience": "Target audience description",
   "sections": ["Section 1", "Section 2", "Section 3", ...]
-}}
+}
 
 **Example:**
 Input: "Explain renewable energy benefits to city planners"
 Output:
-{{
+{
   "topic": "Benefits of Renewable Energy for Urban Development",
   "audience": "Municipal planners and city officials",
   "sections": [
@@ -117,17 +52,14 @@ Output:
     "Implementation Strategies",
     "Case Studies and Success Stories"
   ]
-}}
+}"""
 
-Generate the outline as valid JSON:"""
+_STANDARD_PROMPT_SUFFIX = """**User Brief:**
+{user_input}
 
+Generate the outline as valid JSON:"""
 
-def _get_educational_prompt(state: PipelineState) -> str:
-    """Get enhanced prompt for educational presentations with learning objectives."""
-    return f"""You are an instructional design expert. Create a pedagogically sound presentation outline that follows evidence-based teaching principles.
-
-**User Brief:**
-{state.user_input}
+_EDUCATIONAL_PROMPT_PREFIX = """You are an instructional design expert. Create a pedagogically sound presentation outline that follows evidence-based teaching principles.
 
 **Instructional Design Requirements:**
 1. Identify the main topic and target learners (grade level, prior knowledge)
@@ -147,7 +79,7 @@ def _get_educational_prompt(state: PipelineState) -> str:
 - **Create**: Produce new work, design, construct
 
 **Output Format (JSON):**
-{{
+{
   "topic": "Clear, learner-focused presentation title",
   "audience": "Target learners (e.g., 'High school students, grades 9-10')",
   "educational_level": "Grade level or experience level",
@@ -156,16 +88,16 @@ def _get_educational_prompt(state: PipelineState) -> str:
     "Prior concept 2 learners should know"
   ],
   "learning_objectives": [
-    {{
+    {
       "objective": "Students will be able to [verb] [concept]",
       "bloom_level": "understand",
       "assessment": "How to measure this objective"
-    }},
-    {{
+    },
+    {
       "objective": "Students will be able to [verb] [concept]",
       "bloom_level": "apply",
       "assessment": "How to measure this objective"
-    }}
+    }
   ],
   "sections": [
     "Hook: Engaging opening that connects to prior knowledge",
@@ -174,12 +106,12 @@ def _get_educational_prompt(state: PipelineState) -> str:
     "Analysis and deeper understanding",
     "Synthesis and conclusion"
   ]
-}}
+}
 
 **Example:**
 Input: "Teach photosynthesis to 9th grade biology students"
 Output:
-{{
+{
   "topic": "Photosynthesis: How Plants Convert Light to Energy",
   "audience": "9th grade biology students",
   "educational_level": "High school freshman (age 14-15)",
@@ -189,21 +121,21 @@ Output:
     "Energy concepts (kinetic and potential energy)"
   ],
   "learning_objectives": [
-    {{
+    {
       "objective": "Students will be able to explain the process of photosynthesis in their own words",
       "bloom_level": "understand",
       "assessment": "Verbal explanation and diagram labeling"
-    }},
-    {{
+    },
+    {
       "objective": "Students will be able to apply photosynthesis knowledge to predict plant growth outcomes",
       "bloom_level": "apply",
       "assessment": "Scenario-based problem solving"
-    }},
-    {{
+    },
+    {
       "objective": "Students will be able to analyze the relationship between photosynthesis and cellular respiration",
       "bloom_level": "analyze",
       "assessment": "Comparison table and discussion"
-    }}
+    }
   ],
   "sections": [
     "Hook: Why Are Plants Green? (Activating prior knowledge)",
@@ -212,6 +144,135 @@ Output:
     "Photosynthesis vs. Cellular Respiration (Analysis and comparison)",
     "Ecological Importance and Review (Synthesis and formative assessment)"
   ]
-}}
+}"""
+
+_EDUCATIONAL_PROMPT_SUFFIX = """**User Brief:**
+{user_input}
 
 Generate the pedagogically sound outline as valid JSON:"""
+
+
+def run_brainstorm(state: PipelineState, use_cache: bool = True) -> PipelineState:
+    """Generate presentation outline from user input.
+
+    This agent analyzes the user's brief and creates a structured outline.
+    When educational_mode is enabled, it also generates learning objectives
+    and identifies prerequisite knowledge.
+
+    Args:
+        state: Pipeline state with the user's brief
+        use_cache: Reuse a cached outline for the same or a similar brief.
+            Pass False to force a fresh model call (e.g. Regenerate); the
+            new outline still replaces the cached one.
+    """
+    if not state.user_input:
+        state.errors.append("No user input provided")
+        return state
+
+    # Use centralized AI interface
+    ai = get_ai_interface()
+
+    if state.educational_mode:
+        # Educational mode: Include learning objectives and pedagogical planning
+        prefix, prompt = _get_educational_prompt(state)
+    else:
+        # Standard mode: Business/professional presentations
+        prefix, prompt = _get_standard_prompt(state)
+
+    # Identical prompts (e.g. batch retries) and near-duplicate briefs reuse
+    # a previously generated outline
+    exact_cache = get_exact_outline_cache()
+    outline_cache = get_outline_cache()
+    model = ai.get_model_info("brainstorm")["model"]
+    cache_key = ExactOutlineCache.make_key(
+        model, state.educational_mode, prefix + prompt
+    )
+    cached = None
+    if use_cache:
+        cached = exact_cache.get(cache_key) or outline_cache.lookup(
+            state.user_input, model, state.educational_mode
+        )
+
+    if cached is not None:
+        result = cached
+    else:
+        try:
+            # The static prefix goes in the system message so providers can
+            # reuse their cached prompt prefix across briefs.
+            response = ai.generate(prompt, agent="brainstorm", system_message=prefix)
+        except Exception:
+            response = None
+
+        # Parse JSON from response with repair logic
+        result = parse_json_with_repair(response.content) if response else {}
+
+    try:
+        # Nested learning objectives are validated by the outline's compiled
+        # schema in the same pass.
+        outline = PresentationOutline.model_validate(result)
+        if cached is None:
+            exact_cache.put(cache_key, outline.model_dump())
+            outline_cache.store(
+                state.user_input, model, state.educational_mode, outline.model_dump()
+            )
+    except Exception:
+        # Fall back to simple outline
+        outline = PresentationOutline(
+            topic=state.user_input.strip(),
+            audience="General audience",
+            sections=["Introduction", "Main Points", "Conclusion"],
+        )
+
+    if state.educational_mode:
+        if not outline.prerequisite_knowledge:
+            outline.prerequisite_knowledge = list(DEFAULT_PREREQUISITES)
+
+        if not outline.learning_objectives:
+            # Copies are cheaper than re-validating and keep callers from
+            # mutating the memoized instances.
+            outline.learning_objectives = [
+                objective.model_copy()
+                for objective in _default_objectives(outline.topic)
+            ]
+
+    state.outline = outline
+    return state
+
+
+@functools.lru_cache(maxsize=256)
+def _default_objectives(topic: str) -> tuple[LearningObjective, ...]:
+    """Build the fallback learning objectives for a topic."""
+    return (
+        LearningObjective(
+            objective=f"Students will be able to explain the core ideas of {topic}",
+            bloom_level="understand",
+            assessment="Short written explanation or verbal check",
+        ),
+        LearningObjective(
+            objective=f"Students will be able to apply concepts from {topic} to a practical example",
+            bloom_level="apply",
+            assessment="Scenario-based practice activity",
+        ),
+    )
+
+
+def _get_standard_prompt(state: PipelineState) -> tuple[str, str]:
+    """Get standard prompt for business/professional presentations.
+
+    Returns a ``(static_prefix, dynamic_suffix)`` pair; only the suffix
+    depends on the user brief.
+    """
+    return _STANDARD_PROMPT_PREFIX, _STANDARD_PROMPT_SUFFIX.format(
+        user_input=state.user_input
+    )
+
+
+def _get_educational_prompt(state: PipelineState) -> tuple[str, str]:
+    """Get enhanced prompt for educational presentations with learning objectives.
+
+    Returns a ``(static_prefix, dynamic_suffix)`` pair; only the suffix
+    depends on the user brief.
+    """
+    return _EDUCATIONAL_PROMPT_PREFIX, _EDUCATIONAL_PROMPT_SUFFIX.format(
+        user_input=state.user_input
+    )
@@ -6,92 +6,21 @@ active learning prompts, and formative assessments for educational presentations
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import functools
+import hashlib
+from typing import List, Optional
 
 from ..state import PipelineState
 from ..schemas import SlideContent
 from ..models.ai_interface import get_ai_interface
-from ..utils import parse_json_with_repair
+from ..models.prompt_cache import PromptCache, get_prompt_cache
+from ..utils import parse_json_with_repair, run_sync
 
+# Upper bound on in-flight model requests per content run.
+_MAX_CONCURRENT_REQUESTS = 8
 
-def run_content(state: PipelineState) -> PipelineState:
-    """Generate slide content for each section in the outline.
-
-    This agent creates detailed, well-structured slide content.
-    When educational_mode is enabled, it includes pedagogical elements like
-    engagement hooks, active learning prompts, and formative checks.
-    """
-    if not state.outline:
-        state.errors.append("No outline available for content generation")
-        return state
-
-    slides: List[SlideContent] = []
-    # Use centralized AI interface
-    ai = get_ai_interface()
-
-    for idx, section in enumerate(state.outline.sections, 1):
-        if state.educational_mode:
-            prompt = _get_educational_prompt(state, section, idx)
-        else:
-            prompt = _get_standard_prompt(state, section, idx)
-
-        try:
-            response = ai.generate(prompt, agent="content")
-        except Exception:
-            response = None
-        # Parse JSON from response with repair logic
-        result = parse_json_with_repair(response.content) if response else {}
-
-        try:
-            slide = SlideContent(**result)
-        except Exception:
-            # Fallback slide content
-            topic = (
-                state.outline.topic
-                if state.outline
-                else state.user_input or "the topic"
-            )
-            base_bullets = [
-                f"Define {section.lower()} in the context of {topic}.",
-                f"Explain key drivers and practical implications of {section.lower()}.",
-                f"Summarize actionable takeaways related to {topic}.",
-            ]
-
-            if state.educational_mode:
-                slide = SlideContent(
-                    title=f"{section}: {topic}",
-                    bullets=base_bullets,
-                    speaker_notes=f"Guide learners through {section.lower()} with concrete examples tied to {topic}.",
-                    citations=list(state.citations) if state.citations else [],
-                    engagement_hook=f"Why does {section.lower()} matter in real life?",
-                    active_learning_prompt=f"Pair activity: identify one real-world example of {section.lower()}.",
-                    formative_check=f"Quick check: What is one key idea from {section.lower()}?",
-                )
-            else:
-                slide = SlideContent(
-                    title=f"{section}: {topic}",
-                    bullets=base_bullets,
-                    speaker_notes=f"Discuss why {section.lower()} is important for understanding {topic}.",
-                    citations=list(state.citations) if state.citations else [],
-                )
-        slides.append(slide)
-
-    state.content = slides
-    return state
-
-
-def _get_standard_prompt(state: PipelineState, section: str, idx: int) -> str:
-    """Get standard prompt for business/professional slide content."""
-    citations_str = ", ".join(state.citations) if state.citations else "none"
-
-    return f"""You are a professional slide content writer. Create engaging, informative content for a presentation slide.
-
-**Presentation Context:**
-- Topic: {state.outline.topic}
-- Audience: {state.outline.audience}
-- Section {idx}/{len(state.outline.sections)}: {section}
-
-**Available Citations:** {citations_str}
+_STANDARD_PROMPT_PREFIX = """You are a professional slide content writer. Create engaging, informative content for a presentation slide.
 
 **Instructions:**
 1. Create a clear, concise slide title (max 10 words)
@@ -104,7 +33,7 @@ def _get_standard_prompt(state: PipelineState, section: str, idx: int) -> str:
 4. Include relevant citation markers [1], [2], etc. if applicable
 
 **Output Format (JSON):**
-{{
+{
   "title": "Slide Title",
   "bullets": [
     "First key point with specific details",
@@ -113,10 +42,10 @@ def _get_standard_prompt(state: PipelineState, section: str, idx: int) -> str:
   ],
   "speaker_notes": "Additional context and talking points for the presenter.",
   "citations": ["[1]", "[2]"]
-}}
+}
 
 **Example:**
-{{
+{
   "title": "Economic Benefits of Solar Energy",
   "bullets": [
     "Reduces electricity costs by 50-70% for businesses [1]",
@@ -125,37 +54,9 @@ def _get_standard_prompt(state: PipelineState, section: str, idx: int) -> str:
   ],
   "speaker_notes": "Emphasize the long-term ROI and job creation aspects. Note that these benefits are supported by multiple case studies from similar cities.",
   "citations": ["[1]", "[2]"]
-}}
-
-Generate the slide content as valid JSON:"""
+}"""
 
-
-def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str:
-    """Get enhanced prompt for educational slide content with pedagogical elements."""
-    citations_str = ", ".join(state.citations) if state.citations else "none"
-
-    # Determine appropriate Bloom's level for this slide
-    bloom_level = _suggest_bloom_level(idx, len(state.outline.sections))
-
-    # Get relevant learning objectives
-    objectives_str = "None"
-    if state.outline.learning_objectives:
-        relevant_objs = [
-            f"{obj.objective} ({obj.bloom_level})"
-            for obj in state.outline.learning_objectives[:2]
-        ]
-        objectives_str = "; ".join(relevant_objs)
-
-    return f"""You are an instructional design expert. Create pedagogically sound slide content that engages learners and supports understanding.
-
-**Presentation Context:**
-- Topic: {state.outline.topic}
-- Audience: {state.outline.audience}
-- Educational Level: {state.outline.educational_level or "Not specified"}
-- Section {idx}/{len(state.outline.sections)}: {section}
-- Learning Objectives: {objectives_str}
-
-**Available Citations:** {citations_str}
+_EDUCATIONAL_PROMPT_PREFIX = """You are an instructional design expert. Create pedagogically sound slide content that engages learners and supports understanding.
 
 **Pedagogical Requirements:**
 1. START with an **engagement hook** (question, surprising fact, real-world connection)
@@ -165,7 +66,7 @@ def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str
    - Build complexity gradually
    - Use analogies or comparisons
    - Connect to prior knowledge
-   - Target {bloom_level} cognitive level
+   - Target the Bloom's Taxonomy Target cognitive level given with the slide context
 4. Add an **active learning prompt** (think-pair-share, quick activity, reflection)
 5. Include a **formative check** (quick question to gauge understanding)
 6. Write **speaker notes** with:
@@ -173,7 +74,7 @@ def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str
    - Differentiation strategies (support for struggling/advanced learners)
    - Transition to next slide
 
-**Bloom's Taxonomy Target:** {bloom_level}
+**Bloom's Taxonomy Levels:**
 - **remember**: Recall facts
 - **understand**: Explain concepts
 - **apply**: Use in new situations
@@ -182,7 +83,7 @@ def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str
 - **create**: Design, produce new ideas
 
 **Output Format (JSON):**
-{{
+{
   "title": "Clear, student-focused slide title",
   "engagement_hook": "Opening hook to capture attention (question/fact/connection)",
   "bullets": [
@@ -195,12 +96,12 @@ def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str
   "active_learning_prompt": "Activity: [pair discussion/quick write/demo/etc.]",
   "formative_check": "Check: Quick question to assess understanding",
   "speaker_notes": "Pedagogical guidance: Start with hook to activate prior knowledge about [concept]. After bullets, allow 60 seconds for active learning. Use formative check before moving on. For struggling learners: [strategy]. For advanced learners: [extension].",
-  "bloom_level": "{bloom_level}",
+  "bloom_level": "[the Bloom's Taxonomy Target]",
   "citations": ["[1]"]
-}}
+}
 
 **Example (Understanding Level):**
-{{
+{
   "title": "How Photosynthesis Works",
   "engagement_hook": "Question: If plants don't eat food, how do they grow so big?",
   "bullets": [
@@ -215,11 +116,283 @@ def _get_educational_prompt(state: PipelineState, section: str, idx: int) -> str
   "speaker_notes": "Start with engaging hook to make students curious. Use the solar panel analogy to make chloroplasts relatable. After presenting bullets, give 90 seconds for pair discussion - listen for accurate explanations. Use the formative check (answer: B) before proceeding. For struggling learners: Draw the process visually on board. For advanced: Ask how this connects to cellular respiration.",
   "bloom_level": "understand",
   "citations": ["[1]"]
-}}
+}"""
+
+
+# Per-slide suffixes, rendered with str.format_map.
+_STANDARD_PROMPT_SUFFIX = """**Presentation Context:**
+- Topic: {topic}
+- Audience: {audience}
+- Section {idx}/{n}: {section}
+
+**Available Citations:** {citations_str}
+
+Generate the slide content as valid JSON:"""
+
+_EDUCATIONAL_PROMPT_SUFFIX = """**Presentation Context:**
+- Topic: {topic}
+- Audience: {audience}
+- Educational Level: {edu_level}
+- Section {idx}/{n}: {section}
+- Learning Objectives: {objectives_str}
+
+**Available Citations:** {citations_str}
+
+**Bloom's Taxonomy Target:** {bloom_level}
 
 Generate the pedagogically sound slide content as valid JSON:"""
 
 
+def run_content(state: PipelineState, use_cache: bool = True) -> PipelineState:
+    """Generate slide content for each section in the outline.
+
+    This agent creates detailed, well-structured slide content.
+    When educational_mode is enabled, it includes pedagogical elements like
+    engagement hooks, active learning prompts, and formative checks.
+
+    Args:
+        state: Pipeline state with the outline (and research results)
+        use_cache: Reuse cached responses for identical or similar sections.
+            Pass False to force fresh model calls (e.g. Regenerate); the new
+            responses still replace the cached ones.
+    """
+    if not state.outline:
+        state.errors.append("No outline available for content generation")
+        return state
+
+    slides: List[SlideContent] = []
+    # Use centralized AI interface
+    ai = get_ai_interface()
+
+    # Snapshot the sections once; the count is shared by every prompt
+    sections = tuple(state.outline.sections)
+    n = len(sections)
+    build_prompt = (
+        _get_educational_prompt if state.educational_mode else _get_standard_prompt
+    )
+    prompts = [
+        build_prompt(state, section, idx, n) for idx, section in enumerate(sections, 1)
+    ]
+
+    cache = get_prompt_cache()
+    model = ai.get_model_info("content")["model"]
+    outline = state.outline
+    # Slides cite the research they were written from, so responses are only
+    # shared between runs with the same citations and evidence
+    research_digest = _research_digest(state)
+    # Educational prompts are written for a level and set of objectives
+    learning_context = (
+        (outline.educational_level, _format_objectives(outline))
+        if state.educational_mode
+        else None
+    )
+
+    jobs = []
+    for idx, (section, (prefix, suffix)) in enumerate(zip(sections, prompts), 1):
+        # Slots that must match exactly form the namespace; topic, audience
+        # and section are compared semantically.
+        bloom_level = _suggest_bloom_level(idx, n) if state.educational_mode else None
+        namespace = (
+            "content",
+            model,
+            state.educational_mode,
+            bloom_level,
+            learning_context,
+            research_digest,
+        )
+        slots = f"{outline.topic} | {outline.audience} | {section}"
+        key = PromptCache.make_key(
+            "content", model, f"{prefix}{suffix}\n{research_digest}"
+        )
+        jobs.append((key, namespace, slots, prefix, suffix))
+
+    # Serve cache hits first; only misses go to the model.
+    texts: List[Optional[str]] = [
+        (cache.get(key) or cache.lookup(namespace, slots)) if use_cache else None
+        for key, namespace, slots, _, _ in jobs
+    ]
+    cached_flags = [text is not None for text in texts]
+    misses = [i for i, text in enumerate(texts) if text is None]
+    if misses:
+        # Sections are independent and model calls are I/O-bound, so issue
+        # them concurrently on one event loop sharing a connection pool.
+        fresh = run_sync(_generate_all(ai, [(jobs[i][3], jobs[i][4]) for i in misses]))
+        for i, text in zip(misses, fresh):
+            texts[i] = text
+
+    # Fallback slides reuse the same topic string
+    topic = outline.topic if outline else state.user_input or "the topic"
+    for section, job, text, from_cache in zip(sections, jobs, texts, cached_flags):
+        try:
+            try:
+                # Fast path: well-formed JSON validates straight from the
+                # string without building an intermediate dict
+                slide = SlideContent.model_validate_json(text or "")
+            except ValueError:
+                # Parse JSON from response with repair logic
+                result = parse_json_with_repair(text) if text else {}
+                slide = SlideContent(**result)
+            if not from_cache:
+                key, namespace, slots, _, _ = job
+                cache.put(key, text, namespace=namespace, slots=slots)
+        except Exception:
+            # Fallback slide content (pydantic copies list fields on
+            # validation, so state.citations can be passed directly)
+            section_lower = section.lower()
+            base_bullets = [
+                f"Define {section_lower} in the context of {topic}.",
+                f"Explain key drivers and practical implications of {section_lower}.",
+                f"Summarize actionable takeaways related to {topic}.",
+            ]
+
+            if state.educational_mode:
+                slide = SlideContent(
+                    title=f"{section}: {topic}",
+                    bullets=base_bullets,
+                    speaker_notes=f"Guide learners through {section_lower} with concrete examples tied to {topic}.",
+                    citations=state.citations,
+                    engagement_hook=f"Why does {section_lower} matter in real life?",
+                    active_learning_prompt=f"Pair activity: identify one real-world example of {section_lower}.",
+                    formative_check=f"Quick check: What is one key idea from {section_lower}?",
+                )
+            else:
+                slide = SlideContent(
+                    title=f"{section}: {topic}",
+                    bullets=base_bullets,
+                    speaker_notes=f"Discuss why {section_lower} is important for understanding {topic}.",
+                    citations=state.citations,
+                )
+        slides.append(slide)
+
+    state.content = slides
+    # Precompute once so QA and the auditor reuse the counts.
+    state.pedagogical_feature_counts()
+    return state
+
+
+async def _generate_all(ai, prompts: List[tuple[str, str]]) -> List[Optional[str]]:
+    """Generate responses for ``(prefix, suffix)`` prompts concurrently.
+
+    Results keep prompt order; failed calls yield None so the caller can fall
+    back per section.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async with ai.async_session() as http_client:
+
+        async def _generate(prefix: str, suffix: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    # The static prefix goes in the system message so
+                    # providers can reuse their cached prompt prefix.
+                    response = await ai.generate_async(
+                        suffix,
+                        agent="content",
+                        system_message=prefix,
+                        http_client=http_client,
+                    )
+                except Exception:
+                    return None
+            return response.content
+
+        return await asyncio.gather(
+            *(_generate(prefix, suffix) for prefix, suffix in prompts)
+        )
+
+
+def _get_standard_prompt(
+    state: PipelineState, section: str, idx: int, total: Optional[int] = None
+) -> tuple[str, str]:
+    """Get standard prompt for business/professional slide content.
+
+    Returns a ``(static_prefix, dynamic_suffix)`` pair; only the suffix
+    depends on the outline and section.
+    """
+    citations_str = _format_citations(state.citations)
+    if total is None:
+        total = len(state.outline.sections)
+
+    return (
+        _STANDARD_PROMPT_PREFIX,
+        _STANDARD_PROMPT_SUFFIX.format_map(
+            {
+                "topic": state.outline.topic,
+                "audience": state.outline.audience,
+                "idx": idx,
+                "n": total,
+                "section": section,
+                "citations_str": citations_str,
+            }
+        ),
+    )
+
+
+def _get_educational_prompt(
+    state: PipelineState, section: str, idx: int, total: Optional[int] = None
+) -> tuple[str, str]:
+    """Get enhanced prompt for educational slide content with pedagogical elements.
+
+    Returns a ``(static_prefix, dynamic_suffix)`` pair; only the suffix
+    depends on the outline, section and Bloom's target.
+    """
+    citations_str = _format_citations(state.citations)
+    if total is None:
+        total = len(state.outline.sections)
+
+    # Determine appropriate Bloom's level for this slide
+    bloom_level = _suggest_bloom_level(idx, total)
+
+    return (
+        _EDUCATIONAL_PROMPT_PREFIX,
+        _EDUCATIONAL_PROMPT_SUFFIX.format_map(
+            {
+                "topic": state.outline.topic,
+                "audience": state.outline.audience,
+                "edu_level": state.outline.educational_level or "Not specified",
+                "idx": idx,
+                "n": total,
+                "section": section,
+                "objectives_str": _format_objectives(state.outline),
+                "citations_str": citations_str,
+                "bloom_level": bloom_level,
+            }
+        ),
+    )
+
+
+def _format_objectives(outline) -> str:
+    """Format the outline's first two learning objectives for a prompt."""
+    if not outline.learning_objectives:
+        return "None"
+    return "; ".join(
+        f"{obj.objective} ({obj.bloom_level})"
+        for obj in outline.learning_objectives[:2]
+    )
+
+
+def _research_digest(state: PipelineState) -> str:
+    """Short hash of the state's citations and evidence."""
+    digest = hashlib.sha256()
+    for citation in state.citations:
+        digest.update(f"{citation}\n".encode("utf-8"))
+    for evidence in state.evidences:
+        digest.update(f"{evidence.source}\t{evidence.snippet}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _format_citations(citations: List[str], limit: int = 10) -> str:
+    """Format available citation markers for a prompt, summarizing long lists."""
+    if not citations:
+        return "none"
+    if len(citations) <= limit:
+        return ", ".join(citations)
+    return (
+        f"{len(citations)} sources available; key markers: "
+        f"{', '.join(citations[:limit])}..."
+    )
+
+
+@functools.lru_cache(maxsize=256)
 def _suggest_bloom_level(slide_index: int, total_slides: int) -> str:
     """Suggest appropriate Bloom's level based on slide position (scaffolding).
 
@@ -227,11 +400,10 @@ def _suggest_bloom_level(slide_index: int, total_slides: int) -> str:
     Middle slides: apply, analyze
     Later slides: evaluate, create
     """
-    progress = slide_index / total_slides
-
-    if progress <= 0.33:
+    # Integer form of progress <= 0.33 / <= 0.66 (no float division)
+    if 100 * slide_index <= 33 * total_slides:
         return "understand"  # Foundation building
-    elif progress <= 0.66:
+    elif 100 * slide_index <= 66 * total_slides:
         return "apply"  # Practice and application
     else:
         return "analyze"  # Deeper thinking and synthesis
@@ -15,12 +15,38 @@ Enhanced with:
 
 from __future__ import annotations
 
+import functools
+import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..state import PipelineState
-from ..tools.citations import CitationManager
-from ..tools.pptx_builder import build_presentation, PresentationConfig
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..tools.pptx_builder import PresentationConfig
+
+_OUTPUT_DIR = Path("artifacts")
+_TIMESTAMP_FMT = "%Y%m%d_%H%M%S"
+
+
+@functools.lru_cache(maxsize=1)
+def _default_presentation_config() -> "PresentationConfig":
+    """Build the static presentation settings once, on first use.
+
+    Note: logo and footer config would be loaded from ai_config.properties
+    (cache the loader on the properties-file mtime when that lands).
+    """
+    from ..tools.pptx_builder import PresentationConfig
+
+    return PresentationConfig(
+        logo_path=None,  # TODO: Load from config
+        footer_text=None,  # TODO: Load from config
+        show_page_numbers=True,
+        font_name="Calibri",
+        title_font_size=44,
+        body_font_size=20,
+    )
 
 
 def run_design(state: PipelineState) -> PipelineState:
@@ -38,23 +64,32 @@ def run_design(state: PipelineState) -> PipelineState:
         )
         return state
 
-    # Use citation manager stored in state if available; otherwise rebuild
+    # python-pptx is heavy to import, so load the builder only when a deck
+    # is actually built.
+    from ..tools.citations import CitationManager
+    from ..tools.pptx_builder import build_presentation
+
+    # Use references prepared by the research agent if available; otherwise
+    # rebuild them from evidences (skipping the manager when there are none)
     references = getattr(state, "references", None)
     if not references:
-        # No references prepared; build from evidences
-        cm = CitationManager()
-        cm.register_evidence(state.evidences)
-        references = cm.build_references_slide()
-
-    # Determine output path
-    output_dir = Path("artifacts")
-    output_dir.mkdir(exist_ok=True, parents=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"presentation_{timestamp}.pptx"
+        if state.evidences:
+            cm = CitationManager()
+            cm.register_evidence(state.evidences)
+            references = cm.build_references_slide()
+        else:
+            references = []
+
+    # Determine output path. The run id (or a random suffix for unsaved
+    # runs) keeps decks from concurrent runs in the same second apart.
+    _OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
+    timestamp = datetime.now().strftime(_TIMESTAMP_FMT)
+    run_suffix = state.run_id or uuid.uuid4().hex[:8]
+    output_path = _OUTPUT_DIR / f"presentation_{timestamp}_{run_suffix}.pptx"
 
     # Build presentation configuration
     template_name = getattr(state, "template_name", None)
-    config = _build_presentation_config()
+    config = _default_presentation_config()
 
     # Build presentation with optional template and enhanced features
     try:
@@ -75,25 +110,3 @@ def run_design(state: PipelineState) -> PipelineState:
         state.errors.append(error_msg)
 
     return state
-
-
-def _build_presentation_config() -> PresentationConfig:
-    """Build presentation configuration from application settings.
-
-    Returns:
-        PresentationConfig object with settings from config file
-    """
-    try:
-        # Note: logo and footer config would be loaded from ai_config.properties
-        # For now, use defaults or environment variables
-        return PresentationConfig(
-            logo_path=None,  # TODO: Load from config
-            footer_text=None,  # TODO: Load from config
-            show_page_numbers=True,
-            font_name="Calibri",
-            title_font_size=44,
-            body_font_size=20,
-        )
-    except Exception:
-        # Return defaults if config loading fails
-        return PresentationConfig()
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Set
 
 from ..state import PipelineState
 
 
-def _append_unique(items: List[str], value: str) -> None:
-    if value and value not in items:
+def _append_unique(items: List[str], items_set: Set[str], value: str) -> None:
+    if value and value not in items_set:
         items.append(value)
+        items_set.add(value)
 
 
 def run_pedagogical_auditor(state: PipelineState, phase: str) -> PipelineState:
@@ -20,57 +21,61 @@ def run_pedagogical_auditor(state: PipelineState, phase: str) -> PipelineState:
     """
     suggestions = list(state.teaching_suggestions or [])
     flags = list(state.audit_flags or [])
+    # Set sidecars keep membership checks O(1) while the lists keep order.
+    suggestions_set = set(suggestions)
+    flags_set = set(flags)
 
     if phase == "outline" and state.outline:
         if not getattr(state.outline, "learning_objectives", None):
             _append_unique(
                 suggestions,
+                suggestions_set,
                 "Add at least 2 measurable learning objectives before content generation.",
             )
-            _append_unique(flags, "outline_missing_learning_objectives")
+            _append_unique(flags, flags_set, "outline_missing_learning_objectives")
 
         if not getattr(state.outline, "prerequisite_knowledge", None):
             _append_unique(
                 suggestions,
+                suggestions_set,
                 "Specify prerequisite knowledge to calibrate slide complexity.",
             )
-            _append_unique(flags, "outline_missing_prerequisites")
+            _append_unique(flags, flags_set, "outline_missing_prerequisites")
 
     if phase == "research":
         if len(state.claims or []) == 0:
             _append_unique(
                 suggestions,
+                suggestions_set,
                 "Research phase produced no explicit claims; add verifiable claims for factual grounding.",
             )
-            _append_unique(flags, "research_missing_claims")
+            _append_unique(flags, flags_set, "research_missing_claims")
         if len(state.evidences or []) == 0:
             _append_unique(
                 suggestions,
+                suggestions_set,
                 "Collect evidence snippets for key claims before drafting content.",
             )
-            _append_unique(flags, "research_missing_evidence")
+            _append_unique(flags, flags_set, "research_missing_evidence")
 
     if phase == "design":
-        total_slides = len(state.content or [])
+        counts = state.pedagogical_feature_counts()
+        total_slides, hooks, formative = counts.total, counts.hooks, counts.formative
         if total_slides > 0:
-            hooks = sum(
-                1 for slide in state.content if getattr(slide, "engagement_hook", None)
-            )
-            formative = sum(
-                1 for slide in state.content if getattr(slide, "formative_check", None)
-            )
             if hooks < max(1, int(total_slides * 0.4)):
                 _append_unique(
                     suggestions,
+                    suggestions_set,
                     "Increase engagement hooks to maintain learner attention across the deck.",
                 )
-                _append_unique(flags, "design_low_engagement_hooks")
+                _append_unique(flags, flags_set, "design_low_engagement_hooks")
             if formative < max(1, int(total_slides * 0.3)):
                 _append_unique(
                     suggestions,
+                    suggestions_set,
                     "Add more formative checks to validate understanding during presentation.",
                 )
-                _append_unique(flags, "design_low_formative_checks")
+                _append_unique(flags, flags_set, "design_low_formative_checks")
 
     state.teaching_suggestions = suggestions
     state.audit_flags = flags
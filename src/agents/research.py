@@ -24,14 +24,10 @@ def run_research(state: PipelineState) -> PipelineState:
     fact_checker = FactCheckTool()
     evidences = fact_checker.check(claims)
     state.evidences = evidences
-    # Register citations (filter out evidences with empty sources)
+    # Register citations and store one marker per sourced evidence
+    # (evidences with empty sources are skipped by the manager)
     citation_manager = CitationManager()
-    valid_evidences = [ev for ev in evidences if ev.source]
-    citation_manager.register_evidence(valid_evidences)
-    # Create citation markers for each valid evidence; store markers in state.citations
-    state.citations = [
-        citation_manager.get_citation_marker(ev) for ev in valid_evidences
-    ]
+    state.citations = citation_manager.register_evidence(evidences)
     # Also store the reference entries (for later slide) in state for design agent
     state.references = citation_manager.build_references_slide()  # type: ignore
     state.research_completed = True
@@ -15,23 +15,22 @@ All processing runs according to ai_config.properties configuration.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import importlib
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import streamlit as st
 
 from src.config import get_config
-from src.graph.build_graph import run_pipeline, CheckpointManager
-from src.graph.langgraph_impl import run_langgraph_pipeline
 from src.models.ai_config import get_ai_config, reload_ai_config
 from src.models.ai_interface import get_ai_interface
 from src.state import PipelineState
-from src.agents.brainstorm import run_brainstorm
-from src.agents.research import run_research
-from src.agents.content import run_content
-from src.agents.design import run_design
-from src.agents.qa import run_qa
+from src.utils import run_sync
 from src.app_educational_helpers import (
     display_educational_toggle,
     display_learning_objectives,
@@ -40,7 +39,93 @@ from src.app_educational_helpers import (
     display_pedagogical_qa_dashboard,
     display_educational_outline_editor,
 )
-from src.app_settings_helpers import display_settings_ui
+from src.app_settings_helpers import display_settings_ui, list_available_templates
+
+
+# Agents, the pipeline graph and LangGraph pull in model clients, python-pptx,
+# SQLAlchemy and vector-store backends, so they are imported on first use
+# rather than at app startup.
+@functools.cache
+def _get_agent(name: str):
+    """Import ``src.agents.<name>`` and return its ``run_<name>`` function."""
+    module = importlib.import_module(f"src.agents.{name}")
+    return getattr(module, f"run_{name}")
+
+
+def _lazy_agent(name: str):
+    """Return a callable that imports the agent only when it is run."""
+
+    def run(state: PipelineState, **kwargs) -> PipelineState:
+        return _get_agent(name)(state, **kwargs)
+
+    return run
+
+
+# Phases whose agent reuses cached model responses; Regenerate must bypass
+# the cache or it would return the same output again.
+_CACHED_PHASES = frozenset({"brainstorm", "content", "qa"})
+
+
+def _regenerate_func(phase_key: str, run_func):
+    """Return ``run_func`` set up to skip response caches when it has them."""
+    if phase_key in _CACHED_PHASES:
+        return functools.partial(run_func, use_cache=False)
+    return run_func
+
+
+async def _run_remaining_async(state: PipelineState) -> PipelineState:
+    """Run every phase that has not completed yet, overlapping independent ones.
+
+    Brainstorm, research and content each consume the previous phase's
+    output, so they run in order. Design and QA both only read the slide
+    content and write disjoint fields, so they run concurrently on worker
+    threads.
+    """
+    if not state.outline:
+        state = await asyncio.to_thread(_get_agent("brainstorm"), state)
+        if not state.outline:
+            return state
+    if not getattr(state, "research_completed", False):
+        state = await asyncio.to_thread(_get_agent("research"), state)
+    if not state.content:
+        state = await asyncio.to_thread(_get_agent("content"), state)
+        if not state.content:
+            return state
+
+    pending = []
+    if not state.pptx_path:
+        pending.append(asyncio.to_thread(_get_agent("design"), state))
+    if not state.qa_report:
+        pending.append(asyncio.to_thread(_get_agent("qa"), state))
+    await asyncio.gather(*pending)
+    return state
+
+
+@st.cache_resource(show_spinner=False)
+def _checkpoint_manager(db_path: Optional[str] = None):
+    """Return a CheckpointManager shared across reruns and sessions.
+
+    Each manager owns a SQLAlchemy engine, so it is built once per database
+    instead of on every Streamlit rerun.
+    """
+    from src.graph.build_graph import CheckpointManager
+
+    return CheckpointManager(db_path=db_path)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_runs_cached(db_path: Optional[str], limit: int) -> list[dict]:
+    """Fetch recent runs, cached briefly since Streamlit reruns on every interaction.
+
+    Cleared via ``_list_runs_cached.clear()`` whenever a new run completes.
+    """
+    return _checkpoint_manager(db_path).list_runs(limit=limit)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _run_details_cached(db_path: Optional[str], run_id: int) -> Optional[dict]:
+    """Fetch one run's full record, cached like ``_list_runs_cached``."""
+    return _checkpoint_manager(db_path).get_run_details(run_id)
 
 
 def load_run_history(limit: int = 10) -> list[dict]:
@@ -52,19 +137,40 @@ def load_run_history(limit: int = 10) -> list[dict]:
         return []
 
     try:
-        cp = CheckpointManager(db_path=db_path)
-        return cp.list_runs(limit=limit)
+        return _list_runs_cached(db_path, limit)
     except Exception as e:
         st.error(f"Error loading history: {e}")
         return []
 
 
-def display_model_configuration():
+class _AISnapshot(NamedTuple):
+    """Provider and per-agent model info, read once per rerun."""
+
+    provider: str
+    models: dict[str, dict]
+
+
+def _read_ai_snapshot() -> _AISnapshot:
+    """Read the AI configuration shared by the sidebar and Documentation tab.
+
+    get_model_info() only reads the already parsed properties, so this is
+    not cached: a cached copy would go stale after "Reload Configuration" or
+    a save from the Settings tab.
+    """
+    ai = get_ai_interface()
+    return _AISnapshot(
+        provider=get_ai_config().get_provider(),
+        models={
+            agent: ai.get_model_info(agent) for agent in ("brainstorm", "content", "qa")
+        },
+    )
+
+
+def display_model_configuration(snapshot: _AISnapshot):
     """Display current AI model configuration."""
     st.sidebar.markdown("### 🤖 AI Configuration")
 
-    ai_config = get_ai_config()
-    provider = ai_config.get_provider()
+    provider = snapshot.provider
 
     # Provider info
     provider_emoji = {"ollama": "🏠", "openrouter": "☁️"}
@@ -75,15 +181,15 @@ def display_model_configuration():
 
     # Model details for each agent
     with st.sidebar.expander("📋 Agent Models", expanded=False):
-        for agent in ["brainstorm", "content", "qa"]:
-            ai = get_ai_interface()
-            info = ai.get_model_info(agent)
-            st.markdown(
+        st.markdown(
+            "\n\n".join(
                 f"**{agent.title()}**\n"
                 f"- Model: `{info['model']}`\n"
                 f"- Temp: {info['temperature']}\n"
                 f"- Max tokens: {info['max_tokens']}"
+                for agent, info in snapshot.models.items()
             )
+        )
 
     # Reload button
     if st.sidebar.button("🔄 Reload Configuration", help="Reload ai_config.properties"):
@@ -91,55 +197,58 @@ def display_model_configuration():
         st.sidebar.success("Configuration reloaded!")
 
 
-def validate_text_file(uploaded_file) -> tuple[bool, str]:
+_ALLOWED_TEXT_EXTENSIONS: frozenset[str] = frozenset(
+    (".txt", ".md", ".markdown", ".csv", ".json", ".xml", ".yaml", ".yml")
+)
+_ALLOWED_TEXT_EXTENSIONS_LABEL = ", ".join(sorted(_ALLOWED_TEXT_EXTENSIONS))
+# st.file_uploader takes extensions without the leading dot
+_UPLOAD_FILE_TYPES = sorted(ext[1:] for ext in _ALLOWED_TEXT_EXTENSIONS)
+
+
+def validate_text_file(uploaded_file) -> tuple[bool, str, Optional[str]]:
     """Validate that uploaded file is a text-based file.
 
     Args:
         uploaded_file: Streamlit uploaded file object
 
+    The file is decoded once here so callers can use the returned text
+    instead of reading the upload again.
+
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, decoded_content_or_None)
     """
     if uploaded_file is None:
-        return False, "No file uploaded"
+        return False, "No file uploaded", None
 
     # Check file extension
-    allowed_extensions = {
-        ".txt",
-        ".md",
-        ".markdown",
-        ".csv",
-        ".json",
-        ".xml",
-        ".yaml",
-        ".yml",
-    }
     file_extension = Path(uploaded_file.name).suffix.lower()
 
-    if file_extension not in allowed_extensions:
+    if file_extension not in _ALLOWED_TEXT_EXTENSIONS:
         return (
             False,
-            f"File type '{file_extension}' not allowed. Allowed types: {', '.join(allowed_extensions)}",
+            f"File type '{file_extension}' not allowed. Allowed types: {_ALLOWED_TEXT_EXTENSIONS_LABEL}",
+            None,
         )
 
     # Check file size (max 10MB)
     if uploaded_file.size and uploaded_file.size > 10 * 1024 * 1024:
-        return False, "File too large (max 10MB)"
+        return False, "File too large (max 10MB)", None
 
-    # Try to read as text to ensure it's text-based
+    # Decode as UTF-8 to ensure it's text-based
     try:
-        # Read first 1KB to check if it's valid text
-        chunk = uploaded_file.read(1024)
-        uploaded_file.seek(0)  # Reset file pointer
-
-        # Try to decode as UTF-8
-        chunk.decode("utf-8")
-
-        return True, "File is valid"
+        if hasattr(uploaded_file, "getvalue"):
+            # Streamlit uploads are in-memory buffers; getvalue() hands back
+            # the buffered bytes object itself, without copying it
+            data = uploaded_file.getvalue()
+        else:
+            uploaded_file.seek(0)
+            data = uploaded_file.read()
+        content = data.decode("utf-8")
+        return True, "File is valid", content
     except UnicodeDecodeError:
-        return False, "File appears to be binary (not a text file)"
+        return False, "File appears to be binary (not a text file)", None
     except Exception as e:
-        return False, f"Error validating file: {str(e)}"
+        return False, f"Error validating file: {str(e)}", None
 
 
 def display_extra_input_section(phase_name: str, key_prefix: str) -> str:
@@ -191,7 +300,7 @@ def display_file_upload_section(phase_name: str, key_prefix: str) -> list[str]:
 
     uploaded_files = st.file_uploader(
         label=f"Select files for {phase_name}:",
-        type=["txt", "md", "markdown", "csv", "json", "xml", "yaml", "yml"],
+        type=_UPLOAD_FILE_TYPES,
         accept_multiple_files=True,
         key=f"{key_prefix}_file_uploader",
         help="Only text-based files are allowed. Binary files (images, PDFs, etc.) will be rejected.",
@@ -203,17 +312,12 @@ def display_file_upload_section(phase_name: str, key_prefix: str) -> list[str]:
         st.markdown("**Uploaded Files:**")
 
         for uploaded_file in uploaded_files[:5]:  # Limit to 5 files
-            # Validate file
-            is_valid, message = validate_text_file(uploaded_file)
+            # Validate file (also returns the decoded content)
+            is_valid, message, content = validate_text_file(uploaded_file)
 
             if is_valid:
-                # Try to read content
-                try:
-                    content = uploaded_file.read().decode("utf-8")
-                    validated_contents.append(content)
-                    st.success(f"✅ {uploaded_file.name} ({len(content)} chars)")
-                except Exception as e:
-                    st.error(f"❌ {uploaded_file.name}: Error reading file - {str(e)}")
+                validated_contents.append(content)
+                st.success(f"✅ {uploaded_file.name} ({len(content)} chars)")
             else:
                 st.error(f"❌ {uploaded_file.name}: {message}")
 
@@ -254,21 +358,22 @@ def run_agent_with_extras(
 
     # Handle brainstorm (enhances user_input)
     if state_field is None:
-        enhanced_input = state.user_input
+        # Collect parts and join once instead of repeated concatenation
+        parts = [state.user_input or ""]
 
         if extra_input:
-            enhanced_input += f"\n\nAdditional Requirements/Context:\n{extra_input}"
+            parts.append(f"\n\nAdditional Requirements/Context:\n{extra_input}")
 
         if file_contents:
-            enhanced_input += "\n\nReference Materials:\n"
+            parts.append("\n\nReference Materials:\n")
             for i, content in enumerate(file_contents, 1):
                 # Truncate very long content
-                display_content = (
-                    content[:2000] + "..." if len(content) > 2000 else content
-                )
-                enhanced_input += f"\n--- File {i} ---\n{display_content}"
+                if len(content) > 2000:
+                    parts.append(f"\n--- File {i} ---\n{content[:2000]}...")
+                else:
+                    parts.append(f"\n--- File {i} ---\n{content}")
 
-        state.user_input = enhanced_input
+        state.user_input = "".join(parts)
     else:
         # Handle other agents (store in state attributes)
         if extra_input:
@@ -282,6 +387,15 @@ def run_agent_with_extras(
     return agent_func(state)
 
 
+# State field that stores each phase's extra input (brainstorm has none)
+_PHASE_EXTRA_INPUT_FIELDS: dict[str, str] = {
+    "research": "research_extra_input",
+    "content": "content_extra_input",
+    "design": "design_extra_input",
+    "qa": "qa_extra_input",
+}
+
+
 def display_enhanced_phase_runner(
     phase_name: str,
     phase_key: str,
@@ -325,14 +439,6 @@ def display_enhanced_phase_runner(
         # Determine if we should enable the buttons
         extras_enabled = can_run if not has_content_check else content_check
 
-        # Map phase_key to state_field for storing extras (None for brainstorm)
-        state_field_map = {
-            "research": "research_extra_input",
-            "content": "content_extra_input",
-            "design": "design_extra_input",
-            "qa": "qa_extra_input",
-        }
-
         col1, col2 = st.columns([1, 1])
         with col1:
             if st.button(
@@ -348,7 +454,7 @@ def display_enhanced_phase_runner(
                         state=state,
                         extra_input=extra_input,
                         file_contents=file_contents,
-                        state_field=state_field_map.get(phase_key),
+                        state_field=_PHASE_EXTRA_INPUT_FIELDS.get(phase_key),
                     )
                     st.session_state["step_state"] = state
                     st.success(success_message_run)
@@ -362,11 +468,11 @@ def display_enhanced_phase_runner(
             ):
                 with st.spinner(spinner_message_regen):
                     state = run_agent_with_extras(
-                        agent_func=run_func,
+                        agent_func=_regenerate_func(phase_key, run_func),
                         state=state,
                         extra_input=extra_input,
                         file_contents=file_contents,
-                        state_field=state_field_map.get(phase_key),
+                        state_field=_PHASE_EXTRA_INPUT_FIELDS.get(phase_key),
                     )
                     st.session_state["step_state"] = state
                     st.success(success_message_regen)
@@ -375,6 +481,26 @@ def display_enhanced_phase_runner(
     return state, bool(extra_input or file_contents)
 
 
+_PHASE_DESCRIPTIONS: dict[str, str] = {
+    "brainstorm": "Generate presentation outline with topic, audience, and sections.",
+    "research": "Extract claims and find supporting evidence from local corpus.",
+    "content": "Generate detailed slide content with bullets and speaker notes.",
+    "design": "Assemble slides into PowerPoint file with python-pptx.",
+    "qa": "Evaluate presentation quality and generate improvement feedback.",
+}
+
+# State field each phase needs before it can be regenerated: design and QA
+# need content, every other phase needs the outline.
+_PHASE_REGEN_PREREQUISITE: dict[str, str] = {
+    "design": "content",
+    "qa": "content",
+}
+
+_PHASE_SPINNER_SUFFIXES: dict[str, str] = {
+    "content": " This may take 20-40 seconds.",
+}
+
+
 def get_phase_description(phase_key: str) -> str:
     """Get the description for a given phase.
 
@@ -384,14 +510,7 @@ def get_phase_description(phase_key: str) -> str:
     Returns:
         Description text for the phase
     """
-    descriptions = {
-        "brainstorm": "Generate presentation outline with topic, audience, and sections.",
-        "research": "Extract claims and find supporting evidence from local corpus.",
-        "content": "Generate detailed slide content with bullets and speaker notes.",
-        "design": "Assemble slides into PowerPoint file with python-pptx.",
-        "qa": "Evaluate presentation quality and generate improvement feedback.",
-    }
-    return descriptions.get(phase_key, "")
+    return _PHASE_DESCRIPTIONS.get(phase_key, "")
 
 
 def get_phase_regenerate_disabled(phase_key: str, state: PipelineState) -> bool:
@@ -404,15 +523,7 @@ def get_phase_regenerate_disabled(phase_key: str, state: PipelineState) -> bool:
     Returns:
         True if regenerate should be disabled
     """
-    # Research and Content phases need outline to regenerate
-    if phase_key in ["research", "content"]:
-        return not state.outline
-    # Design and QA phases need content to regenerate
-    elif phase_key in ["design", "qa"]:
-        return not state.content
-    # Brainstorm needs outline (when it exists)
-    else:
-        return not state.outline
+    return not getattr(state, _PHASE_REGEN_PREREQUISITE.get(phase_key, "outline"))
 
 
 def get_phase_spinner_suffix(phase_key: str) -> str:
@@ -424,9 +535,7 @@ def get_phase_spinner_suffix(phase_key: str) -> str:
     Returns:
         Suffix text for spinner messages
     """
-    if phase_key == "content":
-        return " This may take 20-40 seconds."
-    return ""
+    return _PHASE_SPINNER_SUFFIXES.get(phase_key, "")
 
 
 def display_phase_section(
@@ -458,6 +567,7 @@ def display_phase_section(
     """
     # Display section header (non-heading to avoid unstable auto-anchor links)
     st.markdown(f"**Step {step_number}: {phase_name}**")
+    spinner_suffix = get_phase_spinner_suffix(phase_key)
 
     # Create 3-column layout for buttons
     col1, col2, col3 = st.columns([3, 1, 1])
@@ -471,7 +581,6 @@ def display_phase_section(
     with col2:
         button_key = f"run_{phase_key}"
         if st.button(f"▶ Run {phase_name}", key=button_key, disabled=not can_run):
-            spinner_suffix = get_phase_spinner_suffix(phase_key)
             with st.spinner(f"Running {phase_name.lower()} agent...{spinner_suffix}"):
                 # Note: Using run_func directly (no longer need run_with_extras_func parameter)
                 state = run_func(state)
@@ -484,15 +593,13 @@ def display_phase_section(
         regen_key = f"regen_{phase_key}"
         regen_disabled = get_phase_regenerate_disabled(phase_key, state)
         if st.button("🔄 Regenerate", key=regen_key, disabled=regen_disabled):
-            spinner_suffix = get_phase_spinner_suffix(phase_key)
             with st.spinner(f"Regenerating...{spinner_suffix}"):
-                state = run_func(state)
+                state = _regenerate_func(phase_key, run_func)(state)
                 st.session_state["step_state"] = state
                 st.success(f"{phase_name} regenerated!")
                 st.rerun()
 
     # Use enhanced phase runner for extras
-    spinner_suffix = get_phase_spinner_suffix(phase_key)
     state, _ = display_enhanced_phase_runner(
         phase_name=phase_name,
         phase_key=phase_key,
@@ -522,37 +629,45 @@ def display_outline_editor(state: PipelineState) -> PipelineState:
 
     st.markdown("#### Edit Outline (optional)")
 
-    # Editable topic
-    new_topic = st.text_input(
-        "Topic", value=state.outline.topic, help="Edit the presentation topic"
-    )
-
-    # Editable audience
-    new_audience = st.text_input(
-        "Target Audience", value=state.outline.audience, help="Edit the target audience"
-    )
+    # Inside a form, edits don't rerun the whole app; only the submit buttons do
+    with st.form("outline_editor"):
+        # Editable topic
+        new_topic = st.text_input(
+            "Topic", value=state.outline.topic, help="Edit the presentation topic"
+        )
 
-    # Editable sections
-    st.markdown("**Sections:**")
-    new_sections = []
-    for i, section in enumerate(state.outline.sections):
-        new_section = st.text_input(
-            f"Section {i+1}",
-            value=section,
-            key=f"section_{i}",
-            help=f"Edit section {i+1}",
+        # Editable audience
+        new_audience = st.text_input(
+            "Target Audience",
+            value=state.outline.audience,
+            help="Edit the target audience",
         )
-        new_sections.append(new_section)
 
-    # Add section button
-    if st.button("➕ Add Section"):
-        new_sections.append("New Section")
+        # Editable sections
+        st.markdown("**Sections:**")
+        new_sections = []
+        for i, section in enumerate(state.outline.sections):
+            new_section = st.text_input(
+                f"Section {i+1}",
+                value=section,
+                key=f"section_{i}",
+                help=f"Edit section {i+1}",
+            )
+            new_sections.append(new_section)
+
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            add_section = st.form_submit_button("➕ Add Section")
+        with col2:
+            apply_changes = st.form_submit_button("✅ Apply Changes", type="primary")
 
-    # Apply changes
-    if st.button("✅ Apply Changes", type="primary"):
+    # Adding a section also keeps any edits made so far
+    if add_section or apply_changes:
         state.outline.topic = new_topic
         state.outline.audience = new_audience
         state.outline.sections = [s for s in new_sections if s.strip()]
+        if add_section:
+            state.outline.sections.append("New Section")
         st.success("Outline updated!")
         st.rerun()
 
@@ -563,38 +678,58 @@ def display_research_results(state: PipelineState):
     """Display research findings and citations."""
     st.subheader("🔬 Research & Citations")
 
-    if not hasattr(state, "claims") or not state.claims:
+    if not state.claims:
         st.info("No claims extracted (research agent skipped or no claims found)")
         return
 
     st.markdown(f"**Claims Extracted:** {len(state.claims)}")
-    st.markdown(
-        f"**Evidence Found:** {len(state.evidences) if hasattr(state, 'evidences') else 0}"
-    )
-    st.markdown(
-        f"**Citations Generated:** {len(state.citations) if hasattr(state, 'citations') else 0}"
-    )
+    st.markdown(f"**Evidence Found:** {len(state.evidences)}")
+    st.markdown(f"**Citations Generated:** {len(state.citations)}")
 
-    # Show claims
+    # Each expander body is built as one markdown string instead of one
+    # element per item
     with st.expander("📄 Claims", expanded=False):
-        for i, claim in enumerate(state.claims, 1):
-            st.markdown(f"{i}. {claim.text}")
+        st.markdown(
+            "\n".join(f"{i}. {claim.text}" for i, claim in enumerate(state.claims, 1))
+        )
 
     # Show evidence
-    if hasattr(state, "evidences") and state.evidences:
+    if state.evidences:
         with st.expander("✅ Evidence", expanded=False):
-            for i, ev in enumerate(state.evidences, 1):
-                st.markdown(
+            st.markdown(
+                "\n\n".join(
                     f"**Evidence {i}** (confidence: {ev.confidence:.2f})\n\n"
                     f"Source: `{ev.source}`\n\n"
                     f"Snippet: {ev.snippet}"
+                    for i, ev in enumerate(state.evidences, 1)
                 )
+            )
 
     # Show references
-    if hasattr(state, "references") and state.references:
+    if state.references:
         with st.expander("📚 References", expanded=False):
-            for ref in state.references:
-                st.markdown(f"- {ref}")
+            st.markdown("\n".join(f"- {ref}" for ref in state.references))
+
+
+def _existing_files(paths) -> set[str]:
+    """Return the subset of ``paths`` that exist, listing each directory once.
+
+    Preview images share a per-run folder, so one ``os.scandir`` replaces a
+    ``stat`` per slide.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for path in paths:
+        by_parent.setdefault(os.path.dirname(path), []).append(path)
+
+    existing: set[str] = set()
+    for parent, members in by_parent.items():
+        try:
+            with os.scandir(parent or ".") as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        existing.update(p for p in members if os.path.basename(p) in names)
+    return existing
 
 
 def display_content_preview(state: PipelineState) -> PipelineState:
@@ -609,10 +744,11 @@ def display_content_preview(state: PipelineState) -> PipelineState:
 
     if state.preview_images:
         with st.expander("🖼 Visual Previews", expanded=False):
-            for slide_num, image_path in sorted(
-                state.preview_images.items(), key=lambda row: int(row[0])
-            ):
-                if Path(image_path).exists():
+            # PreviewWorker writes the manifest in slide order and dicts keep
+            # insertion order (also through JSON checkpoints), so no sort.
+            existing = _existing_files(state.preview_images.values())
+            for slide_num, image_path in state.preview_images.items():
+                if image_path in existing:
                     st.markdown(f"**Slide {slide_num}**")
                     st.image(image_path, use_container_width=True)
 
@@ -673,6 +809,43 @@ def display_qa_report(state: PipelineState):
                 st.markdown(f"- {suggestion}")
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _load_pptx_bytes(path: str, mtime: float, size: int) -> bytes:
+    """Read a deck once per version; ``mtime`` and ``size`` only key the cache."""
+    return Path(path).read_bytes()
+
+
+def _read_pptx(path: Optional[str]) -> Optional[bytes]:
+    """Return a deck's bytes through the cache, or None if the file is missing.
+
+    The stat doubles as the existence check, so reruns cost one syscall.
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _load_pptx_bytes(path, stat.st_mtime, stat.st_size)
+
+
+@functools.cache
+def _artifacts_root() -> Path:
+    """Resolve the artifacts directory once per process."""
+    return Path("artifacts").resolve()
+
+
+def _resolve_artifact_path(output_path: str) -> Optional[Path]:
+    """Return the resolved path if it is an existing file inside artifacts/."""
+    try:
+        resolved_path = Path(output_path).resolve()
+    except (ValueError, OSError):
+        return None
+    if resolved_path.is_relative_to(_artifacts_root()) and resolved_path.is_file():
+        return resolved_path
+    return None
+
+
 def display_run_history():
     """Display run history from database."""
     st.sidebar.markdown("---")
@@ -686,40 +859,44 @@ def display_run_history():
 
     for run in history:
         with st.sidebar.expander(f"Run #{run['id']}", expanded=False):
-            st.markdown(f"**Time:** {run['created_at'][:19]}")
-            st.markdown(f"**Input:** {run['input'][:50]}...")
-            if run["qa_scores"]:
+            lines = [
+                f"**Time:** {run['created_at'][:19]}",
+                f"**Input:** {run['input'][:50]}...",
+            ]
+            # list_runs() already decodes qa_scores into a dict at fetch time,
+            # and the decoded rows are cached by _list_runs_cached.
+            scores = run["qa_scores"]
+            if isinstance(scores, dict):
                 try:
-                    scores = json.loads(run["qa_scores"])
-                    st.markdown(
+                    lines.append(
                         f"**QA:** C={scores.get('content', 0):.1f}, "
                         f"D={scores.get('design', 0):.1f}, "
                         f"Co={scores.get('coherence', 0):.1f}"
                     )
-                except (json.JSONDecodeError, TypeError, KeyError):
-                    st.markdown("**QA:** (malformed data)")
-
-            # Validate path is within artifacts directory before allowing download
-            if run["output_path"]:
-                output_path = Path(run["output_path"])
-                artifacts_dir = Path("artifacts").resolve()
-                try:
-                    resolved_path = output_path.resolve()
-                    if (
-                        resolved_path.is_relative_to(artifacts_dir)
-                        and resolved_path.exists()
-                    ):
-                        with open(resolved_path, "rb") as f:
-                            st.download_button(
-                                "⬇ Download",
-                                data=f.read(),
-                                file_name=resolved_path.name,
-                                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                                key=f"download_history_{run['id']}",
-                            )
-                except (ValueError, OSError):
-                    # Path validation failed or file not accessible
-                    pass
+                except (TypeError, ValueError):
+                    lines.append("**QA:** (malformed data)")
+            elif scores:
+                lines.append("**QA:** (malformed data)")
+            # One markdown element per run instead of one per line
+            st.markdown("\n\n".join(lines))
+
+            # Path validation and the read both wait until the user asks for
+            # the deck, so reruns don't touch the filesystem for every row.
+            if run["output_path"] and st.checkbox(
+                "Prepare download", key=f"prepare_download_{run['id']}"
+            ):
+                resolved_path = _resolve_artifact_path(run["output_path"])
+                data = _read_pptx(str(resolved_path)) if resolved_path else None
+                if data is None:
+                    st.caption("PPTX file is no longer available")
+                else:
+                    st.download_button(
+                        "⬇ Download",
+                        data=data,
+                        file_name=resolved_path.name,
+                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                        key=f"download_history_{run['id']}",
+                    )
 
 
 def display_run_outline(outline: dict):
@@ -736,22 +913,32 @@ def display_run_outline(outline: dict):
     with col2:
         st.write(f"**Level:** {outline.get('educational_level', 'N/A')}")
 
+    blocks = []
     if outline.get("learning_objectives"):
-        st.write("**Learning Objectives:**")
-        for obj in outline["learning_objectives"]:
-            st.write(
+        blocks.append(
+            "**Learning Objectives:**\n"
+            + "\n".join(
                 f"- {obj.get('objective', 'N/A')} ({obj.get('bloom_level', 'N/A')})"
+                for obj in outline["learning_objectives"]
             )
+        )
 
     if outline.get("prerequisite_knowledge"):
-        st.write("**Prerequisites:**")
-        for prereq in outline["prerequisite_knowledge"]:
-            st.write(f"- {prereq}")
+        blocks.append(
+            "**Prerequisites:**\n"
+            + "\n".join(f"- {prereq}" for prereq in outline["prerequisite_knowledge"])
+        )
 
     if outline.get("sections"):
-        st.write("**Sections:**")
-        for i, section in enumerate(outline["sections"], 1):
-            st.write(f"{i}. {section}")
+        blocks.append(
+            "**Sections:**\n"
+            + "\n".join(
+                f"{i}. {section}" for i, section in enumerate(outline["sections"], 1)
+            )
+        )
+
+    if blocks:
+        st.markdown("\n\n".join(blocks))
 
 
 def display_run_slides(content: list):
@@ -762,21 +949,25 @@ def display_run_slides(content: list):
 
     for i, slide in enumerate(content, 1):
         with st.expander(f"Slide {i}: {slide.get('title', 'Untitled')}"):
-            st.write(f"**Title:** {slide.get('title', 'N/A')}")
+            blocks = [f"**Title:** {slide.get('title', 'N/A')}"]
 
             if slide.get("bullets"):
-                st.write("**Content:**")
-                for bullet in slide["bullets"]:
-                    st.write(f"• {bullet}")
+                # Trailing double spaces keep each bullet on its own line
+                blocks.append(
+                    "**Content:**  \n"
+                    + "  \n".join(f"• {bullet}" for bullet in slide["bullets"])
+                )
 
             if slide.get("speaker_notes"):
-                st.write("**Speaker Notes:**")
-                st.write(slide["speaker_notes"])
+                blocks.append(f"**Speaker Notes:**\n\n{slide['speaker_notes']}")
 
             if slide.get("citations"):
-                st.write("**Citations:**")
-                for citation in slide["citations"]:
-                    st.write(f"- {citation}")
+                blocks.append(
+                    "**Citations:**\n"
+                    + "\n".join(f"- {citation}" for citation in slide["citations"])
+                )
+
+            st.markdown("\n\n".join(blocks))
 
 
 def display_run_research(research: dict):
@@ -785,20 +976,17 @@ def display_run_research(research: dict):
         st.info("No research data available")
         return
 
-    if research.get("claims"):
-        st.write("**Claims Found:**")
-        for claim in research["claims"]:
-            st.write(f"- {claim}")
-
-    if research.get("evidences"):
-        st.write("**Evidence:**")
-        for evidence in research["evidences"]:
-            st.write(f"- {evidence}")
-
-    if research.get("citations"):
-        st.write("**Citations:**")
-        for citation in research["citations"]:
-            st.write(f"- {citation}")
+    blocks = [
+        f"**{label}:**\n" + "\n".join(f"- {item}" for item in research[key])
+        for key, label in (
+            ("claims", "Claims Found"),
+            ("evidences", "Evidence"),
+            ("citations", "Citations"),
+        )
+        if research.get(key)
+    ]
+    if blocks:
+        st.markdown("\n\n".join(blocks))
 
 
 def display_run_qa(qa_scores: dict, qa_feedback: str):
@@ -812,31 +1000,35 @@ def display_run_qa(qa_scores: dict, qa_feedback: str):
         with col3:
             st.metric("Coherence", f"{qa_scores.get('coherence', 0):.1f}/5.0")
 
-    st.write("**Feedback:**")
-    st.write(qa_feedback or "No feedback available")
+    st.markdown(f"**Feedback:**\n\n{qa_feedback or 'No feedback available'}")
 
 
 def display_run_download(output_path: str, run_id: int):
     """Display download button for run PPTX."""
-    if not output_path or not Path(output_path).exists():
+    data = _read_pptx(output_path)
+    if data is None:
         st.warning("PPTX file is no longer available")
         return
 
-    with open(output_path, "rb") as f:
-        st.download_button(
-            "⬇ Download PPTX",
-            data=f.read(),
-            file_name=Path(output_path).name,
-            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        )
+    st.download_button(
+        "⬇ Download PPTX",
+        data=data,
+        file_name=Path(output_path).name,
+        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_run_option(run_id: int, user_input: str, created_at: str) -> str:
+    """Label for a run in the history selector; rows are immutable once listed."""
+    return f"Run #{run_id}: {user_input[:40]}... ({created_at[:10]})"
 
 
 def tab_run_history():
     """Tab to view detailed history of all previous runs."""
     st.markdown("## 📚 Run History")
 
-    cp = CheckpointManager()
-    runs = cp.list_runs(limit=100)
+    runs = _list_runs_cached(None, 100)
 
     if not runs:
         st.info("No previous runs yet. Generate a presentation to see history!")
@@ -844,8 +1036,7 @@ def tab_run_history():
 
     # Run selector
     run_options = [
-        f"Run #{r['id']}: {r['input'][:40] if len(r['input']) > 40 else r['input']}... ({r['created_at'][:10]})"
-        for r in runs
+        _format_run_option(r["id"], r["input"], r["created_at"]) for r in runs
     ]
     selected_idx = st.selectbox(
         "Select a run to view:", range(len(runs)), format_func=lambda i: run_options[i]
@@ -853,7 +1044,7 @@ def tab_run_history():
     selected_run = runs[selected_idx]
 
     # Load full run details
-    run_details = cp.get_run_details(selected_run["id"])
+    run_details = _run_details_cached(None, selected_run["id"])
 
     if not run_details:
         st.error("Could not load run details")
@@ -893,538 +1084,604 @@ def tab_run_history():
         display_run_download(run_details.get("output_path"), run_details["id"])
 
 
-def main() -> None:
-    st.set_page_config(
-        page_title="PPTX Agent - Full Featured",
-        layout="wide",
-        initial_sidebar_state="expanded",
-    )
+_PIPELINE_PHASE_LABELS: dict[str, str] = {
+    "outline": "Brainstorming outline",
+    "research": "Researching evidence",
+    "content": "Writing slide content",
+    "design": "Building PowerPoint file",
+    "qa": "Reviewing quality",
+}
 
-    # Sidebar configuration
-    display_model_configuration()
-    display_run_history()
 
-    # Main header
-    st.title("🎨 PPTX Agent - Complete Interface")
+def _run_pipeline_with_status(pipeline, *args, **kwargs) -> PipelineState:
+    """Run a pipeline on a worker thread, showing the current phase in st.status.
+
+    The pipeline reports phases through its ``on_phase`` callback into a
+    queue; Streamlit calls stay on the script thread, which polls the queue.
+    """
+    phases: queue.Queue[str] = queue.Queue()
+    with st.status("Starting pipeline...", expanded=False) as status:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(pipeline, *args, on_phase=phases.put, **kwargs)
+            while True:
+                try:
+                    phase = phases.get(timeout=0.2)
+                except queue.Empty:
+                    if future.done():
+                        break
+                    continue
+                status.update(label=f"{_PIPELINE_PHASE_LABELS.get(phase, phase)}...")
+            try:
+                state = future.result()
+            except Exception:
+                status.update(label="Pipeline failed", state="error")
+                raise
+        status.update(label="Pipeline finished", state="complete")
+    return state
+
 
-    # Mode selection
-    mode_tab1, mode_tab2, mode_tab3, mode_tab4, mode_tab5 = st.tabs(
-        [
-            "🚀 Quick Generate",
-            "🔧 Step-by-Step",
-            "⚙️ Settings",
-            "📖 Documentation",
-            "📚 Run History",
-        ]
+@st.fragment
+def _quick_generate_tab() -> None:
+    """Quick Generate tab; widget interactions rerun only this tab."""
+    st.markdown(
+        "Generate a presentation in one click. The system will run all agents "
+        "automatically and create a PowerPoint file."
     )
 
-    # ==================== TAB 1: QUICK GENERATE ====================
-    with mode_tab1:
-        st.markdown(
-            "Generate a presentation in one click. The system will run all agents "
-            "automatically and create a PowerPoint file."
+    # Pipeline selection
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        user_input = st.text_area(
+            "Presentation Topic / Brief *",
+            value="Benefits of renewable energy for urban communities",
+            height=100,
+            help="Describe your presentation topic. Be specific for best results.",
+            placeholder="Example: Climate change mitigation strategies for coastal cities",
         )
 
-        # Pipeline selection
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            user_input = st.text_area(
-                "Presentation Topic / Brief *",
-                value="Benefits of renewable energy for urban communities",
-                height=100,
-                help="Describe your presentation topic. Be specific for best results.",
-                placeholder="Example: Climate change mitigation strategies for coastal cities",
-            )
+    with col2:
+        use_langgraph = st.checkbox(
+            "Use LangGraph",
+            value=False,
+            help="Use LangGraph StateGraph implementation (experimental)",
+        )
 
-        with col2:
-            use_langgraph = st.checkbox(
-                "Use LangGraph",
-                value=False,
-                help="Use LangGraph StateGraph implementation (experimental)",
-            )
+        show_details = st.checkbox(
+            "Show Details",
+            value=True,
+            help="Show outline, research, and content preview",
+        )
 
-            show_details = st.checkbox(
-                "Show Details",
-                value=True,
-                help="Show outline, research, and content preview",
-            )
+    # Educational mode toggle
+    educational_mode = display_educational_toggle()
 
-        # Educational mode toggle
-        educational_mode = display_educational_toggle()
+    # Template selection
+    st.markdown("---")
+    use_template = st.checkbox(
+        "📐 Use Design Template",
+        value=False,
+        help="Apply a visual design template to the presentation",
+    )
 
-        # Template selection
-        st.markdown("---")
-        use_template = st.checkbox(
-            "📐 Use Design Template",
-            value=False,
-            help="Apply a visual design template to the presentation",
-        )
+    selected_template = None
+    if use_template:
+        try:
+            templates = list_available_templates()
 
-        selected_template = None
-        if use_template:
+            if templates:
+                selected_template = st.selectbox(
+                    "Select Template",
+                    options=["None (Plain)"] + templates,
+                    help="Choose a template design for your presentation",
+                )
+                if selected_template == "None (Plain)":
+                    selected_template = None
+            else:
+                st.warning(
+                    "No templates available. Run `python scripts/create_default_templates.py` or upload templates in Settings."
+                )
+        except Exception as e:
+            st.error(f"Error loading templates: {e}")
+
+    # Validation
+    topic = user_input.strip()
+    input_valid = len(topic) >= 10
+    if topic and not input_valid:
+        st.warning("⚠️ Topic must be at least 10 characters long.")
+
+    # Generate button
+    if st.button(
+        "▶ Generate Presentation",
+        type="primary",
+        disabled=not input_valid,
+        use_container_width=True,
+        key="quick_generate",
+    ):
+        with st.spinner("⏳ Generating presentation... This may take 30-60 seconds."):
             try:
-                from src.tools.template_manager import TemplateManager
-
-                tm = TemplateManager()
-                templates = tm.list_templates()
-
-                if templates:
-                    selected_template = st.selectbox(
-                        "Select Template",
-                        options=["None (Plain)"] + templates,
-                        help="Choose a template design for your presentation",
+                # Run pipeline with educational mode and template
+                if use_langgraph:
+                    from src.graph.langgraph_impl import (
+                        run_langgraph_pipeline as pipeline,
                     )
-                    if selected_template == "None (Plain)":
-                        selected_template = None
                 else:
-                    st.warning(
-                        "No templates available. Run `python scripts/create_default_templates.py` or upload templates in Settings."
-                    )
+                    from src.graph.build_graph import run_pipeline as pipeline
+
+                state = _run_pipeline_with_status(
+                    pipeline,
+                    topic,
+                    educational_mode=educational_mode,
+                    template_name=selected_template,
+                )
+
+                st.session_state["last_state"] = state
+                # A new run was recorded; refresh cached history and redraw the
+                # whole app so the sidebar lists it. The results below render
+                # from session state, so they survive the rerun.
+                _list_runs_cached.clear()
+                _run_details_cached.clear()
             except Exception as e:
-                st.error(f"Error loading templates: {e}")
+                st.session_state.pop("last_state", None)
+                st.error(f"❌ **Exception occurred:**\n\n{str(e)}")
+                import traceback
 
-        # Validation
-        input_valid = len(user_input.strip()) >= 10
-        if not input_valid and user_input:
-            st.warning("⚠️ Topic must be at least 10 characters long.")
+                with st.expander("🐛 Debug Traceback"):
+                    st.code(traceback.format_exc())
+            else:
+                st.rerun(scope="app")
 
-        # Generate button
-        if st.button(
-            "▶ Generate Presentation",
-            type="primary",
-            disabled=not input_valid,
-            use_container_width=True,
-            key="quick_generate",
-        ):
-            with st.spinner(
-                "⏳ Generating presentation... This may take 30-60 seconds."
-            ):
-                try:
-                    # Run pipeline with educational mode and template
-                    if use_langgraph:
-                        state = run_langgraph_pipeline(
-                            user_input, educational_mode=educational_mode
-                        )
-                        # Set template for langgraph if selected
-                        if selected_template:
-                            state.template_name = selected_template
-                    else:
-                        state = run_pipeline(
-                            user_input,
-                            educational_mode=educational_mode,
-                            template_name=selected_template,
-                        )
+    last_state = st.session_state.get("last_state")
+    if last_state is not None:
+        _display_quick_generate_results(last_state, show_details)
 
-                    # Store in session state
-                    st.session_state["last_state"] = state
 
-                    if state.errors:
-                        st.error(
-                            "❌ **Errors occurred:**\n\n" + "\n".join(state.errors)
-                        )
-                    else:
-                        st.success("✅ **Presentation generated successfully!**")
-
-                        # Show details if requested
-                        if show_details:
-                            st.markdown("---")
-
-                            # Outline with pedagogical elements
-                            if state.outline:
-                                with st.expander("📝 Outline", expanded=False):
-                                    st.markdown(f"**Topic:** {state.outline.topic}")
-                                    st.markdown(
-                                        f"**Audience:** {state.outline.audience}"
-                                    )
-
-                                    # Show learning objectives if present (educational mode)
-                                    if (
-                                        hasattr(state.outline, "learning_objectives")
-                                        and state.outline.learning_objectives
-                                    ):
-                                        st.markdown("")
-                                        display_learning_objectives(state.outline)
-                                        st.markdown("")
-
-                                    # Show prerequisite knowledge if present
-                                    if (
-                                        hasattr(state.outline, "prerequisite_knowledge")
-                                        and state.outline.prerequisite_knowledge
-                                    ):
-                                        st.markdown("")
-                                        display_prerequisite_knowledge(state.outline)
-                                        st.markdown("")
-
-                                    st.markdown("**Sections:**")
-                                    for i, section in enumerate(
-                                        state.outline.sections, 1
-                                    ):
-                                        st.markdown(f"{i}. {section}")
-
-                            # Research
-                            display_research_results(state)
-
-                            # Content - use pedagogical preview if educational mode
-                            if educational_mode:
-                                display_pedagogical_content_preview(state)
-                            else:
-                                display_content_preview(state)
-
-                        # QA Report - use pedagogical dashboard if educational mode
-                        st.markdown("---")
-                        if educational_mode:
-                            display_pedagogical_qa_dashboard(state)
-                        else:
-                            display_qa_report(state)
-
-                        # Download
-                        if state.pptx_path and Path(state.pptx_path).exists():
-                            st.markdown("---")
-                            with open(state.pptx_path, "rb") as f:
-                                data = f.read()
-
-                            col1, col2, col3 = st.columns([2, 1, 1])
-                            with col1:
-                                st.download_button(
-                                    label="⬇ Download PowerPoint",
-                                    data=data,
-                                    file_name=Path(state.pptx_path).name,
-                                    mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                                    type="primary",
-                                    use_container_width=True,
-                                )
-                            with col2:
-                                file_size = len(data) / 1024
-                                st.metric("File Size", f"{file_size:.1f} KB")
-                            with col3:
-                                st.metric(
-                                    "Slides", len(state.content) if state.content else 0
-                                )
-
-                            st.caption(f"💾 Saved to: `{state.pptx_path}`")
-
-                except Exception as e:
-                    st.error(f"❌ **Exception occurred:**\n\n{str(e)}")
-                    import traceback
-
-                    with st.expander("🐛 Debug Traceback"):
-                        st.code(traceback.format_exc())
-
-    # ==================== TAB 2: STEP-BY-STEP ====================
-    with mode_tab2:
-        st.markdown(
-            "Execute each agent individually and review outputs before proceeding. "
-            "This gives you full control over the generation process."
-        )
+def _display_quick_generate_results(state: PipelineState, show_details: bool) -> None:
+    """Show the outcome of the last Quick Generate run."""
+    if state.errors:
+        st.error("❌ **Errors occurred:**\n\n" + "\n".join(state.errors))
+    else:
+        st.success("✅ **Presentation generated successfully!**")
+
+        # Show details if requested
+        if show_details:
+            st.markdown("---")
+
+            # Outline with pedagogical elements
+            if state.outline:
+                with st.expander("📝 Outline", expanded=False):
+                    st.markdown(f"**Topic:** {state.outline.topic}")
+                    st.markdown(f"**Audience:** {state.outline.audience}")
+
+                    # Show learning objectives if present (educational mode)
+                    if state.outline.learning_objectives:
+                        st.markdown("")
+                        display_learning_objectives(state.outline)
+                        st.markdown("")
+
+                    # Show prerequisite knowledge if present
+                    if state.outline.prerequisite_knowledge:
+                        st.markdown("")
+                        display_prerequisite_knowledge(state.outline)
+                        st.markdown("")
 
-        # Initialize session state
-        if "step_state" not in st.session_state:
-            st.session_state["step_state"] = PipelineState(user_input="")
-
-        step_state: PipelineState = st.session_state["step_state"]
-
-        # Input
-        st.markdown("**Step 0: Input**")
-        step_input = st.text_area(
-            "Topic / Brief",
-            value=(
-                step_state.user_input
-                if step_state.user_input
-                else "Climate change mitigation strategies"
-            ),
-            height=80,
-            key="step_input",
-        )
+                    st.markdown(
+                        "**Sections:**\n"
+                        + "\n".join(
+                            f"{i}. {section}"
+                            for i, section in enumerate(state.outline.sections, 1)
+                        )
+                    )
 
-        # Educational mode toggle for step-by-step
-        step_educational_mode = st.checkbox(
-            "🎓 Educational Mode",
-            value=(
-                step_state.educational_mode
-                if hasattr(step_state, "educational_mode")
-                else False
-            ),
-            key="step_educational_mode",
-            help="Generate with learning objectives and pedagogical elements",
-        )
+            # Research
+            display_research_results(state)
 
-        if st.button("✅ Set Input", key="set_input"):
-            step_state.user_input = step_input
-            step_state.educational_mode = step_educational_mode
-            st.session_state["step_state"] = step_state
-            st.success("Input set!")
+            # Content - use pedagogical preview if educational mode
+            if state.educational_mode:
+                display_pedagogical_content_preview(state)
+            else:
+                display_content_preview(state)
 
+        # QA Report - use pedagogical dashboard if educational mode
         st.markdown("---")
+        if state.educational_mode:
+            display_pedagogical_qa_dashboard(state)
+        else:
+            display_qa_report(state)
+
+        # Download
+        data = _read_pptx(state.pptx_path)
+        if data is not None:
+            st.markdown("---")
+
+            col1, col2, col3 = st.columns([2, 1, 1])
+            with col1:
+                st.download_button(
+                    label="⬇ Download PowerPoint",
+                    data=data,
+                    file_name=Path(state.pptx_path).name,
+                    mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    type="primary",
+                    use_container_width=True,
+                )
+            with col2:
+                file_size = len(data) / 1024
+                st.metric("File Size", f"{file_size:.1f} KB")
+            with col3:
+                st.metric("Slides", len(state.content) if state.content else 0)
 
-        # Step 1: Brainstorm
-        step_state = display_phase_section(
-            step_number=1,
-            phase_name="Brainstorm",
-            phase_key="brainstorm",
-            run_func=run_brainstorm,
-            run_with_extras_func=run_brainstorm,  # Using run_func directly
-            state=step_state,
-            can_run=bool(step_state.user_input),
-            has_content_check=False,
-            content_check=False,
-        )
+            st.caption(f"💾 Saved to: `{state.pptx_path}`")
 
-        if step_state.outline:
-            # Use educational outline editor if educational mode
-            if step_state.educational_mode:
-                step_state = display_educational_outline_editor(step_state)
-            else:
-                step_state = display_outline_editor(step_state)
 
-            # Add regenerate button for edited outline
-            col1, col2 = st.columns([3, 1])
-            with col2:
-                if st.button(
-                    "🔄 Regenerate with Edits",
-                    key="regen_brainstorm_edits",
-                    type="secondary",
-                ):
-                    with st.spinner("Regenerating based on your edits..."):
-                        step_state = run_brainstorm(step_state)
-                        st.session_state["step_state"] = step_state
-                        st.success("Outline regenerated from your edits!")
-                        st.rerun()
+@st.fragment
+def _step_by_step_tab() -> None:
+    """Step-by-Step tab; widget interactions rerun only this tab."""
+    st.markdown(
+        "Execute each agent individually and review outputs before proceeding. "
+        "This gives you full control over the generation process."
+    )
 
-            st.session_state["step_state"] = step_state
+    # Initialize session state
+    if "step_state" not in st.session_state:
+        st.session_state["step_state"] = PipelineState(user_input="")
+
+    # Editors mutate this object in place, so only handlers that replace it
+    # (phase runs, reset) need to write it back to session_state.
+    step_state: PipelineState = st.session_state["step_state"]
+
+    # Input
+    st.markdown("**Step 0: Input**")
+    step_input = st.text_area(
+        "Topic / Brief",
+        value=(
+            step_state.user_input
+            if step_state.user_input
+            else "Climate change mitigation strategies"
+        ),
+        height=80,
+        key="step_input",
+    )
 
-        st.markdown("---")
+    # Educational mode toggle for step-by-step
+    step_educational_mode = st.checkbox(
+        "🎓 Educational Mode",
+        value=step_state.educational_mode,
+        key="step_educational_mode",
+        help="Generate with learning objectives and pedagogical elements",
+    )
 
-        # Step 2: Research
-        step_state = display_phase_section(
-            step_number=2,
-            phase_name="Research",
-            phase_key="research",
-            run_func=run_research,
-            run_with_extras_func=run_research,
-            state=step_state,
-            can_run=bool(step_state.outline),
-            has_content_check=False,
-            content_check=False,
-        )
+    if st.button("✅ Set Input", key="set_input"):
+        step_state.user_input = step_input
+        step_state.educational_mode = step_educational_mode
+        st.session_state["step_state"] = step_state
+        st.success("Input set!")
+
+    st.markdown("---")
+
+    # Phase prerequisites. The state only changes through button handlers
+    # that end in st.rerun(), so these hold for the rest of this run.
+    has_input = bool(step_state.user_input)
+    has_outline = bool(step_state.outline)
+    has_content = bool(step_state.content)
+    research_completed = bool(getattr(step_state, "research_completed", False))
+    # One cached read serves both the "file created" notice and the download
+    pptx_data = _read_pptx(step_state.pptx_path)
+
+    # Step 1: Brainstorm
+    step_state = display_phase_section(
+        step_number=1,
+        phase_name="Brainstorm",
+        phase_key="brainstorm",
+        run_func=_lazy_agent("brainstorm"),
+        run_with_extras_func=_lazy_agent("brainstorm"),  # Using run_func directly
+        state=step_state,
+        can_run=has_input,
+        has_content_check=False,
+        content_check=False,
+    )
 
-        if hasattr(step_state, "claims"):
-            display_research_results(step_state)
+    if step_state.outline:
+        # Use educational outline editor if educational mode
+        if step_state.educational_mode:
+            step_state = display_educational_outline_editor(step_state)
+        else:
+            step_state = display_outline_editor(step_state)
 
-        st.markdown("---")
+        # Add regenerate button for edited outline
+        col1, col2 = st.columns([3, 1])
+        with col2:
+            if st.button(
+                "🔄 Regenerate with Edits",
+                key="regen_brainstorm_edits",
+                type="secondary",
+            ):
+                with st.spinner("Regenerating based on your edits..."):
+                    step_state = _get_agent("brainstorm")(step_state, use_cache=False)
+                    st.session_state["step_state"] = step_state
+                    st.success("Outline regenerated from your edits!")
+                    st.rerun()
+
+    st.markdown("---")
+
+    # Step 2: Research
+    step_state = display_phase_section(
+        step_number=2,
+        phase_name="Research",
+        phase_key="research",
+        run_func=_lazy_agent("research"),
+        run_with_extras_func=_lazy_agent("research"),
+        state=step_state,
+        can_run=has_outline,
+        has_content_check=False,
+        content_check=False,
+    )
 
-        # Step 3: Content
-        research_completed = bool(getattr(step_state, "research_completed", False))
-        step_state = display_phase_section(
-            step_number=3,
-            phase_name="Content",
-            phase_key="content",
-            run_func=run_content,
-            run_with_extras_func=run_content,
-            state=step_state,
-            can_run=bool(step_state.outline) and research_completed,
-            has_content_check=False,
-            content_check=False,
+    display_research_results(step_state)
+
+    st.markdown("---")
+
+    # Step 3: Content
+    step_state = display_phase_section(
+        step_number=3,
+        phase_name="Content",
+        phase_key="content",
+        run_func=_lazy_agent("content"),
+        run_with_extras_func=_lazy_agent("content"),
+        state=step_state,
+        can_run=has_outline and research_completed,
+        has_content_check=False,
+        content_check=False,
+    )
+
+    if step_state.content:
+        # Use pedagogical preview if educational mode
+        if step_state.educational_mode:
+            display_pedagogical_content_preview(step_state)
+        else:
+            step_state = display_content_preview(step_state)
+
+    st.markdown("---")
+
+    # Step 4: Design
+    step_state = display_phase_section(
+        step_number=4,
+        phase_name="Design",
+        phase_key="design",
+        run_func=_lazy_agent("design"),
+        run_with_extras_func=_lazy_agent("design"),
+        state=step_state,
+        can_run=has_content,
+        has_content_check=True,
+        content_check=has_content,
+    )
+
+    if pptx_data is not None:
+        st.info(f"✅ PPTX file created: `{step_state.pptx_path}`")
+
+    st.markdown("---")
+
+    # Step 5: QA
+    step_state = display_phase_section(
+        step_number=5,
+        phase_name="QA",
+        phase_key="qa",
+        run_func=_lazy_agent("qa"),
+        run_with_extras_func=_lazy_agent("qa"),
+        state=step_state,
+        can_run=has_content,
+        has_content_check=True,
+        content_check=has_content,
+    )
+
+    if step_state.qa_report:
+        # Use pedagogical dashboard if educational mode
+        if step_state.educational_mode:
+            display_pedagogical_qa_dashboard(step_state)
+        else:
+            display_qa_report(step_state)
+
+    st.markdown("---")
+
+    # Final download
+    if pptx_data is not None:
+        st.download_button(
+            label="⬇ Download Final Presentation",
+            data=pptx_data,
+            file_name=Path(step_state.pptx_path).name,
+            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            type="primary",
+            use_container_width=True,
+            key="step_download",
         )
 
-        if step_state.content:
-            # Use pedagogical preview if educational mode
-            if step_state.educational_mode:
-                display_pedagogical_content_preview(step_state)
-            else:
-                step_state = display_content_preview(step_state)
+    # Run everything that is still missing in one go
+    if st.button(
+        "⏩ Run All Remaining",
+        key="run_all_remaining",
+        disabled=not step_state.user_input,
+    ):
+        with st.spinner("Running remaining phases..."):
+            step_state = run_sync(_run_remaining_async(step_state))
             st.session_state["step_state"] = step_state
+            st.success("Remaining phases completed!")
+            st.rerun()
 
-        st.markdown("---")
+    # Reset button
+    if st.button("🔄 Reset All Steps", key="reset_steps"):
+        st.session_state["step_state"] = PipelineState(user_input="")
+        st.success("Reset completed!")
+        st.rerun()
 
-        # Step 4: Design
-        step_state = display_phase_section(
-            step_number=4,
-            phase_name="Design",
-            phase_key="design",
-            run_func=run_design,
-            run_with_extras_func=run_design,
-            state=step_state,
-            can_run=bool(step_state.content),
-            has_content_check=True,
-            content_check=bool(step_state.content),
-        )
 
-        if step_state.pptx_path and Path(step_state.pptx_path).exists():
-            st.info(f"✅ PPTX file created: `{step_state.pptx_path}`")
+@st.fragment
+def _settings_tab() -> None:
+    """Settings tab; widget interactions rerun only this tab."""
+    display_settings_ui()
 
-        st.markdown("---")
 
-        # Step 5: QA
-        step_state = display_phase_section(
-            step_number=5,
-            phase_name="QA",
-            phase_key="qa",
-            run_func=run_qa,
-            run_with_extras_func=run_qa,
-            state=step_state,
-            can_run=bool(step_state.content),
-            has_content_check=True,
-            content_check=bool(step_state.content),
-        )
+@st.fragment
+def _run_history_tab() -> None:
+    """Run History tab; selecting a run reruns only this tab."""
+    tab_run_history()
 
-        if step_state.qa_report:
-            # Use pedagogical dashboard if educational mode
-            if step_state.educational_mode:
-                display_pedagogical_qa_dashboard(step_state)
-            else:
-                display_qa_report(step_state)
 
-        st.markdown("---")
+# Static Documentation tab text, around the live configuration list
+_DOCS_INTRO_MD = """\
+## 📖 PPTX Agent Documentation
 
-        # Final download
-        if step_state.pptx_path and Path(step_state.pptx_path).exists():
-            with open(step_state.pptx_path, "rb") as f:
-                data = f.read()
-            st.download_button(
-                label="⬇ Download Final Presentation",
-                data=data,
-                file_name=Path(step_state.pptx_path).name,
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                type="primary",
-                use_container_width=True,
-                key="step_download",
-            )
+### Architecture
 
-        # Reset button
-        if st.button("🔄 Reset All Steps", key="reset_steps"):
-            st.session_state["step_state"] = PipelineState(user_input="")
-            st.success("Reset completed!")
-            st.rerun()
+The PPTX Agent uses a multi-agent architecture with 5 specialized agents:
+
+1. **Brainstorm Agent** (uses LLM)
+   - Generates presentation outline
+   - Identifies topic and target audience
+   - Creates 3-7 logical sections
+
+2. **Research Agent** (no LLM - local search)
+   - Extracts factual claims
+   - Searches local corpus for evidence
+   - Generates citation markers
+
+3. **Content Agent** (uses LLM)
+   - Generates slide content
+   - Creates bullets and speaker notes
+   - Includes citations
+
+4. **Design Agent** (no LLM - python-pptx)
+   - Assembles PowerPoint file
+   - Adds references slide
+   - Saves to artifacts/
+
+5. **QA Agent** (uses LLM)
+   - Evaluates content, design, coherence
+   - Provides actionable feedback
+   - Scores on 1-5 scale
+
+### Configuration
+
+**File:** `ai_config.properties` (in project root)
+
+**Providers:**
+- `mock`: Offline deterministic mode (for testing)
+- `ollama`: Local AI models via Ollama
+- `openrouter`: Cloud AI via OpenRouter API
+
+**Agent-Specific Settings:**
+```properties
+agent.brainstorm.temperature=0.8  # More creative
+agent.content.temperature=0.7     # Balanced
+agent.qa.temperature=0.2          # More objective
+```
+
+### Current Configuration
+"""
 
-    # ==================== TAB 3: SETTINGS ====================
-    with mode_tab3:
-        display_settings_ui()
+_DOCS_REFERENCE_MD = """\
+### Quality Scores
 
-    # ==================== TAB 4: DOCUMENTATION ====================
-    with mode_tab4:
-        st.markdown("""
-        ## 📖 PPTX Agent Documentation
+QA Agent evaluates presentations on three dimensions:
 
-        ### Architecture
-
-        The PPTX Agent uses a multi-agent architecture with 5 specialized agents:
-
-        1. **Brainstorm Agent** (uses LLM)
-           - Generates presentation outline
-           - Identifies topic and target audience
-           - Creates 3-7 logical sections
-
-        2. **Research Agent** (no LLM - local search)
-           - Extracts factual claims
-           - Searches local corpus for evidence
-           - Generates citation markers
-
-        3. **Content Agent** (uses LLM)
-           - Generates slide content
-           - Creates bullets and speaker notes
-           - Includes citations
-
-        4. **Design Agent** (no LLM - python-pptx)
-           - Assembles PowerPoint file
-           - Adds references slide
-           - Saves to artifacts/
-
-        5. **QA Agent** (uses LLM)
-           - Evaluates content, design, coherence
-           - Provides actionable feedback
-           - Scores on 1-5 scale
-
-        ### Configuration
-
-        **File:** `ai_config.properties` (in project root)
-
-        **Providers:**
-        - `mock`: Offline deterministic mode (for testing)
-        - `ollama`: Local AI models via Ollama
-        - `openrouter`: Cloud AI via OpenRouter API
-
-        **Agent-Specific Settings:**
-        ```properties
-        agent.brainstorm.temperature=0.8  # More creative
-        agent.content.temperature=0.7     # Balanced
-        agent.qa.temperature=0.2          # More objective
-        ```
-
-        ### Current Configuration
-        """)
-
-        ai_config = get_ai_config()
-        ai = get_ai_interface()
-        config_display = {
-            "Provider": ai_config.get_provider(),
-            "Brainstorm Model": ai.get_model_info("brainstorm")["model"],
-            "Content Model": ai.get_model_info("content")["model"],
-            "QA Model": ai.get_model_info("qa")["model"],
-        }
-
-        for key, value in config_display.items():
-            st.markdown(f"- **{key}:** `{value}`")
-
-        st.markdown("""
-        ### Quality Scores
-
-        QA Agent evaluates presentations on three dimensions:
-
-        - **Content Score (1-5):** Informativeness, specificity, citations
-        - **Design Score (1-5):** Clarity, formatting, visual hierarchy
-        - **Coherence Score (1-5):** Logical flow, narrative arc
-
-        **Score Guide:**
-        - 5.0: Excellent, publication-ready
-        - 4.0: Good, minor improvements
-        - 3.0: Acceptable, some revisions
-        - 2.0: Below standards
-        - 1.0: Poor, redesign needed
-
-        ### Tips for Best Results
-
-        1. **Be Specific:** Include target audience and scope in your topic
-        2. **Review Outline:** Edit sections before generating content
-        3. **Check Citations:** Ensure claims are supported by evidence
-        4. **Iterate:** Use QA feedback to improve
-        5. **Choose Right Provider:**
-           - `mock`: Fast testing (deterministic)
-           - `ollama`: Local, private, free
-           - `openrouter`: Cloud, powerful, costs money
-
-        ### Keyboard Shortcuts
-
-        - `Ctrl+Enter`: Submit form
-        - `Tab`: Navigate between fields
-        - `Ctrl+R`: Reload configuration
-
-        ### Troubleshooting
-
-        **Issue: Low QA scores**
-        - Make topic more specific
-        - Ensure local corpus has relevant content
-        - Try different model/temperature settings
-
-        **Issue: No citations found**
-        - Add relevant documents to `corpus/` folder
-        - Check that documents are indexed
-        - Research agent only searches local files
-
-        **Issue: Slow generation**
-        - Use `mock` provider for testing
-        - Reduce `max_tokens` in config
-        - Use smaller Ollama models (e.g., llama3:7b)
-
-        ### Support
-
-        - Documentation: `AI_ARCHITECTURE.md`
-        - Testing Guide: `COMPREHENSIVE_AGENT_TESTING.md`
-        - Config Help: `ai_config.properties` (comments)
-        """)
-
-    # ==================== TAB 5: RUN HISTORY ====================
-    with mode_tab5:
-        tab_run_history()
+- **Content Score (1-5):** Informativeness, specificity, citations
+- **Design Score (1-5):** Clarity, formatting, visual hierarchy
+- **Coherence Score (1-5):** Logical flow, narrative arc
+
+**Score Guide:**
+- 5.0: Excellent, publication-ready
+- 4.0: Good, minor improvements
+- 3.0: Acceptable, some revisions
+- 2.0: Below standards
+- 1.0: Poor, redesign needed
+
+### Tips for Best Results
+
+1. **Be Specific:** Include target audience and scope in your topic
+2. **Review Outline:** Edit sections before generating content
+3. **Check Citations:** Ensure claims are supported by evidence
+4. **Iterate:** Use QA feedback to improve
+5. **Choose Right Provider:**
+   - `mock`: Fast testing (deterministic)
+   - `ollama`: Local, private, free
+   - `openrouter`: Cloud, powerful, costs money
+
+### Keyboard Shortcuts
+
+- `Ctrl+Enter`: Submit form
+- `Tab`: Navigate between fields
+- `Ctrl+R`: Reload configuration
+
+### Troubleshooting
+
+**Issue: Low QA scores**
+- Make topic more specific
+- Ensure local corpus has relevant content
+- Try different model/temperature settings
+
+**Issue: No citations found**
+- Add relevant documents to `corpus/` folder
+- Check that documents are indexed
+- Research agent only searches local files
+
+**Issue: Slow generation**
+- Use `mock` provider for testing
+- Reduce `max_tokens` in config
+- Use smaller Ollama models (e.g., llama3:7b)
+
+### Support
+
+- Documentation: `AI_ARCHITECTURE.md`
+- Testing Guide: `COMPREHENSIVE_AGENT_TESTING.md`
+- Config Help: `ai_config.properties` (comments)
+"""
+
+
+def _documentation_tab(snapshot: _AISnapshot) -> None:
+    """Documentation tab, including the live AI configuration."""
+    config_display = {
+        "Provider": snapshot.provider,
+        "Brainstorm Model": snapshot.models["brainstorm"]["model"],
+        "Content Model": snapshot.models["content"]["model"],
+        "QA Model": snapshot.models["qa"]["model"],
+    }
+    config_md = "\n".join(
+        f"- **{key}:** `{value}`" for key, value in config_display.items()
+    )
+
+    # One markdown element for the whole tab
+    st.markdown(f"{_DOCS_INTRO_MD}\n{config_md}\n\n{_DOCS_REFERENCE_MD}")
+
+
+def main() -> None:
+    st.set_page_config(
+        page_title="PPTX Agent - Full Featured",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+
+    # Sidebar configuration
+    ai_snapshot = _read_ai_snapshot()
+    display_model_configuration(ai_snapshot)
+    display_run_history()
+
+    # Main header
+    st.title("🎨 PPTX Agent - Complete Interface")
+
+    # Mode selection. Only the selected mode's body runs on a rerun, unlike
+    # st.tabs which executes every tab and hides all but one.
+    modes = {
+        "🚀 Quick Generate": _quick_generate_tab,
+        "🔧 Step-by-Step": _step_by_step_tab,
+        "⚙️ Settings": _settings_tab,
+        "📖 Documentation": functools.partial(_documentation_tab, ai_snapshot),
+        "📚 Run History": _run_history_tab,
+    }
+    active_mode = st.radio(
+        "Mode",
+        list(modes),
+        horizontal=True,
+        key="active_mode",
+        label_visibility="collapsed",
+    )
+    modes[active_mode]()
 
 
 if __name__ == "__main__":
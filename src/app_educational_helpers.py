@@ -2,10 +2,56 @@
 
 from __future__ import annotations
 
+import functools
+import html
+
 import streamlit as st
 from .schemas import PresentationOutline, SlideContent, LearningObjective
 from .state import PipelineState
 
+# Bloom's taxonomy levels in ascending order, with their badge colors
+_BLOOM_LEVELS = ("remember", "understand", "apply", "analyze", "evaluate", "create")
+_BLOOM_INDEX = {level: idx for idx, level in enumerate(_BLOOM_LEVELS)}
+_BLOOM_COLORS = {
+    "remember": "#FF6B6B",  # Red
+    "understand": "#FFB26B",  # Orange
+    "apply": "#FFE66D",  # Yellow
+    "analyze": "#95E1D3",  # Teal
+    "evaluate": "#A8E6CF",  # Green
+    "create": "#C7CEEA",  # Purple
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _bloom_badge_html(level: str) -> str:
+    """Return the colored badge markup for a Bloom level (built once per level)."""
+    color = _BLOOM_COLORS.get(level, "#CCCCCC")
+    return (
+        f'<div style="background-color: {color}; '
+        f"padding: 5px; border-radius: 5px; text-align: center; "
+        f'font-weight: bold; font-size: 12px;">'
+        f"{level.upper()}</div>"
+    )
+
+
+# Body of the "What is Educational Mode?" expander
+_EDU_EXPLAINER_MD = """\
+**Educational Mode** enhances your presentation with evidence-based instructional design principles:
+
+**Learning Features:**
+- 📋 SMART learning objectives aligned with Bloom's Taxonomy
+- 🎯 Prerequisite knowledge identification
+- 🎣 Engagement hooks to activate prior knowledge
+- 🤝 Active learning prompts (think-pair-share, activities)
+- ✓ Formative assessment checks for understanding
+- 📊 Scaffolded content (concrete → abstract)
+- 👥 Differentiation guidance for diverse learners
+
+**Best for:** Teachers, trainers, instructional designers, educators
+
+**Not needed for:** Business presentations, reports, pitches
+"""
+
 
 def display_educational_toggle() -> bool:
     """Display educational mode toggle with explanation.
@@ -21,23 +67,9 @@ def display_educational_toggle() -> bool:
     )
 
     if educational_mode:
+        # A plain expander opens client-side, without a rerun
         with st.expander("ℹ️ What is Educational Mode?", expanded=False):
-            st.markdown("""
-            **Educational Mode** enhances your presentation with evidence-based instructional design principles:
-
-            **Learning Features:**
-            - 📋 SMART learning objectives aligned with Bloom's Taxonomy
-            - 🎯 Prerequisite knowledge identification
-            - 🎣 Engagement hooks to activate prior knowledge
-            - 🤝 Active learning prompts (think-pair-share, activities)
-            - ✓ Formative assessment checks for understanding
-            - 📊 Scaffolded content (concrete → abstract)
-            - 👥 Differentiation guidance for diverse learners
-
-            **Best for:** Teachers, trainers, instructional designers, educators
-
-            **Not needed for:** Business presentations, reports, pitches
-            """)
+            st.markdown(_EDU_EXPLAINER_MD)
 
     return educational_mode
 
@@ -53,36 +85,23 @@ def display_learning_objectives(outline: PresentationOutline):
 
     st.markdown("### 🎯 Learning Objectives")
 
-    # Bloom's level colors
-    bloom_colors = {
-        "remember": "#FF6B6B",  # Red
-        "understand": "#FFB26B",  # Orange
-        "apply": "#FFE66D",  # Yellow
-        "analyze": "#95E1D3",  # Teal
-        "evaluate": "#A8E6CF",  # Green
-        "create": "#C7CEEA",  # Purple
-    }
-
     for i, obj in enumerate(outline.learning_objectives, 1):
-        bloom_level = obj.bloom_level if hasattr(obj, "bloom_level") else "understand"
-        color = bloom_colors.get(bloom_level, "#CCCCCC")
-
-        # Display with colored badge
-        col1, col2 = st.columns([1, 9])
-        with col1:
-            st.markdown(
-                f'<div style="background-color: {color}; '
-                f"padding: 5px; border-radius: 5px; text-align: center; "
-                f'font-weight: bold; font-size: 12px;">'
-                f"{bloom_level.upper()}</div>",
-                unsafe_allow_html=True,
-            )
-        with col2:
-            st.markdown(f"**{i}.** {obj.objective}")
-            if hasattr(obj, "assessment") and obj.assessment:
-                st.caption(f"📝 Assessment: {obj.assessment}")
-
-        st.markdown("")  # Spacing
+        # Badge and text share one flex row, so each objective is one element
+        # instead of a column grid; model text is escaped since it is HTML
+        assessment = (
+            '<br><small style="opacity: 0.6;">'
+            f"📝 Assessment: {html.escape(obj.assessment)}</small>"
+            if obj.assessment
+            else ""
+        )
+        st.markdown(
+            '<div style="display: flex; align-items: center; gap: 12px; '
+            'margin-bottom: 1rem;">'
+            f'<div style="flex: 1;">{_bloom_badge_html(obj.bloom_level)}</div>'
+            f'<div style="flex: 9;"><b>{i}.</b> {html.escape(obj.objective)}'
+            f"{assessment}</div></div>",
+            unsafe_allow_html=True,
+        )
 
 
 def display_prerequisite_knowledge(outline: PresentationOutline):
@@ -95,10 +114,10 @@ def display_prerequisite_knowledge(outline: PresentationOutline):
         return
 
     st.markdown("### 📚 Prerequisite Knowledge")
-    st.markdown("Students should already understand:")
-
-    for prereq in outline.prerequisite_knowledge:
-        st.markdown(f"- {prereq}")
+    st.markdown(
+        "Students should already understand:\n"
+        + "\n".join(f"- {prereq}" for prereq in outline.prerequisite_knowledge)
+    )
 
 
 def display_pedagogical_slide_badges(slide: SlideContent) -> str:
@@ -112,24 +131,112 @@ def display_pedagogical_slide_badges(slide: SlideContent) -> str:
     """
     badges = []
 
-    if hasattr(slide, "engagement_hook") and slide.engagement_hook:
+    if slide.engagement_hook:
         badges.append("🎣 Hook")
 
-    if hasattr(slide, "active_learning_prompt") and slide.active_learning_prompt:
+    if slide.active_learning_prompt:
         badges.append("🤝 Active")
 
-    if hasattr(slide, "formative_check") and slide.formative_check:
+    if slide.formative_check:
         badges.append("✓ Check")
 
-    if hasattr(slide, "bloom_level") and slide.bloom_level:
+    if slide.bloom_level:
         badges.append(f"[{slide.bloom_level.title()}]")
 
     return " | ".join(badges) if badges else ""
 
 
+# Slide fields (besides bullets) that give a preview slide a body
+_BODY_FIELDS = (
+    "engagement_hook",
+    "active_learning_prompt",
+    "formative_check",
+    "bloom_level",
+    "speaker_notes",
+    "citations",
+)
+
+
+def _preview_text(text: str) -> str:
+    """Escape model text for the preview HTML, keeping its line breaks."""
+    return html.escape(str(text)).replace("\n", "<br>")
+
+
+def _preview_callout(label: str, text: str, color: str) -> str:
+    """Return a colored callout box like ``st.info``/``st.success``."""
+    return (
+        f'<div style="background-color: {color}1A; border-left: 4px solid {color}; '
+        f'padding: 8px 12px; border-radius: 4px; margin: 8px 0;">'
+        f"<b>{label}:</b><br>{_preview_text(text)}</div>"
+    )
+
+
+def _content_preview_html(content: list[SlideContent]) -> str:
+    """Build the whole slide preview as one HTML string.
+
+    Each slide is a native ``<details>`` element, so opening or closing one
+    is handled by the browser without a Streamlit rerun.
+    """
+    parts = []
+    for i, slide in enumerate(content, 1):
+        title = html.escape(slide.title)
+        # A slide with nothing to show gets a caption rather than an empty
+        # collapsible
+        if not slide.bullets and not any(getattr(slide, f) for f in _BODY_FIELDS):
+            parts.append(
+                f'<p style="opacity: 0.6; font-size: 14px;">'
+                f"📄 Slide {i}: {title} (empty)</p>"
+            )
+            continue
+
+        body = []
+        badges = display_pedagogical_slide_badges(slide)
+        if badges:
+            body.append(
+                f"<p><b>Pedagogical Elements:</b> {html.escape(badges)}</p><hr>"
+            )
+        if slide.engagement_hook:
+            body.append(
+                _preview_callout("🎣 Engagement Hook", slide.engagement_hook, "#1C83E1")
+            )
+        bullets = "".join(f"<li>{_preview_text(b)}</li>" for b in slide.bullets)
+        body.append(f"<p><b>📝 Content:</b></p><ol>{bullets}</ol>")
+        if slide.active_learning_prompt:
+            body.append(
+                _preview_callout(
+                    "🤝 Active Learning", slide.active_learning_prompt, "#09AB3B"
+                )
+            )
+        if slide.formative_check:
+            body.append(
+                _preview_callout("✓ Formative Check", slide.formative_check, "#FACA2B")
+            )
+        if slide.speaker_notes:
+            body.append(
+                "<details><summary>💬 Speaker Notes</summary>"
+                f"<p>{_preview_text(slide.speaker_notes)}</p></details>"
+            )
+        if slide.citations:
+            citations = html.escape(", ".join(slide.citations))
+            body.append(
+                f'<p style="opacity: 0.6; font-size: 14px;">📚 Citations: {citations}</p>'
+            )
+
+        parts.append(
+            '<details style="border: 1px solid rgba(128, 128, 128, 0.3); '
+            'border-radius: 8px; padding: 8px 12px; margin-bottom: 8px;">'
+            f"<summary>📄 Slide {i}: {title}</summary>{''.join(body)}</details>"
+        )
+    return "".join(parts)
+
+
 def display_pedagogical_content_preview(state: PipelineState):
     """Display slide content with pedagogical elements highlighted.
 
+    The preview HTML is cached in ``st.session_state`` under a hash of the
+    slides, so reruns triggered by unrelated widgets re-emit it instead of
+    rebuilding every slide.
+
     Args:
         state: Pipeline state with generated content
     """
@@ -139,48 +246,39 @@ def display_pedagogical_content_preview(state: PipelineState):
 
     st.markdown(f"**Total Slides:** {len(state.content)}")
 
-    for i, slide in enumerate(state.content):
-        # Get pedagogical badges
-        badges = display_pedagogical_slide_badges(slide)
+    content_hash = hash(tuple(slide.model_dump_json() for slide in state.content))
+    if (
+        st.session_state.get("_preview_hash") != content_hash
+        or "_preview_html" not in st.session_state
+    ):
+        st.session_state["_preview_html"] = _content_preview_html(state.content)
+        st.session_state["_preview_hash"] = content_hash
+    st.markdown(st.session_state["_preview_html"], unsafe_allow_html=True)
 
-        # Display slide with badges
-        with st.expander(f"📄 Slide {i+1}: {slide.title}", expanded=False):
-            # Show badges if present
-            if badges:
-                st.markdown(f"**Pedagogical Elements:** {badges}")
-                st.markdown("---")
-
-            # Engagement hook
-            if hasattr(slide, "engagement_hook") and slide.engagement_hook:
-                st.markdown("🎣 **Engagement Hook:**")
-                st.info(slide.engagement_hook)
-
-            # Main content
-            st.markdown("📝 **Content:**")
-            for j, bullet in enumerate(slide.bullets, 1):
-                st.markdown(f"{j}. {bullet}")
-
-            # Active learning prompt
-            if (
-                hasattr(slide, "active_learning_prompt")
-                and slide.active_learning_prompt
-            ):
-                st.markdown("🤝 **Active Learning:**")
-                st.success(slide.active_learning_prompt)
-
-            # Formative check
-            if hasattr(slide, "formative_check") and slide.formative_check:
-                st.markdown("✓ **Formative Check:**")
-                st.warning(slide.formative_check)
-
-            # Speaker notes
-            if slide.speaker_notes:
-                with st.expander("💬 Speaker Notes", expanded=False):
-                    st.markdown(slide.speaker_notes)
-
-            # Citations
-            if slide.citations:
-                st.caption(f"📚 Citations: {', '.join(slide.citations)}")
+
+def _render_metrics_row(metrics: list[tuple[str, str, str | None]]):
+    """Render ``(label, value, delta)`` metric cards as one flex row.
+
+    A single markdown element replaces a ``st.columns`` grid of ``st.metric``
+    widgets, which are slow to create in bulk.
+    """
+    cards = []
+    for label, value, delta in metrics:
+        delta_html = (
+            f'<div style="color: #09AB3B; font-size: 14px;">↑ {delta}</div>'
+            if delta
+            else ""
+        )
+        cards.append(
+            '<div style="flex: 1;">'
+            f'<div style="font-size: 14px;">{label}</div>'
+            f'<div style="font-size: 32px; line-height: 1.4;">{value}</div>'
+            f"{delta_html}</div>"
+        )
+    st.markdown(
+        f'<div style="display: flex; gap: 12px;">{"".join(cards)}</div>',
+        unsafe_allow_html=True,
+    )
 
 
 def display_pedagogical_qa_dashboard(state: PipelineState):
@@ -199,104 +297,57 @@ def display_pedagogical_qa_dashboard(state: PipelineState):
     st.markdown("### 📊 Quality Assessment")
 
     st.markdown("**Standard Metrics:**")
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Content", f"{qa.content_score:.1f}/5.0")
-    with col2:
-        st.metric("Design", f"{qa.design_score:.1f}/5.0")
-    with col3:
-        st.metric("Coherence", f"{qa.coherence_score:.1f}/5.0")
-    with col4:
-        avg_standard = (qa.content_score + qa.design_score + qa.coherence_score) / 3
-        st.metric("Average", f"{avg_standard:.1f}/5.0")
+    avg_standard = (qa.content_score + qa.design_score + qa.coherence_score) / 3
+    _render_metrics_row(
+        [
+            ("Content", f"{qa.content_score:.1f}/5.0", None),
+            ("Design", f"{qa.design_score:.1f}/5.0", None),
+            ("Coherence", f"{qa.coherence_score:.1f}/5.0", None),
+            ("Average", f"{avg_standard:.1f}/5.0", None),
+        ]
+    )
 
     # Pedagogical metrics (if present)
-    if (
-        (hasattr(qa, "pedagogical_score") and qa.pedagogical_score)
-        or (hasattr(qa, "engagement_score") and qa.engagement_score)
-        or (hasattr(qa, "clarity_score") and qa.clarity_score)
-    ):
+    if qa.pedagogical_score or qa.engagement_score or qa.clarity_score:
 
         st.markdown("**🎓 Pedagogical Metrics:**")
-        col1, col2, col3, col4 = st.columns(4)
-
-        pedagogical_scores = []
-
-        with col1:
-            if hasattr(qa, "pedagogical_score") and qa.pedagogical_score:
-                st.metric("Pedagogy", f"{qa.pedagogical_score:.1f}/5.0")
-                pedagogical_scores.append(qa.pedagogical_score)
-            else:
-                st.metric("Pedagogy", "N/A")
-
-        with col2:
-            if hasattr(qa, "engagement_score") and qa.engagement_score:
-                st.metric("Engagement", f"{qa.engagement_score:.1f}/5.0")
-                pedagogical_scores.append(qa.engagement_score)
-            else:
-                st.metric("Engagement", "N/A")
-
-        with col3:
-            if hasattr(qa, "clarity_score") and qa.clarity_score:
-                st.metric("Clarity", f"{qa.clarity_score:.1f}/5.0")
-                pedagogical_scores.append(qa.clarity_score)
-            else:
-                st.metric("Clarity", "N/A")
-
-        with col4:
-            if pedagogical_scores:
-                avg_pedagogical = sum(pedagogical_scores) / len(pedagogical_scores)
-                st.metric("Avg (Ped.)", f"{avg_pedagogical:.1f}/5.0")
-            else:
-                st.metric("Avg (Ped.)", "N/A")
+        pedagogical = [
+            ("Pedagogy", qa.pedagogical_score),
+            ("Engagement", qa.engagement_score),
+            ("Clarity", qa.clarity_score),
+        ]
+        pedagogical_scores = [score for _, score in pedagogical if score]
+        avg_pedagogical = (
+            sum(pedagogical_scores) / len(pedagogical_scores)
+            if pedagogical_scores
+            else None
+        )
+        _render_metrics_row(
+            [
+                (label, f"{score:.1f}/5.0" if score else "N/A", None)
+                for label, score in [*pedagogical, ("Avg (Ped.)", avg_pedagogical)]
+            ]
+        )
 
         # Pedagogical element coverage
         if state.content:
             st.markdown("**✓ Pedagogical Elements Coverage:**")
 
-            hooks = sum(
-                1
-                for slide in state.content
-                if hasattr(slide, "engagement_hook") and slide.engagement_hook
-            )
-            active = sum(
-                1
-                for slide in state.content
-                if hasattr(slide, "active_learning_prompt")
-                and slide.active_learning_prompt
-            )
-            formative = sum(
-                1
-                for slide in state.content
-                if hasattr(slide, "formative_check") and slide.formative_check
-            )
-            bloom = sum(
-                1
-                for slide in state.content
-                if hasattr(slide, "bloom_level") and slide.bloom_level
+            # Counts are memoized on the state until the content list changes
+            hooks, active, formative, bloom, total = state.pedagogical_feature_counts()
+
+            _render_metrics_row(
+                [
+                    (label, f"{count}/{total}", f"{count/total*100:.0f}%")
+                    for label, count in (
+                        ("Hooks", hooks),
+                        ("Active Learning", active),
+                        ("Formative Checks", formative),
+                        ("Bloom's Levels", bloom),
+                    )
+                ]
             )
 
-            total = len(state.content)
-
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Hooks", f"{hooks}/{total}", f"{hooks/total*100:.0f}%")
-            with col2:
-                st.metric(
-                    "Active Learning", f"{active}/{total}", f"{active/total*100:.0f}%"
-                )
-            with col3:
-                st.metric(
-                    "Formative Checks",
-                    f"{formative}/{total}",
-                    f"{formative/total*100:.0f}%",
-                )
-            with col4:
-                st.metric(
-                    "Bloom's Levels", f"{bloom}/{total}", f"{bloom/total*100:.0f}%"
-                )
-
     # Detailed feedback
     if qa.feedback:
         st.markdown("**💬 Detailed Feedback:**")
@@ -318,82 +369,82 @@ def display_educational_outline_editor(state: PipelineState) -> PipelineState:
 
     st.markdown("### 📝 Edit Presentation Outline")
 
-    # Edit basic fields
-    new_topic = st.text_input("Topic", value=state.outline.topic)
-    new_audience = st.text_input("Audience", value=state.outline.audience)
-
-    if hasattr(state.outline, "educational_level") and state.outline.educational_level:
-        new_edu_level = st.text_input(
-            "Educational Level", value=state.outline.educational_level
-        )
-    else:
-        new_edu_level = None
-
-    # Edit learning objectives
-    if state.outline.learning_objectives and len(state.outline.learning_objectives) > 0:
-        st.markdown("**Learning Objectives:**")
-
-        new_objectives = []
-        for i, obj in enumerate(state.outline.learning_objectives):
-            with st.expander(f"Objective {i+1}", expanded=False):
-                new_obj_text = st.text_area(
-                    "Objective", value=obj.objective, key=f"obj_{i}"
-                )
-                new_bloom = st.selectbox(
-                    "Bloom's Level",
-                    options=[
-                        "remember",
-                        "understand",
-                        "apply",
-                        "analyze",
-                        "evaluate",
-                        "create",
-                    ],
-                    index=[
-                        "remember",
-                        "understand",
-                        "apply",
-                        "analyze",
-                        "evaluate",
-                        "create",
-                    ].index(
-                        obj.bloom_level if hasattr(obj, "bloom_level") else "understand"
-                    ),
-                    key=f"bloom_{i}",
-                )
-                new_assessment = st.text_input(
-                    "Assessment Method",
-                    value=(
-                        obj.assessment
-                        if hasattr(obj, "assessment") and obj.assessment
-                        else ""
-                    ),
-                    key=f"assess_{i}",
-                )
+    # Edits are batched in a form so typing in a field does not rerun the
+    # page; only Apply Changes does
+    objective_edits = []
+    with st.form("educational_outline_editor", clear_on_submit=False):
+        # Edit basic fields
+        new_topic = st.text_input("Topic", value=state.outline.topic)
+        new_audience = st.text_input("Audience", value=state.outline.audience)
+
+        if state.outline.educational_level:
+            new_edu_level = st.text_input(
+                "Educational Level", value=state.outline.educational_level
+            )
+        else:
+            new_edu_level = None
+
+        # Edit learning objectives
+        if (
+            state.outline.learning_objectives
+            and len(state.outline.learning_objectives) > 0
+        ):
+            st.markdown("**Learning Objectives:**")
+
+            for i, obj in enumerate(state.outline.learning_objectives):
+                with st.expander(f"Objective {i+1}", expanded=False):
+                    new_obj_text = st.text_area(
+                        "Objective", value=obj.objective, key=f"obj_{i}"
+                    )
+                    new_bloom = st.selectbox(
+                        "Bloom's Level",
+                        options=_BLOOM_LEVELS,
+                        index=_BLOOM_INDEX.get(
+                            obj.bloom_level, _BLOOM_INDEX["understand"]
+                        ),
+                        key=f"bloom_{i}",
+                    )
+                    new_assessment = st.text_input(
+                        "Assessment Method",
+                        value=obj.assessment or "",
+                        key=f"assess_{i}",
+                    )
 
-                new_objectives.append(
-                    LearningObjective(
-                        objective=new_obj_text,
-                        bloom_level=new_bloom,
-                        assessment=new_assessment if new_assessment else None,
+                    objective_edits.append(
+                        (obj, new_obj_text, new_bloom, new_assessment or None)
                     )
-                )
 
-    # Edit sections
-    st.markdown("**Sections:**")
-    new_sections = []
-    for i, section in enumerate(state.outline.sections):
-        new_section = st.text_input(f"Section {i+1}", value=section, key=f"section_{i}")
-        new_sections.append(new_section)
+        # Edit sections
+        st.markdown("**Sections:**")
+        new_sections = []
+        for i, section in enumerate(state.outline.sections):
+            new_section = st.text_input(
+                f"Section {i+1}", value=section, key=f"section_{i}"
+            )
+            new_sections.append(new_section)
+
+        submitted = st.form_submit_button("✅ Apply Changes", type="primary")
 
-    # Apply changes button
-    if st.button("✅ Apply Changes", type="primary"):
+    # Apply changes on submit
+    if submitted:
         state.outline.topic = new_topic
         state.outline.audience = new_audience
         if new_edu_level:
             state.outline.educational_level = new_edu_level
-        if new_objectives:
-            state.outline.learning_objectives = new_objectives
+        if objective_edits:
+            # Unchanged objectives keep their instance; only edited rows are
+            # rebuilt (and revalidated)
+            state.outline.learning_objectives = [
+                (
+                    obj
+                    if (text, bloom, assessment)
+                    == (obj.objective, obj.bloom_level, obj.assessment)
+                    else LearningObjective(
+                        objective=text, bloom_level=bloom, assessment=assessment
+                    )
+                )
+                for obj, text, bloom, assessment in objective_edits
+            ]
         state.outline.sections = [s for s in new_sections if s.strip()]
         st.success("Outline updated successfully!")
         st.rerun()
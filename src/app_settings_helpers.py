@@ -205,13 +205,31 @@ def save_config_to_file(config: dict, config_path: Path) -> None:
         f.write("\n".join(lines))
 
 
+@st.cache_resource(show_spinner=False)
+def get_template_manager():
+    """Return a TemplateManager shared across reruns and sessions.
+
+    The import is deferred because it pulls in python-pptx.
+    """
+    from src.tools.template_manager import TemplateManager
+
+    return TemplateManager()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_available_templates() -> List[str]:
+    """List template names, rescanning the template directory at most once a minute.
+
+    Cleared via ``list_available_templates.clear()`` after an upload or delete.
+    """
+    return get_template_manager().list_templates()
+
+
 def _display_template_management() -> None:
     """Display template management UI section."""
     try:
-        from src.tools.template_manager import TemplateManager
-
-        tm = TemplateManager()
-        templates = tm.list_templates()
+        tm = get_template_manager()
+        templates = list_available_templates()
 
         st.markdown("Manage PowerPoint templates for presentations.")
 
@@ -257,6 +275,7 @@ def _display_template_management() -> None:
                         if st.button("🗑 Delete", key=f"delete_{template}"):
                             success, message = tm.delete_template(template)
                             if success:
+                                list_available_templates.clear()
                                 st.success(message)
                                 st.rerun()
                             else:
@@ -288,6 +307,7 @@ def _display_template_management() -> None:
                     )
 
                     if success:
+                        list_available_templates.clear()
                         st.success(message)
                         st.rerun()
                     else:
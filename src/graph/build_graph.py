@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime, UTC
-from typing import Dict, Optional, Set
+from typing import Callable, Dict, Optional, Set
 
 from ..config import get_config
 from ..events import EVENT_STORE
@@ -89,10 +89,13 @@ def _execute_phases(
     start_index: int,
     gated_phases: Set[str],
     auto_approve: bool,
+    on_phase: Optional[Callable[[str], None]] = None,
 ) -> PipelineState:
     preview_worker = PreviewWorker()
 
     for phase_name, phase_func in PHASE_PLAN[start_index:]:
+        if on_phase is not None:
+            on_phase(phase_name)
         state.current_phase = phase_name
         state.updated_at = _now_iso()
         state.workflow_status = "running"
@@ -172,6 +175,7 @@ def run_pipeline(
     session_id: Optional[str] = None,
     approval_phases: Optional[Set[str]] = None,
     auto_approve: bool = True,
+    on_phase: Optional[Callable[[str], None]] = None,
 ) -> PipelineState:
     """Execute the pipeline synchronously and return the final state.
 
@@ -182,6 +186,7 @@ def run_pipeline(
         session_id: Optional external session identifier
         approval_phases: Optional set of phases requiring human approval
         auto_approve: If False, pipeline pauses on configured approval phases
+        on_phase: Optional callback invoked with each phase name as it starts
     """
     start_time = time.time()
     gated_phases = approval_phases or set()
@@ -218,6 +223,7 @@ def run_pipeline(
         start_index=0,
         gated_phases=gated_phases,
         auto_approve=auto_approve,
+        on_phase=on_phase,
     )
 
     if state.workflow_status == "waiting_for_approval":
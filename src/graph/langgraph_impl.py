@@ -9,7 +9,7 @@ This module implements a true LangGraph workflow with:
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Callable, Literal
 
 from langgraph.graph import END, StateGraph
 
@@ -101,12 +101,14 @@ def run_langgraph_pipeline(
     template_name: str | None = None,
     approval_phases: set[str] | None = None,
     auto_approve: bool = True,
+    on_phase: Callable[[str], None] | None = None,
 ) -> PipelineState:
     """Execute the LangGraph pipeline with proper state management.
 
     Args:
         user_input: User's presentation topic/brief
         educational_mode: If True, generate with pedagogical enhancements
+        on_phase: Optional callback invoked with each phase name as it starts
 
     Returns:
         Final pipeline state with generated PPTX path and QA report
@@ -118,6 +120,7 @@ def run_langgraph_pipeline(
         session_id=session_id,
         approval_phases=approval_phases,
         auto_approve=auto_approve,
+        on_phase=on_phase,
     )
 
 
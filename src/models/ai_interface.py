@@ -13,10 +13,11 @@ Key Benefits:
 
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, List, Dict, Any
 from dataclasses import dataclass
 
-from .client import UnifiedModelClient, ModelMessage
+from .client import UnifiedModelClient, ModelMessage, new_async_http_client
 from .ai_config import get_ai_config
 
 
@@ -92,12 +93,7 @@ class AIInterface:
             RuntimeError: If the AI call fails after fallback attempts
         """
         client = self._get_client(agent)
-
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append(ModelMessage(role="system", content=system_message))
-        messages.append(ModelMessage(role="user", content=prompt))
+        messages = self._build_messages(prompt, system_message)
 
         # TODO: Apply overrides if provided
         # For now, they're handled by the config system
@@ -105,29 +101,85 @@ class AIInterface:
         try:
             # Make the API call
             content = client.chat(messages)
+            return self._to_response(client, content)
 
-            # Determine if fallback was used
-            fallback_used = (
-                client._rate_limited if hasattr(client, "_rate_limited") else False
-            )
+        except Exception as e:
+            # Wrap all exceptions in a consistent format
+            raise RuntimeError(
+                f"AI generation failed for agent '{agent}': {str(e)}"
+            ) from e
 
-            # Get model info
-            model_used = client.config.model
-            provider = client.config.provider
+    async def generate_async(
+        self,
+        prompt: str,
+        agent: Optional[str] = None,
+        system_message: Optional[str] = None,
+        http_client: Optional[Any] = None,
+    ) -> AIResponse:
+        """Async variant of :meth:`generate` for concurrent model calls.
 
-            return AIResponse(
-                content=content,
-                model_used=model_used,
-                provider=provider,
-                fallback_used=fallback_used,
-            )
+        Args:
+            prompt: The user prompt to send to the model
+            agent: Agent name for agent-specific configuration
+            system_message: Optional system message to prepend
+            http_client: Shared client from :meth:`async_session`, so
+                concurrent calls reuse one connection pool
+
+        Returns:
+            AIResponse with content and metadata
+
+        Raises:
+            RuntimeError: If the AI call fails after fallback attempts
+        """
+        client = self._get_client(agent)
+        messages = self._build_messages(prompt, system_message)
+
+        try:
+            content = await client.achat(messages, http_client=http_client)
+            return self._to_response(client, content)
 
         except Exception as e:
-            # Wrap all exceptions in a consistent format
             raise RuntimeError(
                 f"AI generation failed for agent '{agent}': {str(e)}"
             ) from e
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[Optional[Any]]:
+        """Yield a pooled HTTP client to pass to :meth:`generate_async`.
+
+        Yields None when httpx is unavailable; ``generate_async`` then runs
+        the sync client in worker threads.
+        """
+        http_client = new_async_http_client()
+        if http_client is None:
+            yield None
+            return
+        async with http_client:
+            yield http_client
+
+    @staticmethod
+    def _build_messages(
+        prompt: str, system_message: Optional[str]
+    ) -> List[ModelMessage]:
+        messages = []
+        if system_message:
+            messages.append(ModelMessage(role="system", content=system_message))
+        messages.append(ModelMessage(role="user", content=prompt))
+        return messages
+
+    @staticmethod
+    def _to_response(client: UnifiedModelClient, content: str) -> AIResponse:
+        # Determine if fallback was used
+        fallback_used = (
+            client._rate_limited if hasattr(client, "_rate_limited") else False
+        )
+        return AIResponse(
+            content=content,
+            model_used=client.config.model,
+            provider=client.config.provider,
+            fallback_used=fallback_used,
+        )
+
     def generate_with_history(
         self, messages: List[Dict[str, str]], agent: Optional[str] = None
     ) -> AIResponse:
@@ -8,6 +8,8 @@ Supports automatic fallback to smaller models on rate limiting.
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
 import os
 import time
@@ -16,8 +18,37 @@ from typing import Any, List, Optional
 
 import requests
 
+try:
+    import httpx
+except Exception:  # pragma: no cover - optional dependency path
+    httpx = None
+
 from .ai_config import ModelConfig
 
+# HTTP/2 multiplexing needs the optional ``h2`` package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_RATE_LIMIT_TERMS = ("rate limit", "429", "too many requests", "quota exceeded")
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    error_msg = str(exc).lower()
+    return any(term in error_msg for term in _RATE_LIMIT_TERMS)
+
+
+def _request_timeout() -> float:
+    return float(os.getenv("MODEL_REQUEST_TIMEOUT_SECONDS", "120"))
+
+
+def new_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """Return a pooled ``httpx.AsyncClient`` for concurrent model calls.
+
+    Uses HTTP/2 when ``h2`` is installed. Returns None when httpx is
+    unavailable, in which case async calls run the sync client in a thread.
+    """
+    if httpx is None:
+        return None
+    return httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=_request_timeout())
+
 
 @dataclass
 class ModelMessage:
@@ -74,29 +105,29 @@ class UnifiedModelClient:
             return self._make_request(self.config.model, messages)
         except RuntimeError as exc:
             # Check if this is a rate limit error
-            error_msg = str(exc).lower()
-            if any(
-                term in error_msg
-                for term in ["rate limit", "429", "too many requests", "quota exceeded"]
-            ):
-                if self.config.fallback_model:
-                    print(
-                        f"⚠ Rate limited on {self.config.model}, falling back to {self.config.fallback_model}"
-                    )
-                    self._rate_limited = True
-                    self._fallback_used_count += 1
-                    # Wait a bit before fallback
-                    time.sleep(1)
-                    return self._make_request(self.config.fallback_model, messages)
+            if _is_rate_limit_error(exc) and self.config.fallback_model:
+                print(
+                    f"⚠ Rate limited on {self.config.model}, falling back to {self.config.fallback_model}"
+                )
+                self._rate_limited = True
+                self._fallback_used_count += 1
+                # Wait a bit before fallback
+                time.sleep(1)
+                return self._make_request(self.config.fallback_model, messages)
             # Not a rate limit error, re-raise
             raise
 
-    def _make_request(self, model: str, messages: List[ModelMessage]) -> str:
-        """Make a request to the model API.
+    async def achat(
+        self,
+        messages: List[ModelMessage],
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> str:
+        """Async variant of :meth:`chat` with the same fallback behavior.
 
         Args:
-            model: Model name to use
             messages: List of chat messages
+            http_client: Optional shared ``httpx.AsyncClient`` so concurrent
+                calls reuse one connection pool
 
         Returns:
             Response text from the model
@@ -104,10 +135,59 @@ class UnifiedModelClient:
         Raises:
             RuntimeError: If the API call fails
         """
+        if httpx is None:
+            return await asyncio.to_thread(self.chat, messages)
+
+        try:
+            return await self._make_request_async(
+                self.config.model, messages, http_client
+            )
+        except RuntimeError as exc:
+            if _is_rate_limit_error(exc) and self.config.fallback_model:
+                print(
+                    f"⚠ Rate limited on {self.config.model}, falling back to {self.config.fallback_model}"
+                )
+                self._rate_limited = True
+                self._fallback_used_count += 1
+                await asyncio.sleep(1)
+                return await self._make_request_async(
+                    self.config.fallback_model, messages, http_client
+                )
+            raise
+
+    def _serialize_message(self, model: str, message: ModelMessage) -> dict:
+        """Convert a message to its wire format.
+
+        System messages carry the static part of agent prompts. Anthropic
+        models behind OpenRouter only cache prompt prefixes that are marked
+        explicitly, so those get an ephemeral ``cache_control`` breakpoint;
+        OpenAI-compatible backends cache stable prefixes automatically.
+        """
+        if (
+            message.role == "system"
+            and self.config.provider == "openrouter"
+            and model.startswith("anthropic/")
+        ):
+            return {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": message.content,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        return {"role": message.role, "content": message.content}
+
+    def _prepare_request(
+        self, model: str, messages: List[ModelMessage]
+    ) -> tuple[str, dict, dict]:
+        """Build the ``(url, payload, headers)`` for a chat completion call."""
         # Prepare payload for Ollama or OpenRouter
         payload = {
             "model": model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": [self._serialize_message(model, m) for m in messages],
             "temperature": self.config.temperature,
             "max_tokens": self.config.max_tokens,
         }
@@ -127,8 +207,41 @@ class UnifiedModelClient:
         else:
             raise ValueError(f"Unknown provider: {self.config.provider}")
 
+        return url, payload, headers
+
+    def _extract_content(self, data: dict) -> str:
+        """Pull the response text out of a decoded API response."""
+        # Handle OpenAI-compatible response format
+        if "choices" in data and len(data["choices"]) > 0:
+            message = data["choices"][0].get("message", {})
+            return message.get("content", "")
+
+        # Handle Ollama direct response format
+        if "response" in data:
+            return data["response"]
+
+        # Fallback
+        raise RuntimeError(
+            f"Unexpected response format from {self.config.provider}: {data}"
+        )
+
+    def _make_request(self, model: str, messages: List[ModelMessage]) -> str:
+        """Make a request to the model API.
+
+        Args:
+            model: Model name to use
+            messages: List of chat messages
+
+        Returns:
+            Response text from the model
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        url, payload, headers = self._prepare_request(model, messages)
+
         try:
-            timeout_seconds = float(os.getenv("MODEL_REQUEST_TIMEOUT_SECONDS", "120"))
+            timeout_seconds = _request_timeout()
             response = requests.post(
                 url, json=payload, headers=headers, timeout=timeout_seconds
             )
@@ -156,16 +269,49 @@ class UnifiedModelClient:
                 f"Invalid JSON response from {self.config.provider}: {response.text}"
             )
 
-        # Handle OpenAI-compatible response format
-        if "choices" in data and len(data["choices"]) > 0:
-            message = data["choices"][0].get("message", {})
-            return message.get("content", "")
+        return self._extract_content(data)
 
-        # Handle Ollama direct response format
-        if "response" in data:
-            return data["response"]
+    async def _make_request_async(
+        self,
+        model: str,
+        messages: List[ModelMessage],
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> str:
+        """Async counterpart of :meth:`_make_request` using httpx."""
+        url, payload, headers = self._prepare_request(model, messages)
+        owns_client = http_client is None
+        client = http_client or new_async_http_client()
 
-        # Fallback
-        raise RuntimeError(
-            f"Unexpected response format from {self.config.provider}: {data}"
-        )
+        try:
+            timeout_seconds = _request_timeout()
+            response = await client.post(
+                url, json=payload, headers=headers, timeout=timeout_seconds
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            raise RuntimeError(
+                f"Model call timed out after {timeout_seconds:g} seconds"
+            )
+        except httpx.ConnectError as exc:
+            raise RuntimeError(
+                f"Could not connect to {self.config.provider} at {url}. "
+                f"Ensure the service is running. Error: {exc}"
+            )
+        except httpx.HTTPStatusError as exc:
+            raise RuntimeError(
+                f"Model API returned error: {exc}. Response: {response.text}"
+            )
+        except Exception as exc:
+            raise RuntimeError(f"Model call failed: {exc}") from exc
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        try:
+            data = response.json()
+        except json.JSONDecodeError:
+            raise RuntimeError(
+                f"Invalid JSON response from {self.config.provider}: {response.text}"
+            )
+
+        return self._extract_content(data)
@@ -0,0 +1,161 @@
+"""Response cache for content and QA model calls.
+
+Pipeline runs frequently repeat the same (topic, audience, section) tuples,
+for example when the e2e harness replays similar briefs. Responses are cached
+in two tiers:
+
+- an exact-match tier keyed by a SHA-256 of the agent, model and rendered
+  prompt, held in an in-memory LRU and persisted to
+  ``artifacts/prompt_cache.sqlite`` so hits survive restarts;
+- a semantic tier that compares the structured prompt slots (topic, audience,
+  section, ...) by sentence-embedding cosine similarity (see
+  ``tools.semantic_index``). Only content uses it; QA reviews score the
+  slides themselves, so they are reused on an exact match only.
+
+Only responses that parsed successfully are stored. Both tiers expire entries
+after a TTL (a day by default), and agents skip the cache entirely when asked
+for a fresh response (the UI's Regenerate buttons).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional, Tuple
+
+from ..tools.semantic_index import DEFAULT_TTL_SECONDS, SemanticIndex
+
+
+class PromptCache:
+    """Two-tier (exact + semantic) cache of raw model response text."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        threshold: float = 0.95,
+        maxsize: int = 1024,
+        max_semantic_entries: int = 512,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        self.db_path = db_path or (Path("artifacts") / "prompt_cache.sqlite")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Entries are (content, stored_at wall-clock time)
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._semantic = SemanticIndex(threshold, max_semantic_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self._db_ready = False
+
+    @staticmethod
+    def make_key(agent: str, model: str, prompt: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = f"{agent}\n{model}\n{prompt_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Exact tier
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=5.0)
+        if not self._db_ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "content TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db_ready = True
+        return conn
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _remember(self, key: str, content: str, stored_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (content, stored_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the unexpired cached response text for ``key``, if any."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None:
+            content, stored_at = entry
+            return None if self._expired(stored_at) else content
+
+        if not self.db_path.exists():
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT content, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception:
+            return None
+        if row is None or self._expired(row[1]):
+            return None
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    # ------------------------------------------------------------------
+    # Semantic tier
+    # ------------------------------------------------------------------
+    def lookup(self, namespace: Hashable, slots: str) -> Optional[str]:
+        """Return the closest stored response in ``namespace`` above threshold.
+
+        ``namespace`` holds the slots that must match exactly (agent, mode,
+        Bloom's level, ...); ``slots`` is the free-text part compared by
+        embedding similarity.
+        """
+        return self._semantic.lookup(namespace, slots)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def put(
+        self,
+        key: str,
+        content: str,
+        namespace: Optional[Hashable] = None,
+        slots: Optional[str] = None,
+    ) -> None:
+        """Store a successfully parsed response in both tiers."""
+        stored_at = time.time()
+        self._remember(key, content, stored_at)
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, content, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, content, stored_at),
+                )
+        except Exception:
+            pass
+
+        if namespace is not None and slots is not None:
+            self._semantic.add(namespace, slots, content)
+
+    def clear(self) -> None:
+        """Drop the in-memory tiers (the on-disk store is left untouched)."""
+        with self._lock:
+            self._memory.clear()
+        self._semantic.clear()
+
+
+# Global singleton instance
+_prompt_cache: Optional[PromptCache] = None
+
+
+def get_prompt_cache() -> PromptCache:
+    """Get the process-wide prompt response cache."""
+    global _prompt_cache
+    if _prompt_cache is None:
+        _prompt_cache = PromptCache()
+    return _prompt_cache
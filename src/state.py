@@ -10,13 +10,23 @@ that agents can attach arbitrary additional data.
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from .schemas import PresentationOutline, SlideContent, Claim, Evidence, QAReport
 
 
+class PedagogicalFeatureCounts(NamedTuple):
+    """Number of slides carrying each pedagogical element."""
+
+    hooks: int
+    active: int
+    formative: int
+    bloom: int
+    total: int
+
+
 class PipelineState(BaseModel):
     model_config = ConfigDict(extra="allow")
     """Container for passing data between LangGraph nodes.
@@ -48,8 +58,46 @@ class PipelineState(BaseModel):
     warnings: List[str] = Field(default_factory=list)
     teaching_suggestions: List[str] = Field(default_factory=list)
     audit_flags: List[str] = Field(default_factory=list)
+    # Slide number (as str, for JSON round-trips) -> image path, in slide order
     preview_images: Dict[str, str] = Field(default_factory=dict)
     preview_manifest_path: Optional[str] = None
     config: Optional[Dict[str, Any]] = None
     educational_mode: bool = False  # Enable pedagogical enhancements when True
     template_name: Optional[str] = None  # Template to apply to presentation
+
+    # (tuple of scanned slides, counts) from the last feature scan. Holding
+    # the slides themselves (not their ids) keeps identity checks sound.
+    _pedagogical_counts: Optional[tuple] = PrivateAttr(default=None)
+
+    def pedagogical_feature_counts(self) -> PedagogicalFeatureCounts:
+        """Return slide pedagogical-feature counts, scanning content only once.
+
+        The result is reused by QA and the pedagogical auditor until any
+        slide in ``content`` is added, removed or replaced. Slides are edited
+        by replacing them, so a changed slide is always a new object.
+        """
+        content = self.content or []
+        cached = self._pedagogical_counts
+        if (
+            cached is not None
+            and len(cached[0]) == len(content)
+            and all(old is new for old, new in zip(cached[0], content))
+        ):
+            return cached[1]
+
+        hooks = active = formative = bloom = 0
+        for slide in content:
+            if getattr(slide, "engagement_hook", None):
+                hooks += 1
+            if getattr(slide, "active_learning_prompt", None):
+                active += 1
+            if getattr(slide, "formative_check", None):
+                formative += 1
+            if getattr(slide, "bloom_level", None):
+                bloom += 1
+
+        counts = PedagogicalFeatureCounts(
+            hooks, active, formative, bloom, total=len(content)
+        )
+        self._pedagogical_counts = (tuple(content), counts)
+        return counts
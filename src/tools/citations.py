@@ -28,12 +28,21 @@ class CitationManager:
     def __init__(self):
         self._refs: Dict[str, ReferenceEntry] = {}
         self._order: List[str] = []
+        self._markers: Dict[str, str] = {}
 
-    def register_evidence(self, evidences: List[Evidence]) -> None:
-        """Register evidence objects and assign citation keys."""
+    def register_evidence(self, evidences: List[Evidence]) -> List[str]:
+        """Register evidence objects and assign citation keys.
+
+        Returns the citation marker for each evidence with a source, in input
+        order (repeated sources share a marker).
+        """
+        markers: List[str] = []
         for ev in evidences:
             key = ev.source
-            if key and key not in self._refs:
+            if not key:
+                continue
+            marker = self._markers.get(key)
+            if marker is None:
                 # Use the file name (last part of URL) as a title fallback
                 title = key.rsplit("/", 1)[-1]
                 self._refs[key] = ReferenceEntry(
@@ -43,13 +52,15 @@ class CitationManager:
                     source=ev.source,
                 )
                 self._order.append(key)
+                marker = self._markers[key] = f"[{len(self._order)}]"
+            markers.append(marker)
+        return markers
 
     def get_citation_marker(self, evidence: Evidence) -> str:
         """Return a citation marker (e.g. `[1]`) for the given evidence."""
-        if evidence.source not in self._refs:
+        if evidence.source not in self._markers:
             self.register_evidence([evidence])
-        idx = self._order.index(evidence.source) + 1
-        return f"[{idx}]"
+        return self._markers[evidence.source]
 
     def build_references_slide(self) -> List[str]:
         """Return a list of reference strings for the references slide."""
@@ -39,32 +39,30 @@ class FactCheckTool:
 
     def check(self, claims: List[Claim], top_k: int = 3) -> List[Evidence]:
         """For each claim, retrieve supporting evidence and assign a confidence score."""
-        evidences: List[Evidence] = []
-        for claim in claims:
-            results = self.search.search(claim.text, k=top_k)
-            if not results:
-                # No evidence found; assign low confidence
-                evidences.append(
-                    Evidence(
-                        claim=claim,
-                        source="",
-                        snippet="",
-                        published_at="",
-                        confidence=0.0,
-                    )
-                )
-                continue
-            # Use the number of results to derive a confidence score (cap at 1.0)
-            confidence = min(len(results) / top_k, 1.0)
-            # Use the first result as evidence
-            res = results[0]
-            evidences.append(
-                Evidence(
-                    claim=claim,
-                    source=res.source,
-                    snippet=res.snippet,
-                    published_at=res.published_at,
-                    confidence=confidence,
-                )
+        # Corpus scoring is CPU-bound Python, so worker threads would only
+        # serialize on the GIL; claims are checked in order.
+        return [self._check_one(claim, top_k) for claim in claims]
+
+    def _check_one(self, claim: Claim, top_k: int) -> Evidence:
+        """Retrieve the best evidence for a single claim."""
+        results = self.search.search(claim.text, k=top_k)
+        if not results:
+            # No evidence found; assign low confidence
+            return Evidence(
+                claim=claim,
+                source="",
+                snippet="",
+                published_at="",
+                confidence=0.0,
             )
-        return evidences
+        # Use the number of results to derive a confidence score (cap at 1.0)
+        confidence = min(len(results) / top_k, 1.0)
+        # Use the first result as evidence
+        res = results[0]
+        return Evidence(
+            claim=claim,
+            source=res.source,
+            snippet=res.snippet,
+            published_at=res.published_at,
+            confidence=confidence,
+        )
@@ -0,0 +1,147 @@
+"""Response caches for brainstorm outlines.
+
+Identical prompts (for example batch retries of the same topic) are served
+from an exact-match cache keyed by a SHA-256 of the rendered prompt, which is
+also persisted under ``artifacts/brainstorm_cache`` so hits survive restarts.
+
+Briefs that are near-paraphrases of each other ("Zero Trust Security
+Architecture Overview" vs "Zero Trust Security Architecture overview for IT")
+produce near-identical outlines, so the brainstorm agent can reuse a stored
+outline instead of calling the model again (see ``semantic_index``).
+
+Both tiers expire entries after a TTL (a day by default), and callers that
+want a fresh outline, such as the UI's Regenerate buttons, skip them.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .semantic_index import DEFAULT_TTL_SECONDS, SemanticIndex
+
+
+class ExactOutlineCache:
+    """Exact-match outline cache keyed by model, mode and prompt hash."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        maxsize: int = 512,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        self.cache_dir = cache_dir or (Path("artifacts") / "brainstorm_cache")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Entries are (outline, stored_at wall-clock time)
+        self._memory: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, educational_mode: bool, prompt: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = f"{model}\n{int(educational_mode)}\n{prompt_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, outline: Dict[str, Any], stored_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (outline, stored_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the unexpired cached outline for ``key``, if any."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                stored_at = path.stat().st_mtime
+                if self._expired(stored_at):
+                    return None
+                outline = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                return None
+            self._remember(key, outline, stored_at)
+            entry = (outline, stored_at)
+        outline, stored_at = entry
+        if self._expired(stored_at):
+            return None
+        return copy.deepcopy(outline)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def put(self, key: str, outline: Dict[str, Any]) -> None:
+        """Store an outline in memory and on disk."""
+        outline = copy.deepcopy(outline)
+        self._remember(key, outline, time.time())
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            tmp_path.write_text(json.dumps(outline), encoding="utf-8")
+            tmp_path.replace(self.cache_dir / f"{key}.json")
+        except Exception:
+            pass
+
+
+class SemanticOutlineCache:
+    """In-process cache of outlines keyed by brief embedding, model and mode."""
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_entries: int = 256,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        self._index = SemanticIndex(threshold, max_entries, ttl=ttl)
+
+    def lookup(
+        self, user_input: str, model: str, educational_mode: bool
+    ) -> Optional[Dict]:
+        """Return a copy of the closest stored outline above the threshold."""
+        outline = self._index.lookup((model, educational_mode), user_input)
+        return copy.deepcopy(outline) if outline is not None else None
+
+    def store(
+        self,
+        user_input: str,
+        model: str,
+        educational_mode: bool,
+        outline: Dict[str, Any],
+    ) -> None:
+        """Remember a successfully parsed outline for this brief."""
+        self._index.add((model, educational_mode), user_input, copy.deepcopy(outline))
+
+    def clear(self) -> None:
+        self._index.clear()
+
+
+# Global singleton instances
+_exact_cache: Optional[ExactOutlineCache] = None
+_outline_cache: Optional[SemanticOutlineCache] = None
+
+
+def get_exact_outline_cache() -> ExactOutlineCache:
+    """Get the process-wide exact-match outline cache."""
+    global _exact_cache
+    if _exact_cache is None:
+        _exact_cache = ExactOutlineCache()
+    return _exact_cache
+
+
+def get_outline_cache() -> SemanticOutlineCache:
+    """Get the process-wide outline cache."""
+    global _outline_cache
+    if _outline_cache is None:
+        _outline_cache = SemanticOutlineCache()
+    return _outline_cache
@@ -27,6 +27,15 @@ logger = logging.getLogger(__name__)
 class PresentationConfig:
     """Configuration for presentation generation."""
 
+    __slots__ = (
+        "logo_path",
+        "footer_text",
+        "show_page_numbers",
+        "font_name",
+        "title_font_size",
+        "body_font_size",
+    )
+
     def __init__(
         self,
         logo_path: Optional[str] = None,
@@ -0,0 +1,124 @@
+"""Embedding-similarity index shared by the response caches.
+
+The brainstorm outline cache and the content/QA prompt cache both reuse a
+stored response when a new request is a near-paraphrase of an earlier one.
+Entries are grouped by a namespace holding the parts that must match exactly
+(agent, mode, ...) and compared within it by cosine similarity, using the same
+sentence-embedding model as local corpus search.
+
+When the embedding dependencies or the model files are unavailable the index
+is disabled and every lookup misses; a text that fails to embed is likewise a
+miss. Either way callers fall through to the model, preserving offline-first
+behavior.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency path
+    np = None
+
+from .local_corpus_search import LocalCorpusSearch
+
+# How long cached model responses stay valid, so a stale answer is not
+# replayed forever
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class SemanticIndex:
+    """Namespaced (embedding, value) store matched by cosine similarity."""
+
+    def __init__(
+        self,
+        threshold: float,
+        max_entries: int,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: Dict[Hashable, List[Tuple[Any, Any, float]]] = {}
+        self._lock = threading.Lock()
+        self._embed_model = None
+        self._available: Optional[bool] = None
+
+    def _load_model(self) -> bool:
+        if self._available is not None:
+            return self._available
+        if np is None:
+            self._available = False
+            return False
+
+        try:
+            # Share the corpus search model so it is only loaded once. The
+            # caches sit on the generation path, so they never download it:
+            # if it is not on disk yet, every lookup misses.
+            if LocalCorpusSearch._shared_embed_model is None:
+                from sentence_transformers import SentenceTransformer
+
+                LocalCorpusSearch._shared_embed_model = SentenceTransformer(
+                    "all-MiniLM-L6-v2", local_files_only=True
+                )
+            self._embed_model = LocalCorpusSearch._shared_embed_model
+            self._available = True
+        except Exception:
+            self._embed_model = None
+            self._available = False
+        return self._available
+
+    def _embed(self, text: str):
+        if not self._load_model():
+            return None
+        try:
+            embedding = self._embed_model.encode(
+                [text.strip()], normalize_embeddings=True
+            )
+            return np.array(embedding[0], dtype=np.float32)
+        except Exception:
+            return None
+
+    def lookup(self, namespace: Hashable, text: str) -> Optional[Any]:
+        """Return the closest stored value in ``namespace`` above threshold."""
+        with self._lock:
+            entries = list(self._entries.get(namespace, []))
+        if entries and self.ttl is not None:
+            cutoff = time.monotonic() - self.ttl
+            entries = [entry for entry in entries if entry[2] >= cutoff]
+        if not entries:
+            return None
+
+        query_vec = self._embed(text)
+        if query_vec is None:
+            return None
+
+        best_score = 0.0
+        best_value: Optional[Any] = None
+        for vector, value, _ in entries:
+            score = float(np.dot(vector, query_vec))
+            if score > best_score:
+                best_score, best_value = score, value
+
+        if best_value is None or best_score < self.threshold:
+            return None
+        return best_value
+
+    def add(self, namespace: Hashable, text: str, value: Any) -> None:
+        """Index ``value`` under ``namespace`` by the embedding of ``text``."""
+        vector = self._embed(text)
+        if vector is None:
+            return
+
+        with self._lock:
+            entries = self._entries.setdefault(namespace, [])
+            entries.append((vector, value, time.monotonic()))
+            if len(entries) > self.max_entries:
+                del entries[: len(entries) - self.max_entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -5,7 +5,8 @@ This package contains shared utility functions used across the application.
 
 from __future__ import annotations
 
+from .async_helpers import run_sync
 from .json_repair import parse_json_with_repair
 from .presentation_helpers import get_section_boundaries
 
-__all__ = ["parse_json_with_repair", "get_section_boundaries"]
+__all__ = ["parse_json_with_repair", "get_section_boundaries", "run_sync"]
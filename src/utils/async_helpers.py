@@ -0,0 +1,36 @@
+"""Async utility functions.
+
+This module lets synchronous pipeline nodes drive async code (for example
+concurrent model calls) regardless of whether the caller already runs an
+event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` directly when no event loop is running in this
+    thread; otherwise runs it on a short-lived worker thread, since
+    ``asyncio.run`` cannot be nested inside a running loop.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -9,6 +9,11 @@ from __future__ import annotations
 import json
 from typing import Union
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency path
+    orjson = None
+
 
 def parse_json_with_repair(raw: str) -> Union[dict, list, str]:
     """Parse JSON from AI response with automatic repair logic.
@@ -34,8 +39,11 @@ def parse_json_with_repair(raw: str) -> Union[dict, list, str]:
         >>> result = parse_json_with_repair('Not JSON at all')
         >>> assert result == 'Not JSON at all'
     """
-    # Attempt direct parsing
+    # Attempt direct parsing (clean JSON is the common case). orjson errors
+    # subclass json.JSONDecodeError, so the repair passes below still run.
     try:
+        if orjson is not None:
+            return orjson.loads(raw)
         return json.loads(raw)
     except json.JSONDecodeError:
         pass
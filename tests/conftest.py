@@ -1,5 +1,6 @@
 """Common pytest fixtures for the PPTX agent tests."""
 
+import numpy as np
 import pytest
 
 
@@ -69,3 +70,37 @@ def sample_corpus(tmp_path, monkeypatch):
     file.write_text(content, encoding="utf-8")
     monkeypatch.setenv("MODE", "offline")
     return corpus_dir
+
+
+class FakeEmbedModel:
+    """Embeds text as a normalized bag of known words."""
+
+    vocab = [
+        "zero",
+        "trust",
+        "security",
+        "solar",
+        "energy",
+        "benefits",
+        "photosynthesis",
+        "plants",
+    ]
+
+    def encode(self, texts, normalize_embeddings=True):
+        rows = []
+        for text in texts:
+            words = text.lower().replace("|", " ").split()
+            vec = np.array([float(words.count(w)) for w in self.vocab])
+            norm = np.linalg.norm(vec)
+            rows.append(vec / norm if norm else vec)
+        return rows
+
+
+@pytest.fixture
+def fake_embed_model(monkeypatch):
+    """Install a deterministic embedding model for the semantic caches."""
+    from src.tools.local_corpus_search import LocalCorpusSearch
+
+    model = FakeEmbedModel()
+    monkeypatch.setattr(LocalCorpusSearch, "_shared_embed_model", model)
+    return model
@@ -0,0 +1,27 @@
+"""Unit tests for the educational preview helpers."""
+
+from src.app_educational_helpers import _content_preview_html
+from src.schemas import SlideContent
+
+
+def test_content_preview_html_escapes_model_text():
+    slide = SlideContent(
+        title="Intro <script>",
+        bullets=["a & b", "line one\nline two"],
+        engagement_hook="Why <b>now</b>?",
+        citations=["[1]"],
+    )
+
+    html = _content_preview_html([slide])
+
+    assert "<summary>📄 Slide 1: Intro &lt;script&gt;</summary>" in html
+    assert "<li>a &amp; b</li><li>line one<br>line two</li>" in html
+    assert "Why &lt;b&gt;now&lt;/b&gt;?" in html
+    assert "📚 Citations: [1]" in html
+
+
+def test_content_preview_html_captions_empty_slides():
+    html = _content_preview_html([SlideContent(title="Blank")])
+
+    assert "<details" not in html
+    assert "📄 Slide 1: Blank (empty)" in html
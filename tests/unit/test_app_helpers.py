@@ -24,6 +24,9 @@ class MockUploadedFile:
     def seek(self, position: int):
         pass
 
+    def getvalue(self) -> bytes:
+        return self.content
+
 
 def test_validate_text_file_valid_txt():
     """Test validation of valid .txt file."""
@@ -32,10 +35,11 @@ def test_validate_text_file_valid_txt():
     # Create a valid text file
     mock_file = MockUploadedFile("test.txt", b"Hello, world!")
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, content = validate_text_file(mock_file)
 
     assert is_valid is True
     assert "valid" in message.lower()
+    assert content == "Hello, world!"
 
 
 def test_validate_text_file_valid_md():
@@ -46,7 +50,7 @@ def test_validate_text_file_valid_md():
     content = b"# Title\n\nThis is a markdown file."
     mock_file = MockUploadedFile("test.md", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is True
 
@@ -59,7 +63,7 @@ def test_validate_text_file_valid_csv():
     content = b"col1,col2,col3\nval1,val2,val3"
     mock_file = MockUploadedFile("test.csv", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is True
 
@@ -72,7 +76,7 @@ def test_validate_text_file_valid_json():
     content = b'{"key": "value", "number": 123}'
     mock_file = MockUploadedFile("test.json", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is True
 
@@ -85,7 +89,7 @@ def test_validate_text_file_rejects_binary():
     content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
     mock_file = MockUploadedFile("test.txt", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is False
     assert "binary" in message.lower() or "not a text file" in message.lower()
@@ -99,7 +103,7 @@ def test_validate_text_file_rejects_py():
     content = b"print('Hello, world!')"
     mock_file = MockUploadedFile("test.py", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is False
     assert "not allowed" in message.lower()
@@ -113,7 +117,7 @@ def test_validate_text_file_size_limit():
     large_content = b"x" * (11 * 1024 * 1024)
     mock_file = MockUploadedFile("large.txt", large_content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is False
     assert "too large" in message.lower() or "10mb" in message.lower()
@@ -127,7 +131,7 @@ def test_validate_text_file_within_limit():
     content = b"x" * (9 * 1024 * 1024)
     mock_file = MockUploadedFile("medium.txt", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is True
 
@@ -140,7 +144,7 @@ def test_validate_text_file_invalid_utf8():
     content = b"\xff\xfe\xfd"
     mock_file = MockUploadedFile("invalid.txt", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is False
 
@@ -155,7 +159,7 @@ def test_validate_text_file_allows_extension(extension):
     content = b"Test content"
     mock_file = MockUploadedFile(f"test{extension}", content)
 
-    is_valid, message = validate_text_file(mock_file)
+    is_valid, message, _ = validate_text_file(mock_file)
 
     assert is_valid is True, f"Extension {extension} should be allowed"
 
@@ -164,12 +168,128 @@ def test_validate_text_file_none():
     """Test that None file is handled gracefully."""
     from src.app import validate_text_file
 
-    is_valid, message = validate_text_file(None)
+    is_valid, message, _ = validate_text_file(None)
 
     assert is_valid is False
     assert "no file" in message.lower() or "none" in message.lower()
 
 
+def test_validate_text_file_multibyte_char_past_1kb():
+    """Test that a multi-byte UTF-8 character straddling 1KB is valid text."""
+    from src.app import validate_text_file
+
+    content = b"x" * 1023 + "é".encode("utf-8")
+    mock_file = MockUploadedFile("accent.txt", content)
+
+    is_valid, _, _ = validate_text_file(mock_file)
+
+    assert is_valid is True
+
+
+def test_run_remaining_async_skips_completed_phases(monkeypatch):
+    """Test that only missing phases run and design/QA both complete."""
+    import src.app as app
+    from src.schemas import PresentationOutline, QAReport, SlideContent
+    from src.state import PipelineState
+
+    calls = []
+
+    def fake_agent(name):
+        def run(state):
+            calls.append(name)
+            if name == "design":
+                state.pptx_path = "deck.pptx"
+            elif name == "qa":
+                state.qa_report = QAReport(
+                    content_score=4, design_score=4, coherence_score=4, feedback="ok"
+                )
+            return state
+
+        return run
+
+    monkeypatch.setattr(app, "_get_agent", fake_agent)
+    state = PipelineState(user_input="Solar energy")
+    state.outline = PresentationOutline(
+        topic="Solar", audience="Students", sections=["Intro"]
+    )
+    state.research_completed = True
+    state.content = [SlideContent(title="Intro", bullets=["a"])]
+
+    result = app.run_sync(app._run_remaining_async(state))
+
+    assert sorted(calls) == ["design", "qa"]
+    assert result.pptx_path == "deck.pptx"
+    assert result.qa_report.feedback == "ok"
+
+
+def test_resolve_artifact_path_rejects_paths_outside_artifacts(monkeypatch, tmp_path):
+    """Test that history downloads are limited to existing files in artifacts/."""
+    import src.app as app
+
+    monkeypatch.setattr(app, "_artifacts_root", lambda: tmp_path / "artifacts")
+    deck = tmp_path / "artifacts" / "deck.pptx"
+    deck.parent.mkdir()
+    deck.write_bytes(b"pptx")
+    outside = tmp_path / "outside.pptx"
+    outside.write_bytes(b"pptx")
+
+    assert app._resolve_artifact_path(str(deck)) == deck.resolve()
+    assert app._resolve_artifact_path(str(outside)) is None
+    assert app._resolve_artifact_path(str(deck.parent / "missing.pptx")) is None
+
+
+def test_existing_files_lists_each_directory_once(tmp_path):
+    """Test that existing files are found across directories."""
+    from src.app import _existing_files
+
+    (tmp_path / "a").mkdir()
+    present = tmp_path / "a" / "slide_01.png"
+    present.write_bytes(b"png")
+    other = tmp_path / "slide_02.png"
+    other.write_bytes(b"png")
+    paths = [
+        str(present),
+        str(tmp_path / "a" / "slide_03.png"),
+        str(other),
+        str(tmp_path / "missing" / "slide_04.png"),
+    ]
+
+    assert _existing_files(paths) == {str(present), str(other)}
+
+
+def test_run_pipeline_with_status_returns_pipeline_state(monkeypatch):
+    """Test that the worker-thread pipeline runner relays phases and the result."""
+    import contextlib
+
+    import src.app as app
+    from src.state import PipelineState
+
+    labels = []
+
+    class FakeStatus:
+        def update(self, label, state=None):
+            labels.append(label)
+
+    monkeypatch.setattr(
+        app.st, "status", lambda *a, **k: contextlib.nullcontext(FakeStatus())
+    )
+
+    def fake_pipeline(user_input, on_phase, educational_mode=False):
+        for phase in ("outline", "content"):
+            on_phase(phase)
+        return PipelineState(user_input=user_input, educational_mode=educational_mode)
+
+    state = app._run_pipeline_with_status(fake_pipeline, "Topic", educational_mode=True)
+
+    assert state.user_input == "Topic"
+    assert state.educational_mode is True
+    assert labels == [
+        "Brainstorming outline...",
+        "Writing slide content...",
+        "Pipeline finished",
+    ]
+
+
 class TestPipelineStateHelpers:
     """Test the enhanced run wrappers for PipelineState."""
 
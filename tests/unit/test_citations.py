@@ -21,9 +21,10 @@ def test_citation_deduplication_and_order():
         published_at="2020-01-01",
         confidence=1.0,
     )
-    cm.register_evidence([ev1, ev2])
+    assert cm.register_evidence([ev1, ev2]) == ["[1]", "[2]"]
     # Second registration should not duplicate
-    cm.register_evidence([ev1])
+    assert cm.register_evidence([ev1]) == ["[1]"]
+    assert cm.get_citation_marker(ev2) == "[2]"
     refs = cm.build_references_slide()
     assert len(refs) == 2
     assert refs[0].startswith("[1]")
@@ -65,3 +65,18 @@ def test_pipeline_pauses_and_resumes(monkeypatch, tmp_path):
     assert resumed_state.approval_status == "approved"
     assert resumed_state.current_phase == "completed"
     assert resumed_state.qa_report is not None
+
+
+def test_pipeline_reports_each_phase(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "checkpoints.db"))
+    monkeypatch.setenv("CHECKPOINT_BACKEND", "sqlite")
+    monkeypatch.setattr(
+        bg,
+        "PHASE_PLAN",
+        [(name, lambda state: state) for name in ("outline", "research", "qa")],
+    )
+
+    seen = []
+    bg.run_pipeline("test topic", on_phase=seen.append)
+
+    assert seen == ["outline", "research", "qa"]
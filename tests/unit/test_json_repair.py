@@ -1,6 +1,10 @@
 """Test JSON repair utility."""
 
-from src.utils import parse_json_with_repair
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import json_repair, parse_json_with_repair
 
 
 def test_json_repair_returns_raw_on_failure():
@@ -31,3 +35,41 @@ def test_json_repair_handles_valid_json():
     assert isinstance(result, dict)
     assert result["test"] is True
     assert result["count"] == 100
+
+
+def test_json_repair_handles_fenced_json():
+    # Test that markdown code fences around model output are stripped
+    fenced = '```json\n{"topic": "Solar", "sections": ["A", "B"]}\n```'
+
+    result = parse_json_with_repair(fenced)
+    assert result == {"topic": "Solar", "sections": ["A", "B"]}
+
+
+def test_json_repair_uses_orjson_when_installed(monkeypatch):
+    # Test that clean JSON goes through orjson when it is available
+    orjson = pytest.importorskip("orjson")
+    calls = []
+
+    def spy_loads(raw):
+        calls.append(raw)
+        return orjson.loads(raw)
+
+    monkeypatch.setattr(json_repair, "orjson", SimpleNamespace(loads=spy_loads))
+
+    assert parse_json_with_repair('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert calls == ['{"a": [1, 2]}']
+
+    # orjson decode errors must still fall through to the repair passes
+    assert parse_json_with_repair('Result: {"a": 1} done') == {"a": 1}
+
+
+def test_json_repair_falls_back_to_stdlib_without_orjson(monkeypatch):
+    # Test that parsing still works when orjson is not installed
+    monkeypatch.setattr(json_repair, "orjson", None)
+
+    assert parse_json_with_repair('{"test": true, "count": 100}') == {
+        "test": True,
+        "count": 100,
+    }
+    assert parse_json_with_repair("Result: [1, 2, 3] done") == [1, 2, 3]
+    assert parse_json_with_repair("not json") == "not json"
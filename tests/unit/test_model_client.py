@@ -0,0 +1,70 @@
+"""Unit tests for the unified model client wire format."""
+
+from src.models.ai_config import ModelConfig
+from src.models.client import ModelMessage, UnifiedModelClient
+
+
+def _client(provider: str, model: str) -> UnifiedModelClient:
+    return UnifiedModelClient(
+        ModelConfig(provider=provider, model=model, temperature=0.2, max_tokens=64)
+    )
+
+
+def test_system_message_marked_cacheable_for_anthropic_on_openrouter():
+    client = _client("openrouter", "anthropic/claude-3.5-sonnet")
+    payload = client._serialize_message(
+        client.config.model, ModelMessage(role="system", content="static prefix")
+    )
+
+    assert payload["role"] == "system"
+    assert payload["content"][0]["text"] == "static prefix"
+    assert payload["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_plain_messages_elsewhere():
+    client = _client("ollama", "gpt-oss:20b-cloud")
+    system = ModelMessage(role="system", content="static prefix")
+    user = ModelMessage(role="user", content="brief")
+
+    assert client._serialize_message(client.config.model, system) == {
+        "role": "system",
+        "content": "static prefix",
+    }
+    assert client._serialize_message(client.config.model, user) == {
+        "role": "user",
+        "content": "brief",
+    }
+
+
+def test_achat_uses_shared_async_client():
+    import asyncio
+
+    import httpx
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "async reply"}}]}
+        )
+
+    async def run():
+        client = UnifiedModelClient(
+            ModelConfig(
+                provider="ollama",
+                model="gpt-oss:20b-cloud",
+                temperature=0.2,
+                max_tokens=64,
+                base_url="http://ollama.test/v1",
+            )
+        )
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            messages = [ModelMessage(role="user", content="brief")]
+            return await asyncio.gather(
+                client.achat(messages, http_client=http),
+                client.achat(messages, http_client=http),
+            )
+
+    assert asyncio.run(run()) == ["async reply", "async reply"]
+    assert seen == ["/v1/chat/completions", "/v1/chat/completions"]
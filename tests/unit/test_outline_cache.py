@@ -0,0 +1,145 @@
+"""Unit tests for the brainstorm outline caches."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from types import SimpleNamespace
+
+from src.agents import brainstorm
+from src.state import PipelineState
+from src.tools import outline_cache, semantic_index
+from src.tools.local_corpus_search import LocalCorpusSearch
+from src.tools.outline_cache import ExactOutlineCache, SemanticOutlineCache
+
+
+def _outline(topic: str) -> dict:
+    return {"topic": topic, "audience": "IT teams", "sections": ["A", "B", "C"]}
+
+
+def test_lookup_hits_similar_brief_for_same_model_and_mode(fake_embed_model):
+    cache = SemanticOutlineCache(threshold=0.9)
+
+    cache.store("zero trust security", "model-a", False, _outline("Zero Trust"))
+
+    hit = cache.lookup("Zero Trust Security", "model-a", False)
+    assert hit == _outline("Zero Trust")
+    assert cache.lookup("zero trust security", "model-a", True) is None
+    assert cache.lookup("zero trust security", "model-b", False) is None
+    assert cache.lookup("photosynthesis plants", "model-a", False) is None
+
+
+def test_lookup_returns_independent_copy(fake_embed_model):
+    cache = SemanticOutlineCache()
+    cache.store("photosynthesis plants", "model-a", True, _outline("Photosynthesis"))
+
+    first = cache.lookup("photosynthesis plants", "model-a", True)
+    first["sections"].append("Mutated")
+
+    assert cache.lookup("photosynthesis plants", "model-a", True)["sections"] == [
+        "A",
+        "B",
+        "C",
+    ]
+
+
+def test_exact_cache_key_depends_on_model_mode_and_prompt():
+    key = ExactOutlineCache.make_key("model-a", False, "prompt")
+
+    assert key == ExactOutlineCache.make_key("model-a", False, "prompt")
+    assert key != ExactOutlineCache.make_key("model-b", False, "prompt")
+    assert key != ExactOutlineCache.make_key("model-a", True, "prompt")
+    assert key != ExactOutlineCache.make_key("model-a", False, "prompt!")
+
+
+def test_exact_cache_persists_across_instances(tmp_path):
+    key = ExactOutlineCache.make_key("model-a", False, "prompt")
+    ExactOutlineCache(cache_dir=tmp_path).put(key, _outline("Persisted"))
+
+    fresh = ExactOutlineCache(cache_dir=tmp_path)
+    assert fresh.get(key) == _outline("Persisted")
+    assert fresh.get("missing") is None
+
+
+def test_exact_cache_entries_expire_after_ttl(tmp_path, monkeypatch):
+    key = ExactOutlineCache.make_key("model-a", False, "prompt")
+    cache = ExactOutlineCache(cache_dir=tmp_path, ttl=60)
+    cache.put(key, _outline("Fresh"))
+    assert cache.get(key) == _outline("Fresh")
+
+    now = time.time()
+    monkeypatch.setattr(outline_cache.time, "time", lambda: now + 120)
+    assert cache.get(key) is None
+    assert ExactOutlineCache(cache_dir=tmp_path, ttl=60).get(key) is None
+
+
+def test_semantic_entries_expire_after_ttl(fake_embed_model, monkeypatch):
+    cache = SemanticOutlineCache(ttl=60)
+    cache.store("zero trust security", "model-a", False, _outline("Zero Trust"))
+    assert cache.lookup("zero trust security", "model-a", False) is not None
+
+    now = time.monotonic()
+    monkeypatch.setattr(semantic_index.time, "monotonic", lambda: now + 120)
+    assert cache.lookup("zero trust security", "model-a", False) is None
+
+
+def test_run_brainstorm_without_cache_calls_model_again(tmp_path, monkeypatch):
+    class FakeAI:
+        calls = 0
+
+        def get_model_info(self, agent):
+            return {"model": "fake"}
+
+        def generate(self, prompt, agent, system_message=None):
+            FakeAI.calls += 1
+            return SimpleNamespace(content=json.dumps(_outline(f"Run {self.calls}")))
+
+    monkeypatch.setattr(brainstorm, "get_ai_interface", FakeAI)
+    monkeypatch.setattr(
+        brainstorm,
+        "get_exact_outline_cache",
+        lambda: ExactOutlineCache(cache_dir=tmp_path),
+    )
+    semantic = SemanticOutlineCache()
+    monkeypatch.setattr(brainstorm, "get_outline_cache", lambda: semantic)
+
+    first = brainstorm.run_brainstorm(PipelineState(user_input="zero trust"))
+    again = brainstorm.run_brainstorm(PipelineState(user_input="zero trust"))
+    assert FakeAI.calls == 1
+    assert again.outline.topic == first.outline.topic
+
+    fresh = brainstorm.run_brainstorm(
+        PipelineState(user_input="zero trust"), use_cache=False
+    )
+    assert FakeAI.calls == 2
+    assert fresh.outline.topic != first.outline.topic
+
+
+def test_lookup_misses_when_embedding_fails(fake_embed_model, monkeypatch):
+    cache = SemanticOutlineCache()
+    cache.store("zero trust security", "model-a", False, _outline("Zero Trust"))
+
+    def broken_encode(texts, normalize_embeddings=True):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(fake_embed_model, "encode", broken_encode)
+    assert cache.lookup("zero trust security", "model-a", False) is None
+
+
+def test_missing_embedding_model_disables_the_index(monkeypatch):
+    def not_downloaded(name, local_files_only=False):
+        assert local_files_only, "the cache must never download the model"
+        raise OSError("model files not found")
+
+    monkeypatch.setattr(LocalCorpusSearch, "_shared_embed_model", None)
+    monkeypatch.setitem(
+        sys.modules,
+        "sentence_transformers",
+        SimpleNamespace(SentenceTransformer=not_downloaded),
+    )
+    cache = SemanticOutlineCache()
+    cache.store("zero trust security", "model-a", False, _outline("Zero Trust"))
+
+    assert cache.lookup("zero trust security", "model-a", False) is None
+    assert LocalCorpusSearch._shared_embed_model is None
@@ -39,10 +39,12 @@ def test_pedagogical_auditor_design_low_engagement_and_formative():
 
 def test_append_unique_skips_empty_and_duplicates():
     items = []
-    _append_unique(items, "x")
-    _append_unique(items, "x")
-    _append_unique(items, "")
+    items_set = set()
+    _append_unique(items, items_set, "x")
+    _append_unique(items, items_set, "x")
+    _append_unique(items, items_set, "")
     assert items == ["x"]
+    assert items_set == {"x"}
 
 
 def test_pedagogical_auditor_complete_inputs_adds_no_flags():
@@ -86,3 +88,24 @@ def test_pedagogical_auditor_outline_missing_and_design_empty_noop():
     state = run_pedagogical_auditor(state, phase="outline")
     state = run_pedagogical_auditor(state, phase="design")
     assert isinstance(state.audit_flags, list)
+
+
+def test_pedagogical_feature_counts_refresh_when_content_changes():
+    state = PipelineState(user_input="topic")
+    state.content = [SlideContent(title="s1", bullets=["b1"], engagement_hook="h1")]
+
+    counts = state.pedagogical_feature_counts()
+    assert (counts.hooks, counts.formative, counts.total) == (1, 0, 1)
+    assert state.pedagogical_feature_counts() is counts
+
+    state.content.append(SlideContent(title="s2", bullets=["b2"], formative_check="f2"))
+    counts = state.pedagogical_feature_counts()
+    assert (counts.hooks, counts.formative, counts.total) == (1, 1, 2)
+
+    # Replacing a slide in place (e.g. a regenerated slide) is picked up too
+    state.content[0] = SlideContent(title="s1", bullets=["b1"], bloom_level="apply")
+    counts = state.pedagogical_feature_counts()
+    assert (counts.hooks, counts.bloom, counts.total) == (0, 1, 2)
+
+    state.content = []
+    assert state.pedagogical_feature_counts().total == 0
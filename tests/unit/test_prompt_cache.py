@@ -0,0 +1,128 @@
+"""Unit tests for the content/QA prompt response cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+
+from src.agents import content
+from src.models import prompt_cache
+from src.models.prompt_cache import PromptCache
+from src.schemas import PresentationOutline
+from src.state import PipelineState
+
+
+def test_exact_tier_persists_across_instances(tmp_path):
+    db_path = tmp_path / "prompt_cache.sqlite"
+    key = PromptCache.make_key("content", "model-a", "prompt")
+
+    PromptCache(db_path=db_path).put(key, '{"title": "Cached"}')
+
+    fresh = PromptCache(db_path=db_path)
+    assert fresh.get(key) == '{"title": "Cached"}'
+    assert fresh.get(PromptCache.make_key("content", "model-b", "prompt")) is None
+
+
+def test_semantic_tier_matches_within_namespace(fake_embed_model, tmp_path):
+    cache = PromptCache(db_path=tmp_path / "cache.sqlite")
+    namespace = ("content", False, None)
+
+    cache.put("k", "response", namespace=namespace, slots="Solar energy | benefits")
+
+    assert cache.lookup(namespace, "solar energy | Benefits") == "response"
+    assert cache.lookup(("content", True, "apply"), "solar energy | benefits") is None
+    assert cache.lookup(namespace, "photosynthesis | plants") is None
+
+
+def test_exact_tier_entries_expire_after_ttl(tmp_path, monkeypatch):
+    db_path = tmp_path / "cache.sqlite"
+    key = PromptCache.make_key("content", "model-a", "prompt")
+    cache = PromptCache(db_path=db_path, ttl=60)
+    cache.put(key, "response")
+    assert cache.get(key) == "response"
+
+    now = time.time()
+    monkeypatch.setattr(prompt_cache.time, "time", lambda: now + 120)
+    assert cache.get(key) is None
+    assert PromptCache(db_path=db_path, ttl=60).get(key) is None
+
+
+def test_run_content_cache_bypass_and_research_scoping(
+    fake_embed_model, tmp_path, monkeypatch
+):
+    calls = []
+
+    async def fake_generate_all(ai, prompts):
+        calls.append(len(prompts))
+        return [
+            json.dumps({"title": f"Call {len(calls)}", "bullets": ["b"]})
+            for _ in prompts
+        ]
+
+    fake_ai = SimpleNamespace(get_model_info=lambda agent: {"model": "fake"})
+    cache = PromptCache(db_path=tmp_path / "cache.sqlite")
+    monkeypatch.setattr(content, "get_ai_interface", lambda: fake_ai)
+    monkeypatch.setattr(content, "get_prompt_cache", lambda: cache)
+    monkeypatch.setattr(content, "_generate_all", fake_generate_all)
+
+    def make_state(citations):
+        state = PipelineState(user_input="solar")
+        state.outline = PresentationOutline(
+            topic="Solar", audience="Planners", sections=["Benefits"]
+        )
+        state.citations = citations
+        return state
+
+    content.run_content(make_state(["[1]"]))
+    assert content.run_content(make_state(["[1]"])).content[0].title == "Call 1"
+    assert len(calls) == 1
+
+    # Different research must not reuse slides citing the old sources
+    assert content.run_content(make_state(["[1]", "[2]"])).content[0].title == "Call 2"
+
+    fresh = content.run_content(make_state(["[1]"]), use_cache=False)
+    assert fresh.content[0].title == "Call 3"
+    assert len(calls) == 3
+
+
+def test_run_content_semantic_tier_is_scoped_to_model_and_level(
+    fake_embed_model, tmp_path, monkeypatch
+):
+    calls = []
+
+    async def fake_generate_all(ai, prompts):
+        calls.append(len(prompts))
+        return [
+            json.dumps({"title": f"Call {len(calls)}", "bullets": ["b"]})
+            for _ in prompts
+        ]
+
+    models = {"content": "model-a"}
+    fake_ai = SimpleNamespace(get_model_info=lambda agent: {"model": models[agent]})
+    cache = PromptCache(db_path=tmp_path / "cache.sqlite")
+    monkeypatch.setattr(content, "get_ai_interface", lambda: fake_ai)
+    monkeypatch.setattr(content, "get_prompt_cache", lambda: cache)
+    monkeypatch.setattr(content, "_generate_all", fake_generate_all)
+
+    def make_state(audience, level):
+        state = PipelineState(user_input="solar", educational_mode=True)
+        state.outline = PresentationOutline(
+            topic="Solar energy",
+            audience=audience,
+            sections=["Benefits"],
+            educational_level=level,
+        )
+        return state
+
+    content.run_content(make_state("Students", "High School"))
+    # A near-duplicate brief reuses the slide through the semantic tier
+    hit = content.run_content(make_state("Learners", "High School"))
+    assert hit.content[0].title == "Call 1"
+
+    # ...but not when written for another level or by another model
+    other_level = content.run_content(make_state("Learners", "University"))
+    assert other_level.content[0].title == "Call 2"
+    models["content"] = "model-b"
+    other_model = content.run_content(make_state("Learners", "High School"))
+    assert other_model.content[0].title == "Call 3"
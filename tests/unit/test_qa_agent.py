@@ -0,0 +1,81 @@
+"""Unit tests for QA agent short-circuits."""
+
+import json
+from types import SimpleNamespace
+
+from src.agents import qa
+from src.models.prompt_cache import PromptCache
+from src.schemas import SlideContent
+from src.state import PipelineState
+
+
+def _fallback_slide(section: str, topic: str) -> SlideContent:
+    return SlideContent(
+        title=f"{section}: {topic}",
+        bullets=[
+            f"Define {section.lower()} in the context of {topic}.",
+            f"Explain key drivers and practical implications of {section.lower()}.",
+            f"Summarize actionable takeaways related to {topic}.",
+        ],
+    )
+
+
+def test_fallback_only_deck_skips_model_call(monkeypatch):
+    def _no_ai():
+        raise AssertionError("QA must not call the model for fallback-only decks")
+
+    monkeypatch.setattr(qa, "get_ai_interface", _no_ai)
+    state = PipelineState(user_input="topic")
+    state.content = [
+        _fallback_slide("Intro", "Solar"),
+        _fallback_slide("Costs", "Solar"),
+    ]
+
+    state = qa.run_qa(state)
+
+    assert state.qa_report.content_score == 2.5
+    assert "deterministic fallback" in state.qa_report.feedback
+
+
+def test_generated_slides_are_not_treated_as_fallback():
+    slide = SlideContent(
+        title="Economic Benefits of Solar Energy",
+        bullets=["Reduces electricity costs", "Creates local jobs"],
+    )
+    assert not qa._looks_like_fallback(slide)
+
+
+def test_review_is_not_reused_for_a_similar_deck(
+    fake_embed_model, tmp_path, monkeypatch
+):
+    calls = []
+
+    def fake_generate(prompt, agent):
+        calls.append(prompt)
+        report = {
+            "content_score": 4.0,
+            "design_score": 4.0,
+            "coherence_score": 4.0,
+            "feedback": f"Review {len(calls)}",
+        }
+        return SimpleNamespace(content=json.dumps(report))
+
+    fake_ai = SimpleNamespace(
+        get_model_info=lambda agent: {"model": "fake"}, generate=fake_generate
+    )
+    monkeypatch.setattr(qa, "get_ai_interface", lambda: fake_ai)
+    cache = PromptCache(db_path=tmp_path / "cache.sqlite")
+    monkeypatch.setattr(qa, "get_prompt_cache", lambda: cache)
+
+    def make_state(title):
+        state = PipelineState(user_input="solar")
+        state.content = [SlideContent(title=title, bullets=["Point"])]
+        return state
+
+    first = qa.run_qa(make_state("Solar energy benefits")).qa_report
+    repeat = qa.run_qa(make_state("Solar energy benefits")).qa_report
+    # Same words, different deck: only the exact prompt may reuse a review
+    similar = qa.run_qa(make_state("Benefits: solar energy")).qa_report
+
+    assert first.feedback == repeat.feedback == "Review 1"
+    assert similar.feedback == "Review 2"